@@ -0,0 +1,274 @@
+import os
+import json
+import threading
+import pygame
+from collections import OrderedDict
+from settings import ASSET_CACHE_MB
+from engine.surfaces import note_alloc
+from engine.trace import tracer
+from engine.memory import track
+
+# Carpeta con las variantes ya escaladas (ver tools/bake_assets.py)
+BAKED_DIR = "assets/baked"
+BAKED_MANIFEST = os.path.join(BAKED_DIR, "manifest.json")
+
+class AssetCache:
+    """Caché de imágenes compartida por todas las escenas.
+
+    Devuelve Surfaces ya convertidas y escaladas, indexadas por
+    (ruta, tamaño, alpha, volteo). Cuando el total supera el límite de
+    memoria se descartan primero las menos usadas (LRU).
+    Si existe una variante horneada para la clave se carga esa en lugar
+    de decodificar y escalar la imagen original.
+    Las Surfaces devueltas son compartidas: no se deben modificar.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.images = OrderedDict()
+        self.requested = set()   # todas las claves pedidas (para hornear)
+        self.use_baked = True
+        self.baked = None        # manifiesto, se lee la primera vez
+        # Imágenes decodificadas en segundo plano (engine/prefetch.py) que
+        # todavía esperan su convert() en el hilo principal
+        self.staged = {}
+        # Claves que se copiaron a otro lado (atlas) y no hace falta adelantar
+        self.claimed = set()
+        self.sounds = {}
+        self._lock = threading.Lock()
+        # Aparte de _lock, para que decodificar un sonido en el hilo de
+        # prefetch no frene a image() en el hilo principal
+        self._sound_lock = threading.Lock()
+
+    def image(self, path, size=None, alpha=True, flip_x=False):
+        key = image_key(path, size, alpha, flip_x)
+        self.requested.add(key)
+        surf = self.images.get(key)
+        if surf is not None:
+            self.images.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        with self._lock:
+            staged = self.staged.pop(key, None)
+        if staged is not None:
+            surf = convert_staged(key, *staged)
+        else:
+            self.misses += 1
+            surf = self._load(key)
+        self._store(key, surf)
+        return surf
+
+    def stage(self, key, surf, ready):
+        """Guarda una imagen decodificada fuera del hilo principal.
+        ready indica si ya está escalada y volteada."""
+        with self._lock:
+            if key not in self.images and key not in self.claimed:
+                self.staged[key] = (surf, ready)
+
+    def take(self, key):
+        """Como image(), pero la imagen no queda en la caché: es para quien
+        copia los píxeles a otro lado (engine/atlas.py)."""
+        self.requested.add(key)
+        with self._lock:
+            staged = self.staged.pop(key, None)
+        surf = self.images.pop(key, None)
+        if surf is not None:
+            self.bytes -= surface_bytes(surf)
+            return surf
+        note_alloc()
+        if staged is not None:
+            return track(convert_staged(key, *staged), "imagen", key[0])
+        self.misses += 1
+        return track(self._load(key), "imagen", key[0])
+
+    def release(self, keys):
+        """Descarta (y deja de adelantar) imágenes que ya no se van a pedir."""
+        with self._lock:
+            for key in keys:
+                self.claimed.add(key)
+                self.staged.pop(key, None)
+        for key in keys:
+            surf = self.images.pop(key, None)
+            if surf is not None:
+                self.bytes -= surface_bytes(surf)
+
+    def finish_staged(self, limit=2):
+        """Convierte (en el hilo principal) hasta limit imágenes adelantadas."""
+        for _ in range(limit):
+            with self._lock:
+                if not self.staged:
+                    return
+                key, (surf, ready) = self.staged.popitem()
+            if key not in self.images:
+                self._store(key, convert_staged(key, surf, ready))
+
+    def sound(self, path):
+        """Sonido compartido. Lo llaman el hilo principal y el de prefetch:
+        si los dos lo piden a la vez, uno espera al otro y lo reusa."""
+        snd = self.sounds.get(path)
+        if snd is not None:
+            return snd
+        with self._sound_lock:
+            snd = self.sounds.get(path)
+            if snd is None:
+                with tracer.span("sound.load", "asset", path=path) as args:
+                    snd = self.sounds[path] = track(pygame.mixer.Sound(path), "sonido", path)
+                    if tracer.enabled:
+                        args["bytes"] = os.path.getsize(path)
+        return snd
+
+    def _load(self, key):
+        baked = self.baked_file(key)
+        if baked:
+            return convert_image(read_image(baked), key[2])
+        return load_source(*key)
+
+    def baked_file(self, key):
+        """Ruta de la variante horneada para la clave, o None si no hay
+        una vigente (el original cambió desde que se horneó)."""
+        if not self.use_baked:
+            return None
+        if self.baked is None:
+            self.baked = read_manifest()
+        entry = self.baked.get(manifest_key(key))
+        if not entry:
+            return None
+        try:
+            st = os.stat(key[0])
+        except OSError:
+            # Se distribuyó solo la variante horneada, sin el original
+            st = None
+        if st and (st.st_size != entry["source_size"] or int(st.st_mtime) != entry["source_mtime"]):
+            return None
+        path = os.path.join(BAKED_DIR, entry["file"])
+        return path if os.path.exists(path) else None
+
+    def _store(self, key, surf):
+        note_alloc()
+        track(surf, "imagen", key[0])
+        old = self.images.pop(key, None)
+        if old is not None:
+            self.bytes -= surface_bytes(old)
+        self.images[key] = surf
+        self.bytes += surface_bytes(surf)
+        # Descartar las menos usadas, pero nunca la que se acaba de pedir
+        while self.bytes > self.max_bytes and len(self.images) > 1:
+            _, old = self.images.popitem(last=False)
+            self.bytes -= surface_bytes(old)
+
+    def clear(self):
+        self.images.clear()
+        with self._lock:
+            self.staged.clear()
+            self.claimed.clear()
+        self.bytes = 0
+        self.baked = None
+
+
+def load_source(path, size, alpha, flip_x):
+    """Decodifica, convierte y escala la imagen original."""
+    img = convert_image(read_image(path), alpha, path)
+    if size and img.get_size() != size:
+        img = scale_image(img, size, path)
+    if flip_x:
+        img = flip_image(img, path)
+    return img
+
+
+def decode_image(key, baked=None):
+    """Parte de la carga que no necesita la pantalla: decodificar y, si el
+    formato lo permite, escalar y voltear. Se puede llamar desde otro hilo.
+    Devuelve (surface, ready)."""
+    if baked:
+        return read_image(baked), True
+    path, size, alpha, flip_x = key
+    img = read_image(path)
+    if img.get_bitsize() not in (24, 32):
+        return img, False   # smoothscale solo acepta 24/32 bits
+    if size and img.get_size() != size:
+        img = scale_image(img, size, path)
+    if flip_x:
+        img = flip_image(img, path)
+    return img, True
+
+
+def convert_staged(key, surf, ready):
+    """Paso final en el hilo principal: convert()/convert_alpha()."""
+    path, size, alpha, flip_x = key
+    img = convert_image(surf, alpha, path)
+    if not ready:
+        if size and img.get_size() != size:
+            img = scale_image(img, size, path)
+        if flip_x:
+            img = flip_image(img, path)
+    return img
+
+
+# Cada paso de la carga es un span en la traza (engine/trace.py), con la
+# ruta y los bytes: del archivo al leerlo, de la Surface resultante después
+
+def read_image(path):
+    with tracer.span("image.load", "asset", path=path) as args:
+        img = pygame.image.load(path)
+        if tracer.enabled:
+            args["bytes"] = os.path.getsize(path)
+    return img
+
+
+def convert_image(img, alpha, path=None):
+    with tracer.span("convert_alpha" if alpha else "convert", "asset", path=path) as args:
+        img = img.convert_alpha() if alpha else img.convert()
+        args["bytes"] = surface_bytes(img)
+    return img
+
+
+def scale_image(img, size, path=None):
+    with tracer.span("smoothscale", "asset", path=path) as args:
+        img = pygame.transform.smoothscale(img, size)
+        args["bytes"] = surface_bytes(img)
+    return img
+
+
+def flip_image(img, path=None):
+    with tracer.span("flip", "asset", path=path) as args:
+        img = pygame.transform.flip(img, True, False)
+        args["bytes"] = surface_bytes(img)
+    return img
+
+
+def image_key(path, size=None, alpha=True, flip_x=False):
+    """Clave de la caché, para declarar lo que una escena va a pedir."""
+    return (path, tuple(size) if size else None, alpha, flip_x)
+
+
+def manifest_key(key):
+    path, size, alpha, flip_x = key
+    size_txt = f"{size[0]}x{size[1]}" if size else "orig"
+    return f"{path}|{size_txt}|{'a' if alpha else 'o'}|{'f' if flip_x else 'n'}"
+
+
+def read_manifest(section="entries"):
+    try:
+        with open(BAKED_MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f).get(section, {})
+    except (OSError, ValueError):
+        return {}
+
+
+def surface_bytes(surf):
+    return surf.get_pitch() * surf.get_height()
+
+
+# Caché única para todo el proceso
+cache = AssetCache(ASSET_CACHE_MB * 1024 * 1024)
+
+def load_image(path, size=None, alpha=True, flip_x=False):
+    """Atajo para cache.image(): imagen convertida, escalada y compartida."""
+    return cache.image(path, size, alpha, flip_x)
+
+def load_sound(path):
+    """Sonido compartido: cada archivo se decodifica una sola vez."""
+    return cache.sound(path)
@@ -0,0 +1,151 @@
+import os
+import pygame
+from engine.assets import cache, image_key, read_manifest, BAKED_DIR
+from engine.trace import tracer
+from engine.memory import track
+
+IMAGES_DIR = "assets/images"
+
+# Poses de Daniela (nombre -> archivo en assets/images)
+DANIELA_POSES = {
+    "parada_frente": "parada_frente_pr.png",
+    "parada_costado": "parada_costado_pr.png",
+    "caminando": "caminando_pr.png",
+    "corriendo": "corriendo_pr.png",
+    "asustada": "asustada_pr.png",
+    "agachada": "agachada_pr.png",
+    "sentada": "sentada_pr.png",
+    "sentada_pijama": "sentada_pijama_pr.png",
+    "parada_pijama": "parada_pijama_pr.png",
+    "corriendo_pijama": "corriendo_pijama_pr.png",
+    "dormida": "dormida_pr.png",
+    "silla_escola": "silla_escola_pr.png",
+}
+
+# Qué poses usa el juego en cada tamaño de pantalla
+DANIELA_SIZES = {
+    (120, 240): ["parada_frente", "parada_costado", "caminando", "corriendo", "asustada", "agachada",
+                 "sentada", "sentada_pijama", "parada_pijama", "corriendo_pijama", "dormida"],
+    (140, 280): ["parada_frente", "parada_costado", "caminando", "corriendo", "asustada"],
+    (160, 300): ["silla_escola"],
+}
+
+ATLAS_MAX_WIDTH = 2048
+
+
+class SpriteAtlas:
+    """Todas las poses de un personaje a un tamaño, en una sola Surface.
+
+    Cada pose se guarda normal y espejada; rects indexa
+    (pose, espejada) -> Rect y frames las subsurfaces correspondientes,
+    que comparten los píxeles del atlas sin copiarlos. Si
+    tools/bake_assets.py horneó el atlas, se carga ese único archivo.
+    """
+    def __init__(self, name, poses, size):
+        self.name = name
+        self.size = tuple(size)
+        self.poses = {pose: os.path.join(IMAGES_DIR, poses[pose]) for pose in sorted(poses)}
+        slots = [(pose, mirrored) for pose in self.poses for mirrored in (False, True)]
+        rects, self.extent = shelf_pack([self.size] * len(slots), ATLAS_MAX_WIDTH)
+        self.rects = dict(zip(slots, rects))
+        self.surface = None
+        self.frames = {}
+
+    @property
+    def label(self):
+        return f"{self.name}|{self.size[0]}x{self.size[1]}"
+
+    def source_keys(self):
+        return [image_key(path, self.size) for path in self.poses.values()]
+
+    def baked_key(self):
+        """Clave del atlas horneado, o None si no hay uno vigente."""
+        if not cache.use_baked:
+            return None
+        entry = read_manifest("atlases").get(self.label)
+        if not entry or entry.get("poses") != list(self.poses):
+            return None
+        for path, (size, mtime) in entry["sources"].items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue   # se distribuyó solo el atlas, sin los originales
+            if st.st_size != size or int(st.st_mtime) != mtime:
+                return None
+        path = os.path.join(BAKED_DIR, entry["file"])
+        return image_key(path) if os.path.exists(path) else None
+
+    def preload_keys(self):
+        """Lo que hay que adelantar para armar este atlas."""
+        baked = self.baked_key()
+        return [baked] if baked else self.source_keys()
+
+    def build(self):
+        with tracer.span("atlas", "asset", label=self.label):
+            return self._build()
+
+    def _build(self):
+        baked = self.baked_key()
+        missing = []
+        if baked:
+            self.surface = cache.take(baked)
+        else:
+            self.surface = track(pygame.Surface(self.extent, pygame.SRCALPHA).convert_alpha(), "atlas", self.label)
+            self.surface.fill((0, 0, 0, 0))
+            for pose, path in self.poses.items():
+                try:
+                    img = cache.take(image_key(path, self.size))
+                except Exception:
+                    print(f"Atlas {self.label}: no se pudo cargar {path}")
+                    missing.append(pose)
+                    continue
+                # BLEND_RGBA_MAX sobre transparente copia los píxeles tal cual
+                self.surface.blit(img, self.rects[(pose, False)], special_flags=pygame.BLEND_RGBA_MAX)
+                self.surface.blit(pygame.transform.flip(img, True, False), self.rects[(pose, True)],
+                                  special_flags=pygame.BLEND_RGBA_MAX)
+        self.frames = {slot: self.surface.subsurface(rect)
+                       for slot, rect in self.rects.items() if slot[0] not in missing}
+        # Lo que se adelantó para la otra forma de armarlo ya no hace falta
+        cache.release(self.source_keys() + ([baked] if baked else []))
+        return self
+
+
+def shelf_pack(sizes, max_width):
+    """Acomoda rectángulos en estantes de izquierda a derecha.
+    Devuelve (rects en el orden de sizes, (ancho, alto) total)."""
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+    rects = [None] * len(sizes)
+    x = y = shelf_h = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > max_width:
+            y += shelf_h
+            x = shelf_h = 0
+        rects[i] = pygame.Rect(x, y, w, h)
+        x += w
+        shelf_h = max(shelf_h, h)
+        width = max(width, x)
+    return rects, (width, y + shelf_h)
+
+
+# Atlas ya armados, por (nombre, tamaño)
+atlases = {}
+
+def get_atlas(name, poses, size):
+    key = (name, tuple(size))
+    atlas = atlases.get(key)
+    if atlas is None:
+        atlas = atlases[key] = SpriteAtlas(name, poses, size).build()
+    return atlas
+
+
+def daniela_atlas(size):
+    """Atlas con las poses de Daniela que el juego usa a este tamaño."""
+    names = DANIELA_SIZES.get(tuple(size), list(DANIELA_POSES))
+    return get_atlas("daniela", {pose: DANIELA_POSES[pose] for pose in names}, size)
+
+
+def atlas_keys(size):
+    """Claves para Scene.preload de una escena que usa daniela_atlas(size)."""
+    names = DANIELA_SIZES.get(tuple(size), list(DANIELA_POSES))
+    return SpriteAtlas("daniela", {pose: DANIELA_POSES[pose] for pose in names}, size).preload_keys()
@@ -1,17 +1,149 @@
+import os
 import pygame
+from settings import AUDIO_CHANNELS, AMBIENCE_FADE_MS
+from engine.assets import load_sound
+from engine.trace import tracer
 
-class Audio:
-    def __init__(self):
-        self.sfx_click = pygame.mixer.Sound("assets/audio/ui_click.wav")
-        self.ambience = pygame.mixer.Sound("assets/audio/ambience_loop.wav")
-        self.ambience.set_volume(0.15)
+CLICK = "assets/audio/ui_click.wav"
+NARRATOR_BEEP = "assets/audio/narrator_beep.wav"
+AMBIENCE = "assets/audio/ambience_loop.wav"
+FREE_CHANNELS = 4
+
+class AudioManager:
+    """Audio único del proceso, con canales reservados por categoría.
+
+    Los sonidos salen de la caché compartida (se decodifican una sola
+    vez). Los primeros canales del mezclador se reservan según
+    AUDIO_CHANNELS (ui, voice, sfx), así un efecto nunca le quita el
+    canal a una voz; el ambiente no usa canales (ver más abajo). Si todos los canales de la categoría están
+    ocupados, el sonido nuevo le roba el canal al de menor prioridad (y,
+    entre iguales, al más viejo) siempre que su prioridad no sea menor;
+    si no, no suena.
+
+    El ambiente no es un Sound: va por pygame.mixer.music, que lo lee
+    del disco de a pedazos mientras suena (ogg, mp3, flac o wav), así que
+    la memoria no depende de lo largo que sea. Hay un solo ambiente a la
+    vez; al pedir otro, el que suena se apaga con un fundido y update()
+    arranca el nuevo, también con fundido, cuando el anterior terminó.
+    """
+    def __init__(self, layout=AUDIO_CHANNELS):
+        self.layout = layout
+        self.pools = None     # categoría -> [índices de canal], al iniciar el mezclador
+        self.channels = []
+        self.owners = {}      # índice de canal -> (prioridad, orden)
+        self.ambience = None  # ruta del ambiente que suena
+        self.pending = None   # (ruta, volumen, fundido) que espera a que termine el fundido
+        self.stolen = 0
+        self._order = 0
+
+    def _setup(self):
+        if self.pools is not None:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+        total = sum(self.layout.values())
+        # Sound.play() sin canal nunca elige uno de los reservados; le
+        # quedan FREE_CHANNELS para lo que no pase por acá
+        if pygame.mixer.get_num_channels() < total + FREE_CHANNELS:
+            pygame.mixer.set_num_channels(total + FREE_CHANNELS)
+        pygame.mixer.set_reserved(total)
+        self.channels = [pygame.mixer.Channel(i) for i in range(total)]
+        self.pools, start = {}, 0
+        for category, count in self.layout.items():
+            self.pools[category] = list(range(start, start + count))
+            start += count
+        return True
+
+    def play(self, path, category="sfx", priority=0, loops=0, volume=1.0):
+        """Reproduce path en un canal de category. Devuelve el Channel,
+        o None si no hay mezclador o no le alcanzó la prioridad."""
+        if not self._setup():
+            return None
+        pool = self.pools[category]
+        index = next((i for i in pool if not self.channels[i].get_busy()), None)
+        if index is None:
+            index = min(pool, key=lambda i: self.owners.get(i, (0, 0)))
+            if self.owners.get(index, (0, 0))[0] > priority:
+                return None
+            self.stolen += 1
+        channel = self.channels[index]
+        channel.play(load_sound(path), loops=loops)
+        channel.set_volume(volume)
+        self.owners[index] = (priority, self._order)
+        self._order += 1
+        return channel
+
+    def play_click(self):
+        self.play(CLICK, "ui", priority=1)
 
+    def play_voice(self, path=NARRATOR_BEEP):
+        self.play(path, "voice", priority=1)
+
+    def play_ambience(self, path=AMBIENCE, volume=0.15, fade_ms=AMBIENCE_FADE_MS):
+        """Deja sonando path en loop; si ya sonaba, no lo reinicia, y si
+        sonaba otro ambiente lo reemplaza con un fundido."""
+        if not self._setup():
+            return
+        music = pygame.mixer.music
+        if self.ambience == path and self.pending is None and music.get_busy():
+            music.set_volume(volume)
+            return
+        self.pending = (path, volume, fade_ms)
+        if music.get_busy():
+            if self.ambience is not None:
+                music.fadeout(fade_ms)
+                self.ambience = None
+            return
+        self.update()
+
+    def update(self):
+        """Arranca el ambiente pendiente cuando terminó el fundido del
+        anterior. El SceneManager lo llama en cada paso."""
+        if self.pending is None or pygame.mixer.music.get_busy():
+            return
+        path, volume, fade_ms = self.pending
+        self.pending = None
+        try:
+            with tracer.span("music.load", "asset", path=path) as args:
+                pygame.mixer.music.load(path)
+                if tracer.enabled:
+                    args["bytes"] = os.path.getsize(path)
+        except pygame.error as e:
+            print(f"No se pudo abrir el ambiente {path}: {e}")
+            return
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops=-1, fade_ms=fade_ms)
+        self.ambience = path
+
+    def stop_ambience(self, fade_ms=AMBIENCE_FADE_MS):
+        if not self._setup():
+            return
+        self.pending = None
+        if self.ambience is not None:
+            pygame.mixer.music.fadeout(fade_ms)
+        self.ambience = None
+
+    def stop_all(self):
+        if not self._setup():
+            return
+        for channel in self.channels:
+            channel.stop()
+        pygame.mixer.music.stop()
+        self.ambience = None
+        self.pending = None
+
+
+# Audio único para todo el proceso
+audio_manager = AudioManager()
+
+class Audio:
+    """Fachada que reciben las escenas: todo pasa por audio_manager, así
+    que crear un Audio() no carga nada ni abre canales."""
     def play_click(self):
-        self.sfx_click.play()
+        audio_manager.play_click()
 
-    def play_ambience(self):
-        # reproducir en loop
-        self.ambience.play(loops=-1)
+    def play_ambience(self, path=AMBIENCE):
+        audio_manager.play_ambience(path)
 
     def stop_ambience(self):
-        self.ambience.stop()
\ No newline at end of file
+        audio_manager.stop_ambience()
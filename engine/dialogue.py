@@ -0,0 +1,125 @@
+import pygame
+from settings import WIDTH, HEIGHT
+from engine.fonts import render_text
+from engine.surfaces import note_alloc
+from engine.memory import track
+
+DEFAULT_SPEAKER_COLORS = {
+    "Daniela": (0, 200, 255),   # Cyan para Daniela
+}
+
+class DialogueBox:
+    """Cuadro de diálogo con el nombre del hablante arriba.
+
+    El corte en líneas y páginas se calcula una sola vez por texto y el
+    cuadro (fondo, borde y líneas) queda pre-renderizado en una Surface;
+    solo se vuelve a armar cuando cambia el hablante o el texto.
+    translucent=True dibuja el fondo semitransparente (como en el jardín);
+    si no, el fondo es negro opaco.
+
+    Si el texto no entra en max_lines líneas, se muestra por páginas: el
+    cuadro recuerda en qué página va y turn_page() pasa a la siguiente
+    (las escenas lo hacen con next_page() al hacer clic).
+    """
+    def __init__(self, font, speaker_font, speaker_colors=None, default_color=(255, 255, 255),
+                 translucent=False, rect=None, max_lines=3):
+        self.font = font
+        self.speaker_font = speaker_font
+        self.speaker_colors = dict(DEFAULT_SPEAKER_COLORS)
+        self.speaker_colors.update(speaker_colors or {})
+        self.default_color = default_color
+        self.translucent = translucent
+        self.rect = pygame.Rect(rect or (50, HEIGHT - 100 - 20, WIDTH - 100, 100))
+        self.max_lines = max_lines
+        self.line_height = 30
+        self.padding = 20
+
+        flags = pygame.SRCALPHA if translucent else 0
+        self.box = track(pygame.Surface(self.rect.size, flags), "dialogo")
+        self.key = None
+        self.pages = []
+        self.page = 0
+        self.speaker_surf = None
+
+    def wrap(self, text):
+        """Corta el texto en líneas que entran en el cuadro."""
+        max_width = self.rect.width - 2 * self.padding
+        lines = []
+        current = ""
+        for word in text.split(' '):
+            test = f"{current} {word}" if current else word
+            if not current or self.font.size(test)[0] <= max_width:
+                current = test
+            else:
+                lines.append(current)
+                current = word
+        if current:
+            lines.append(current)
+        return lines
+
+    def turn_page(self):
+        """Pasa a la página siguiente del texto que se está mostrando.
+        Devuelve False si ya estaba en la última (y vuelve a la primera,
+        por si el mismo texto aparece otra vez)."""
+        if self.key is None:
+            return False
+        if self.page + 1 < len(self.pages):
+            self._render_page(self.page + 1)
+            return True
+        self.key = None
+        return False
+
+    def _rebuild(self, speaker, text):
+        self.key = (speaker, text)
+        lines = self.wrap(text)
+        self.pages = [lines[i:i + self.max_lines] for i in range(0, len(lines), self.max_lines)] or [[]]
+
+        if speaker:
+            color = self.speaker_colors.get(speaker, self.default_color)
+            self.speaker_surf = render_text(self.speaker_font, speaker, True, color)
+        else:
+            self.speaker_surf = None
+        self._render_page(0)
+
+    def _render_page(self, page):
+        self.page = page
+        self.box.fill((0, 0, 0, 200) if self.translucent else (0, 0, 0))
+        pygame.draw.rect(self.box, (255, 255, 255), self.box.get_rect(), 2)
+        for i, line in enumerate(self.pages[page]):
+            # Las líneas son únicas por diálogo: se renderizan directo, sin caché
+            note_alloc()
+            text_surf = self.font.render(line, True, (255, 255, 255))
+            self.box.blit(text_surf, (self.padding, 15 + i * self.line_height))
+
+    def dirty_region(self, speaker, text, can_skip=False):
+        """Región que ocupa el cuadro (con el nombre encima) y su firma."""
+        rect = self.rect.inflate(0, 30).move(0, -15)
+        return rect, ((speaker, text, can_skip, self.page) if text else None)
+
+    def draw(self, surf, speaker, text, can_skip=False):
+        if not text:
+            return
+        if (speaker, text) != self.key:
+            self._rebuild(speaker, text)
+
+        x, y = self.rect.topleft
+        surf.blit(self.box, (x, y))
+        if self.speaker_surf:
+            surf.blit(self.speaker_surf, (x + 10, y - 30))
+
+        # Indicador de "clic para continuar" si se puede saltar
+        if can_skip:
+            skip_text = render_text(self.font, "Clic para continuar", True, (200, 200, 200))
+            surf.blit(skip_text, (self.rect.right - skip_text.get_width() - 20, self.rect.bottom - 30))
+
+
+def next_page(scene):
+    """Clic sobre un diálogo que se puede saltar: si el texto sigue en
+    otra página, la muestra y devuelve True (el clic ya se usó). Si no,
+    devuelve False y la escena pasa a su diálogo siguiente."""
+    if not scene.dialogue_box.turn_page():
+        return False
+    # La página nueva cuenta como un diálogo nuevo para saltar y ocultarse
+    scene.dialogue_timer = 0
+    scene.can_skip = False
+    return True
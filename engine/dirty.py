@@ -0,0 +1,56 @@
+import pygame
+
+class DirtyTracker:
+    """Recuerda qué había en cada región el cuadro anterior.
+
+    La escena llama a track(nombre, rect, firma) por cada cosa que puede
+    cambiar; si el rect o la firma difieren de lo último visto, se marcan
+    sucias la región vieja y la nueva. collect() devuelve lo acumulado.
+    """
+    def __init__(self):
+        self.regions = {}   # nombre -> (rect, firma)
+        self.pending = []
+
+    def track(self, name, rect, signature=None):
+        rect = pygame.Rect(rect) if rect else None
+        prev = self.regions.get(name)
+        if prev is not None and prev == (rect, signature):
+            return
+        if prev is not None and prev[0]:
+            self.pending.append(prev[0])
+        if rect:
+            self.pending.append(rect)
+        self.regions[name] = (rect, signature)
+
+    def mark(self, rect):
+        self.pending.append(pygame.Rect(rect))
+
+    def collect(self):
+        rects, self.pending = self.pending, []
+        return rects
+
+
+def merge_rects(rects, bounds, max_rects=6, full_ratio=0.6):
+    """Une rects que se tocan y los recorta a bounds.
+
+    Si quedan demasiados se devuelve su unión; si cubren casi toda la
+    pantalla, None (conviene redibujar todo)."""
+    merged = []
+    for r in rects:
+        r = r.clip(bounds)
+        if not r.w or not r.h:
+            continue
+        i = 0
+        while i < len(merged):
+            if r.colliderect(merged[i]):
+                r = r.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(r)
+    if len(merged) > max_rects:
+        merged = [merged[0].unionall(merged[1:])]
+    area = sum(r.w * r.h for r in merged)
+    if area > full_ratio * bounds.w * bounds.h:
+        return None
+    return merged
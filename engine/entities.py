@@ -0,0 +1,109 @@
+import numpy as np
+import pygame
+
+# Banderas comunes; cada escena puede definir las suyas desde 1 << 4
+ACTIVE = 1 << 0
+HOVERED = 1 << 1
+
+
+class EntityStore:
+    """Entidades guardadas por columnas en arrays de NumPy.
+
+    pos (N x 2), radius (N) y flags (N, un campo de bits) viven en arrays
+    contiguos, así la cercanía y el hover se calculan para todas las
+    entidades de una vez en lugar de con un bucle de Python. Lo que no
+    participa de esos cálculos (diálogos, índices de imagen) queda en
+    data, una lista de dicts. Las entidades se identifican por índice y
+    no se borran: se les apaga ACTIVE.
+    """
+    def __init__(self, capacity=16):
+        self.count = 0
+        self._pos = np.zeros((capacity, 2))
+        self._radius = np.zeros(capacity)
+        self._flags = np.zeros(capacity, dtype=np.uint8)
+        self.data = []
+
+    def __len__(self):
+        return self.count
+
+    # Vistas sobre las entidades que existen (sin la capacidad sobrante)
+    @property
+    def pos(self):
+        return self._pos[:self.count]
+
+    @property
+    def radius(self):
+        return self._radius[:self.count]
+
+    @property
+    def flags(self):
+        return self._flags[:self.count]
+
+    def add(self, pos, radius, flags=ACTIVE, **data):
+        if self.count == len(self._flags):
+            self._grow(max(16, self.count * 2))
+        i = self.count
+        self._pos[i] = (pos[0], pos[1])
+        self._radius[i] = radius
+        self._flags[i] = flags
+        self.data.append(data)
+        self.count += 1
+        return i
+
+    def _grow(self, capacity):
+        pos = np.zeros((capacity, 2))
+        radius = np.zeros(capacity)
+        flags = np.zeros(capacity, dtype=np.uint8)
+        pos[:self.count] = self.pos
+        radius[:self.count] = self.radius
+        flags[:self.count] = self.flags
+        self._pos, self._radius, self._flags = pos, radius, flags
+
+    def position(self, i):
+        return pygame.Vector2(float(self._pos[i, 0]), float(self._pos[i, 1]))
+
+    def has(self, i, flag):
+        return bool(self._flags[i] & flag)
+
+    def set(self, i, flag, on=True):
+        if on:
+            self._flags[i] |= flag
+        else:
+            self._flags[i] &= ~np.uint8(flag)
+
+    def mask(self, require=ACTIVE, exclude=0):
+        """Array booleano: tiene todas las banderas require y ninguna de exclude."""
+        flags = self.flags
+        return ((flags & require) == require) & ((flags & exclude) == 0)
+
+    def indices(self, require=ACTIVE, exclude=0):
+        """Índices (en orden) de las entidades que cumplen las banderas."""
+        return np.flatnonzero(self.mask(require, exclude))
+
+    def count_flag(self, flag):
+        return int(np.count_nonzero(self.flags & flag))
+
+    def dist2(self, point):
+        d = self.pos - (point[0], point[1])
+        return np.einsum("ij,ij->i", d, d)
+
+    def within(self, point, radius=None, require=ACTIVE, exclude=0):
+        """Índices a distancia < radius de point (con radius=None, el radio
+        propio de cada entidad), en orden."""
+        r = self.radius if radius is None else radius
+        return np.flatnonzero((self.dist2(point) < r * r) & self.mask(require, exclude))
+
+    def nearest(self, point, max_radius=None, require=ACTIVE, exclude=0):
+        """Índice de la entidad más cercana que cumple las banderas, o None."""
+        d2 = np.where(self.mask(require, exclude), self.dist2(point), np.inf)
+        if not len(d2):
+            return None
+        i = int(np.argmin(d2))
+        limit = np.inf if max_radius is None else max_radius * max_radius
+        return i if d2[i] < limit else None
+
+    def update_hover(self, point, require=ACTIVE, exclude=0):
+        """Marca HOVERED a las que tienen point dentro de su radio."""
+        hovered = (self.dist2(point) < self.radius * self.radius) & self.mask(require, exclude)
+        self.flags[:] = np.where(hovered, self.flags | HOVERED, self.flags & ~np.uint8(HOVERED))
+        return np.flatnonzero(hovered)
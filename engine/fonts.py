@@ -0,0 +1,123 @@
+import time
+import pygame
+from collections import OrderedDict
+from settings import TEXT_CACHE_SIZE
+from engine.surfaces import note_alloc
+from engine.memory import track
+
+# Fuentes que usan casi todas las escenas; main.py las resuelve al arrancar
+COMMON_FONTS = [
+    ("arial", 20, False, False),
+    ("arial", 22, False, False),
+    ("arial", 24, False, False),
+    ("arial", 24, True, False),
+    ("arial", 28, False, False),
+    ("arial", 32, False, False),
+    ("arial", 32, True, False),
+    ("arial", 36, False, False),
+    ("arial", 36, True, False),
+    ("arial", 42, False, False),
+    ("arial", 48, True, False),
+    (None, 16, False, False),
+    (None, 20, False, False),
+]
+
+class FontManager:
+    """Registro de fuentes del proceso.
+
+    SysFont tiene que buscar los archivos de fuente del sistema, así que
+    cada (familia, tamaño, negrita, cursiva) se resuelve una sola vez y
+    todas las escenas comparten el mismo objeto Font.
+    family=None usa la fuente por defecto de pygame.
+    """
+    def __init__(self):
+        self.fonts = {}
+        self.timings = {}   # clave -> segundos que tardó en resolverse
+
+    def get(self, family, size, bold=False, italic=False):
+        key = (family, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            start = time.perf_counter()
+            if family is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+            self.timings[key] = time.perf_counter() - start
+            self.fonts[key] = font
+        return font
+
+    def preload(self, keys=COMMON_FONTS):
+        for key in keys:
+            self.get(*key)
+
+    def report(self):
+        """Resumen de cuánto costó resolver las fuentes."""
+        if not self.timings:
+            return "Fuentes: ninguna resuelta"
+        total = sum(self.timings.values())
+        slowest = max(self.timings, key=self.timings.get)
+        return (f"Fuentes: {len(self.timings)} resueltas en {total * 1000:.1f} ms "
+                f"(la más lenta: {describe(slowest)}, {self.timings[slowest] * 1000:.1f} ms)")
+
+
+class TextCache:
+    """Caché LRU de textos ya renderizados.
+
+    La clave es (font, texto, antialias, color); la mayoría de los textos
+    de la interfaz se repiten cuadro a cuadro, así que Font.render() solo
+    se llama cuando aparece un texto nuevo. hits/misses sirven para
+    medir qué tan bien funciona. Las Surfaces devueltas son compartidas.
+    """
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, tuple(color))
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        note_alloc()
+        surf = track(font.render(text, antialias, color), "texto")
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def stats(self):
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.surfaces), "hit_ratio": ratio}
+
+
+def describe(key):
+    family, size, bold, italic = key
+    text = f"{family or 'default'} {size}"
+    if bold:
+        text += " negrita"
+    if italic:
+        text += " cursiva"
+    return text
+
+
+# Registro y caché de textos únicos para todo el proceso
+fonts = FontManager()
+text_cache = TextCache(TEXT_CACHE_SIZE)
+
+def get_font(family, size, bold=False, italic=False):
+    """Atajo para fonts.get(): Font compartida, resuelta una sola vez."""
+    return fonts.get(family, size, bold, italic)
+
+
+def render_text(font, text, antialias, color):
+    """Atajo para text_cache.render(): igual que font.render() pero cacheado."""
+    return text_cache.render(font, text, antialias, color)
@@ -0,0 +1,142 @@
+import os
+import sys
+import time
+import logging
+import threading
+import traceback
+from logging.handlers import RotatingFileHandler
+from settings import HITCH_BUDGET_MS, HITCH_LOG
+from engine.profiler import profiler, PHASES
+
+class HitchDetector:
+    """Detecta cuadros lentos y anota qué se estaba ejecutando.
+
+    El GameLoop marca el inicio (begin) y el fin (end_frame) de cada
+    cuadro. Un hilo vigía se despierta cada interval segundos y, si el
+    cuadro en curso ya pasó el presupuesto, toma una muestra de la pila
+    del hilo principal (sys._current_frames) junto con la fase que corre.
+    Al terminar un cuadro lento se escribe en un log rotativo la escena,
+    el tiempo de cada fase (engine/profiler.py) y las muestras.
+
+    Si el hilo principal está dentro de una llamada en C larga que no
+    suelta el GIL, la muestra llega cuando esa llamada vuelve; la pila
+    igual muestra desde dónde se la llamó.
+    """
+    def __init__(self, budget_ms=HITCH_BUDGET_MS, path=HITCH_LOG, interval=0.005,
+                 max_samples=4, depth=12):
+        self.budget = budget_ms / 1000.0
+        self.path = path
+        self.interval = interval
+        self.max_samples = max_samples
+        self.depth = depth
+        self.count = 0
+        self.thread = None
+        self.logger = None
+        self._main = None
+        self._frame = 0
+        self._start = None
+        self._scene = None
+        self._samples = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        """Arranca el hilo vigía y abre el log."""
+        if self.thread is not None:
+            return
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.logger = logging.getLogger("cosy.hitch")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        handler = RotatingFileHandler(self.path, maxBytes=512 * 1024, backupCount=3, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self.logger.addHandler(handler)
+        self._main = threading.main_thread().ident
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._run, name="hitch", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self._stop.set()
+        self.thread.join()
+        self.thread = None
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    def begin(self, scene):
+        if self.thread is None:
+            return
+        with self._lock:
+            self._frame += 1
+            self._samples = []
+            self._scene = scene_name(scene)
+            self._start = time.perf_counter()
+
+    def end_frame(self, scene):
+        if self.thread is None or self._start is None:
+            return
+        elapsed = time.perf_counter() - self._start
+        with self._lock:
+            self._start = None
+            samples = self._samples
+            started_in = self._scene
+        if elapsed < self.budget:
+            return
+        self.count += 1
+        name = scene_name(scene)
+        where = name if name == started_in else f"{started_in} -> {name}"
+        phases = {p: profiler.current.get(p, 0.0) * 1000 for p in PHASES}
+        slowest = max(phases, key=phases.get)
+        lines = [f"Tirón de {elapsed * 1000:.1f} ms en {where} "
+                 f"(fase más lenta: {slowest} {phases[slowest]:.1f} ms)",
+                 "  fases: " + ", ".join(f"{p} {ms:.1f}" for p, ms in phases.items()) + " ms"]
+        if not samples:
+            lines.append("  (sin muestras: el cuadro terminó antes de que mirara el vigía)")
+        previous = None
+        for at, phase, stack in samples:
+            text = [line.rstrip() for line in traceback.format_list(stack)]
+            if text == previous:
+                lines.append(f"  muestra a {at * 1000:.1f} ms: igual a la anterior")
+                continue
+            previous = text
+            lines.append(f"  muestra a {at * 1000:.1f} ms, en {phase}:")
+            lines.extend(text)
+        self.logger.warning("\n".join(lines))
+        print(f"{lines[0]} (ver {self.path})")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                start, frame, taken = self._start, self._frame, len(self._samples)
+            if start is None or taken >= self.max_samples:
+                continue
+            elapsed = time.perf_counter() - start
+            if elapsed < self.budget:
+                continue
+            top = sys._current_frames().get(self._main)
+            if top is None:
+                continue
+            stack = traceback.extract_stack(top, limit=self.depth)
+            phase = running_phase()
+            with self._lock:
+                if self._frame == frame and self._start is not None:
+                    self._samples.append((elapsed, phase, stack))
+
+
+def running_phase():
+    """La fase en curso: la primera que el perfilador todavía no cerró."""
+    done = profiler.current
+    return next((p for p in PHASES if p not in done), "fin del cuadro")
+
+
+def scene_name(scene):
+    return type(scene).__name__ if scene else "-"
+
+
+# Vigía único para todo el proceso (main.py lo arranca)
+hitches = HitchDetector()
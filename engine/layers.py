@@ -0,0 +1,66 @@
+import pygame
+from settings import WIDTH, HEIGHT
+from engine.memory import track
+
+class StaticLayer:
+    """Fondo y props fijos de una escena aplanados en una sola Surface.
+
+    La escena declara los props una vez con add() (en orden de dibujo) y
+    en draw() hace un único blit. La Surface solo se vuelve a componer
+    cuando un prop cambia de imagen, posición o visibilidad.
+    """
+    def __init__(self, size=(WIDTH, HEIGHT), fill=None):
+        self.size = size
+        self.fill = fill
+        self.props = {}      # nombre -> [imagen, posición, visible]
+        self.order = []
+        self.surface = None
+        self.dirty = True
+
+    def add(self, name, image, pos=(0, 0), visible=True, center=False):
+        """pos es la esquina superior izquierda (o el centro si center=True).
+        Una imagen None (no se pudo cargar) simplemente no se dibuja."""
+        if center and image is not None:
+            pos = image.get_rect(center=pos).topleft
+        if name not in self.props:
+            self.order.append(name)
+        self.props[name] = [image, tuple(pos), visible]
+        self.dirty = True
+
+    def set_image(self, name, image):
+        prop = self.props[name]
+        if prop[0] is not image:
+            prop[0] = image
+            self.dirty = True
+
+    def set_pos(self, name, pos):
+        prop = self.props[name]
+        if prop[1] != tuple(pos):
+            prop[1] = tuple(pos)
+            self.dirty = True
+
+    def set_visible(self, name, visible):
+        prop = self.props[name]
+        if prop[2] != visible:
+            prop[2] = visible
+            self.dirty = True
+
+    def rect(self, name):
+        """Rect que ocupa el prop (visible o no), o None si no tiene imagen."""
+        image, pos, _ = self.props[name]
+        return image.get_rect(topleft=pos) if image is not None else None
+
+    def compose(self):
+        if self.surface is None:
+            self.surface = track(pygame.Surface(self.size).convert(), "capa")
+        self.surface.fill(self.fill or (0, 0, 0))
+        for name in self.order:
+            image, pos, visible = self.props[name]
+            if visible and image is not None:
+                self.surface.blit(image, pos)
+        self.dirty = False
+
+    def draw(self, surf, pos=(0, 0)):
+        if self.dirty:
+            self.compose()
+        surf.blit(self.surface, pos)
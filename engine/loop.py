@@ -0,0 +1,104 @@
+import pygame
+from settings import FPS, SIM_HZ, MAX_CATCHUP_STEPS, DIRTY_RECTS
+from engine.profiler import profiler, TOGGLE_KEY
+from engine.hitch import hitches
+
+class GameLoop:
+    """Bucle principal con la lógica a paso fijo.
+
+    Cada cuadro suma el tiempo real a un acumulador y corre tantos
+    manager.update(step) como entren (como mucho max_steps; si el
+    atraso es mayor, se descarta, así un tirón no hace saltar a nadie).
+    Lo que sobra del acumulador queda en manager.alpha, para que las
+    escenas dibujen sus posiciones interpoladas (Scene.lerp).
+
+    Cada fase del cuadro (eventos, update, draw, flip) se mide con
+    engine/profiler.py; F3 muestra u oculta el overlay con los tiempos.
+    Los cuadros que pasan HITCH_BUDGET_MS quedan en el log de
+    engine/hitch.py, si main.py arrancó el vigía.
+    """
+    def __init__(self, manager, sim_hz=SIM_HZ, max_steps=MAX_CATCHUP_STEPS, recorder=None):
+        self.manager = manager
+        self.sim_hz = sim_hz
+        self.step = 1.0 / sim_hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0        # pasos simulados desde el inicio
+        self.dropped = 0.0    # segundos descartados por el tope de pasos
+        self.running = False
+        self.recorder = recorder   # engine/replay.py Recorder, o None
+
+    @property
+    def sim_time(self):
+        """Tiempo de simulación en segundos (avanza de a un paso)."""
+        return self.ticks * self.step
+
+    def advance(self, frame_dt):
+        """Simula los pasos que correspondan a frame_dt y devuelve cuántos."""
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.manager.update(self.step)
+            self.accumulator -= self.step
+            self.ticks += 1
+            steps += 1
+        if self.accumulator >= self.step:
+            # Demasiado atrasado: seguir desde acá en vez de ponerse al día
+            lost = self.accumulator - self.accumulator % self.step
+            self.dropped += lost
+            self.accumulator -= lost
+        self.manager.alpha = self.accumulator / self.step
+        return steps
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+                return
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key == TOGGLE_KEY:
+                # La tecla del perfilador no llega a las escenas
+                if event.type == pygame.KEYDOWN:
+                    profiler.toggle()
+                    self.manager.full_redraw = True
+                continue
+            self.manager.handle_event(event)
+
+    def present(self):
+        rects = self.manager.draw()
+        profiler.lap("draw")
+        panel = profiler.draw(self.manager.screen, self.manager.current())
+        if panel:
+            rects.append(panel)
+        profiler.lap("overlay")
+        if DIRTY_RECTS:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        profiler.lap("flip")
+
+    def run(self, fps=FPS):
+        """Corre hasta que se cierra la ventana. fps limita los cuadros
+        dibujados, no la lógica."""
+        clock = pygame.time.Clock()
+        self.running = True
+        try:
+            while self.running:
+                frame_dt = clock.tick(fps) / 1000.0
+                profiler.begin()
+                hitches.begin(self.manager.current())
+                events = pygame.event.get()
+                if self.recorder:
+                    # Antes de repartirlos: el botón "Salir" cierra el juego desde la escena
+                    self.recorder.record(frame_dt, events)
+                self.handle_events(events)
+                if not self.running:
+                    break
+                profiler.lap("eventos")
+                self.advance(frame_dt)
+                profiler.lap("update")
+                self.present()
+                profiler.end_frame(frame_dt)
+                hitches.end_frame(self.manager.current())
+        finally:
+            if self.recorder:
+                self.recorder.save()
@@ -0,0 +1,156 @@
+import gc
+import weakref
+import threading
+import pygame
+from collections import Counter
+from settings import MEMORY_REPORT, MEMORY_LEAK_LOOPS
+
+class MemoryTracker:
+    """Cuenta la memoria de las Surfaces y Sounds vivos, por escena.
+
+    Los lugares que crean Surfaces o Sounds que duran (caché de imágenes
+    y sonidos, caché de textos, overlays, capas, cuadros de diálogo,
+    paneles, atlas) los registran con track(): se guarda una referencia
+    débil con su tipo, sus bytes y la escena dueña (la que se estaba
+    construyendo o la activa), y la entrada desaparece sola cuando el
+    objeto se libera. Las escenas también se anotan (en un WeakSet) al
+    construirse.
+
+    El SceneManager avisa cada push/pop/replace (after_transition); con
+    MEMORY_REPORT se imprime el total. Cada vez que se vuelve a la
+    primera escena (el título) se corre gc y se toma una foto: si quedan
+    vivas escenas que ya no están en la pila, o si los bytes crecen en
+    MEMORY_LEAK_LOOPS vueltas seguidas, se avisa de una posible fuga.
+    """
+    def __init__(self, report=MEMORY_REPORT, leak_loops=MEMORY_LEAK_LOOPS):
+        self.report = report
+        self.leak_loops = leak_loops
+        self.entries = {}   # id -> (tipo, etiqueta, escena, bytes, weakref)
+        self.scenes = weakref.WeakSet()
+        self.building = None   # escena en construcción
+        self.current = None    # escena activa
+        self.home = None       # clase de la primera escena
+        self.loops = []        # una foto por vuelta a la primera escena
+        self.warnings = []
+        # track() también se llama desde el hilo de prefetch (sonidos)
+        self._lock = threading.Lock()
+
+    def track(self, obj, kind, label=None):
+        """Registra obj (Surface o Sound) y lo devuelve."""
+        key = id(obj)
+        size = sound_bytes(obj) if kind == "sonido" else surface_bytes(obj)
+        owner = self.building or self.current or "-"
+        with self._lock:
+            if key in self.entries:
+                return obj
+            ref = weakref.ref(obj, lambda _, key=key: self.entries.pop(key, None))
+            self.entries[key] = (kind, label, owner, size, ref)
+        return obj
+
+    def scene_created(self, scene):
+        self.scenes.add(scene)
+        self.building = type(scene).__name__
+
+    def totals(self, by="kind"):
+        """{tipo (o escena con by="owner"): [cantidad, bytes]}"""
+        index = 0 if by == "kind" else 2
+        result = {}
+        with self._lock:
+            entries = list(self.entries.values())
+        for entry in entries:
+            total = result.setdefault(entry[index], [0, 0])
+            total[0] += 1
+            total[1] += entry[3]
+        return result
+
+    def live_scenes(self):
+        return Counter(type(s).__name__ for s in list(self.scenes))
+
+    def snapshot(self):
+        kinds = self.totals()
+        return {
+            "bytes": sum(b for _, b in kinds.values()),
+            "count": sum(n for n, _ in kinds.values()),
+            "kinds": kinds,
+            "owners": self.totals("owner"),
+            "scenes": self.live_scenes(),
+        }
+
+    def after_transition(self, action, manager):
+        scene = manager.current()
+        self.building = None
+        self.current = type(scene).__name__ if scene else None
+        if self.report:
+            print(f"Memoria tras {action} {self.current}: {describe(self.snapshot())}")
+        if scene is None:
+            return
+        if self.home is None:
+            self.home = type(scene)
+        elif type(scene) is self.home and action != "pop":
+            self.check_loop(manager)
+
+    def check_loop(self, manager):
+        """Vuelta completa a la primera escena: buscar fugas."""
+        gc.collect()
+        snap = self.snapshot()
+        self.loops.append(snap)
+        n = len(self.loops)
+
+        on_stack = Counter(type(s).__name__ for s in manager.stack)
+        stale = snap["scenes"] - on_stack
+        if stale:
+            self.warn(f"vuelta {n}: siguen vivas escenas que ya no están en la pila: "
+                      + ", ".join(f"{name} x{count}" for name, count in sorted(stale.items())))
+
+        recent = [s["bytes"] for s in self.loops[-(self.leak_loops + 1):]]
+        if len(recent) > self.leak_loops and all(b > a for a, b in zip(recent, recent[1:])):
+            before = self.loops[-(self.leak_loops + 1)]
+            self.warn(f"vuelta {n}: la memoria creció {self.leak_loops} vueltas seguidas "
+                      f"({mb(recent[0])} -> {mb(recent[-1])}; por tipo: "
+                      f"{growth(before['kinds'], snap['kinds'])}; por escena: "
+                      f"{growth(before['owners'], snap['owners'])})")
+        return snap
+
+    def warn(self, message):
+        self.warnings.append(message)
+        print(f"Memoria: posible fuga, {message}")
+
+
+def surface_bytes(surf):
+    # Una subsurface comparte los píxeles de su padre
+    if surf.get_parent() is not None:
+        return 0
+    return surf.get_pitch() * surf.get_height()
+
+
+def sound_bytes(sound):
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    freq, fmt, channels = init
+    return int(sound.get_length() * freq) * channels * (abs(fmt) // 8)
+
+
+def growth(before, after):
+    """Lo que más creció entre dos totals(), como texto."""
+    delta = {k: v[1] - before.get(k, (0, 0))[1] for k, v in after.items()}
+    top = sorted((kv for kv in delta.items() if kv[1] > 0), key=lambda kv: -kv[1])[:4]
+    return ", ".join(f"{k} +{mb(v)}" for k, v in top) or "-"
+
+
+def mb(n):
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+def describe(snap):
+    kinds = ", ".join(f"{k} {n} ({mb(b)})" for k, (n, b) in sorted(snap["kinds"].items()))
+    scenes = ", ".join(f"{name} x{c}" if c > 1 else name for name, c in sorted(snap["scenes"].items()))
+    return f"{mb(snap['bytes'])} en {snap['count']} objetos [{kinds}]; escenas vivas: {scenes or '-'}"
+
+
+# Contador único para todo el proceso
+memory = MemoryTracker()
+
+def track(obj, kind, label=None):
+    """Atajo para memory.track()."""
+    return memory.track(obj, kind, label)
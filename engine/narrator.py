@@ -1,5 +1,8 @@
 import pygame
 from settings import PALETTE
+from engine.audio import audio_manager
+from engine.fonts import render_text
+from engine.surfaces import get_overlay
 import time
 
 class Narrator:
@@ -11,7 +14,6 @@ class Narrator:
         self.queue = []
         self.active = None
         self.timer = 0.0
-        self.beep = pygame.mixer.Sound("assets/audio/narrator_beep.wav")
         self.visible_time = 2.5  # segundos por línea (aprox)
 
     def say(self, text):
@@ -26,21 +28,23 @@ class Narrator:
         if not self.active and self.queue:
             self.active = self.queue.pop(0)
             self.timer = 0.0
-            self.beep.play()
+            audio_manager.play_voice()
         if self.active:
             self.timer += dt
             if self.timer >= self.visible_time:
                 self.active = None
 
+    def dirty_region(self, size):
+        w, h = size
+        return pygame.Rect(0, h - 90, w, 80), self.active
+
     def draw(self, surf):
         if not self.active: return
         margin = 20
         text = self.active
         # caja semi-transparente
         w, h = surf.get_size()
-        box = pygame.Surface((w, 80), pygame.SRCALPHA)
-        box.fill((20, 20, 25, 150))
-        surf.blit(box, (0, h - 90))
+        surf.blit(get_overlay((w, 80), (20, 20, 25, 150)), (0, h - 90))
         # texto
-        rendered = self.font.render(text, True, PALETTE["white"])
+        rendered = render_text(self.font, text, True, PALETTE["white"])
         surf.blit(rendered, (margin, h - 80))
\ No newline at end of file
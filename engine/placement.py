@@ -0,0 +1,98 @@
+import math
+import random
+import pygame
+from engine.spatial import SpatialHash
+
+def poisson_disk(count, radius, bounds, exclude=(), seed=None, rng=None, attempts=30, shrink=0.9):
+    """Reparte count puntos dentro de bounds, a distancia >= radius entre sí.
+
+    Muestreo de Poisson por disco (Bridson): cada punto activo prueba
+    hasta attempts candidatos en el anillo [radius, 2 * radius) y los
+    vecinos se buscan en una grilla de celdas radius / sqrt(2), así el
+    costo es lineal en la cantidad de puntos. exclude es una lista de
+    rects (por ejemplo la UI) donde no puede caer ningún punto.
+
+    Si con ese radio no entran count puntos, se achica el radio (por
+    shrink) y se sigue desde los que ya están: siempre devuelve count
+    puntos, lo más separados que se pueda. rng puede ser cualquier
+    objeto con random() y uniform() (el módulo random, random.Random);
+    si no se pasa, se usa random.Random(seed).
+    """
+    bounds = pygame.Rect(bounds)
+    exclude = [pygame.Rect(r) for r in exclude]
+    if rng is None:
+        rng = random.Random(seed)
+    if count <= 0:
+        return []
+    first = free_point(bounds, exclude, rng)
+    if first is None:
+        raise ValueError(f"poisson_disk: no hay lugar libre en {bounds}")
+
+    def allowed(x, y):
+        if not (bounds.left <= x < bounds.right and bounds.top <= y < bounds.bottom):
+            return False
+        return not any(r.collidepoint(x, y) for r in exclude)
+
+    # Más de un punto por cuadrado de lado radius no entra: empezar desde ahí
+    free = bounds.w * bounds.h - covered_area([r.clip(bounds) for r in exclude])
+    radius = min(radius, math.sqrt(max(free, 1) / count))
+
+    points = [first]
+    while len(points) < count:
+        grid = SpatialHash(radius / math.sqrt(2))
+        for i, p in enumerate(points):
+            grid.insert(i, p)
+        active = list(range(len(points)))
+
+        while active and len(points) < count:
+            k = int(rng.random() * len(active))
+            px, py = points[active[k]]
+            for _ in range(attempts):
+                angle = rng.uniform(0, 2 * math.pi)
+                dist = rng.uniform(radius, 2 * radius)
+                x, y = px + math.cos(angle) * dist, py + math.sin(angle) * dist
+                if allowed(x, y) and not grid.any_within((x, y), radius):
+                    grid.insert(len(points), (x, y))
+                    active.append(len(points))
+                    points.append((x, y))
+                    break
+            else:
+                # Este punto ya no tiene lugar alrededor
+                active[k] = active[-1]
+                active.pop()
+
+        if len(points) < count:
+            radius *= shrink
+    return points
+
+
+def covered_area(rects):
+    """Área de la unión de rects (las partes que se pisan cuentan una vez)."""
+    rects = [r for r in rects if r.w > 0 and r.h > 0]
+    xs = sorted({x for r in rects for x in (r.left, r.right)})
+    area = 0
+    for left, right in zip(xs, xs[1:]):
+        # Franja vertical [left, right): unir los tramos en y que la cubren
+        spans = sorted((r.top, r.bottom) for r in rects if r.left <= left and r.right >= right)
+        covered, top, bottom = 0, None, None
+        for t, b in spans:
+            if bottom is None or t > bottom:
+                if bottom is not None:
+                    covered += bottom - top
+                top, bottom = t, b
+            else:
+                bottom = max(bottom, b)
+        if bottom is not None:
+            covered += bottom - top
+        area += covered * (right - left)
+    return area
+
+
+def free_point(bounds, exclude, rng, tries=1000):
+    """Un punto al azar dentro de bounds y fuera de exclude, o None."""
+    for _ in range(tries):
+        x = rng.uniform(bounds.left, bounds.right)
+        y = rng.uniform(bounds.top, bounds.bottom)
+        if x < bounds.right and y < bounds.bottom and not any(r.collidepoint(x, y) for r in exclude):
+            return (x, y)
+    return None
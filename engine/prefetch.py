@@ -0,0 +1,72 @@
+import queue
+import threading
+from importlib import import_module
+from engine.assets import cache, decode_image
+
+class Prefetcher:
+    """Adelanta en un hilo aparte la carga de las escenas siguientes.
+
+    El hilo decodifica (y escala cuando puede) las imágenes declaradas en
+    Scene.preload y carga los sonidos de Scene.preload_sounds. En el hilo
+    principal solo queda el convert()/convert_alpha() final, que hace
+    AssetCache.finish_staged() unas pocas imágenes por cuadro.
+    """
+    def __init__(self, cache=cache):
+        self.cache = cache
+        self.queue = queue.Queue()
+        self.pending = set()
+        self.thread = None
+
+    def prefetch_successors(self, scene):
+        for name in scene.successors:
+            cls = resolve_scene(name)
+            if cls is None:
+                continue
+            self.request_images(cls.preload)
+            self.request_sounds(cls.preload_sounds)
+
+    def request_images(self, keys):
+        for key in keys:
+            if key in self.cache.images or key in self.cache.staged or key in self.cache.claimed:
+                continue
+            self._put("image", key)
+
+    def request_sounds(self, paths):
+        for path in paths:
+            if path not in self.cache.sounds:
+                self._put("sound", path)
+
+    def _put(self, kind, item):
+        if (kind, item) in self.pending:
+            return
+        self.pending.add((kind, item))
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="prefetch", daemon=True)
+            self.thread.start()
+        self.queue.put((kind, item))
+
+    def _run(self):
+        while True:
+            kind, item = self.queue.get()
+            try:
+                if kind == "image":
+                    if item not in self.cache.images and item not in self.cache.claimed:
+                        surf, ready = decode_image(item, self.cache.baked_file(item))
+                        self.cache.stage(item, surf, ready)
+                else:
+                    self.cache.sound(item)
+            except Exception as e:
+                # La escena lo volverá a intentar (y manejará el error) al construirse
+                print(f"Prefetch: no se pudo cargar {item}: {e}")
+            finally:
+                self.pending.discard((kind, item))
+
+
+def resolve_scene(name):
+    """'scenes.kitchen.KitchenScene' -> clase (importa el módulo)."""
+    module, _, cls = name.rpartition(".")
+    try:
+        return getattr(import_module(module), cls)
+    except (ImportError, AttributeError) as e:
+        print(f"Prefetch: escena desconocida {name}: {e}")
+        return None
@@ -0,0 +1,129 @@
+import time
+import pygame
+from collections import deque
+from settings import FPS
+from engine.fonts import get_font, text_cache
+from engine.surfaces import surfaces
+from engine.trace import tracer
+
+# Fases que mide el GameLoop en cada cuadro, en orden
+PHASES = ("eventos", "update", "draw", "flip")
+TOGGLE_KEY = pygame.K_F3
+REFRESH = 0.1   # segundos entre redibujos del panel
+
+class FrameProfiler:
+    """Tiempos por fase de cada cuadro y overlay de depuración (F3).
+
+    El GameLoop llama a begin() al empezar el cuadro, a lap(fase) al
+    terminar cada fase y a end_frame() al final; se guardan los últimos
+    history cuadros. El overlay muestra el promedio de cada fase, p50 y
+    p99 del cuadro, la escena actual, las Surfaces y los textos creados
+    por cuadro y un gráfico con el tiempo de cada cuadro (la línea marca
+    el presupuesto de 1 / FPS). Sus propios textos no pasan por la caché
+    de textos, para no ensuciar lo que cuenta. Con la traza activa
+    (engine/trace.py) cada fase y cada cuadro quedan también como spans.
+    """
+    def __init__(self, history=240):
+        self.visible = False
+        self.frames = deque(maxlen=history)   # segundos de trabajo por cuadro
+        self.phases = {p: deque(maxlen=history) for p in PHASES}
+        self.dts = deque(maxlen=history)      # dt real entre cuadros
+        self.surface_counts = deque(maxlen=history)
+        self.text_counts = deque(maxlen=history)
+        self.current = {}
+        self._mark = self._frame_start = time.perf_counter()
+        self._misses = text_cache.misses
+        self.panel = None       # se crea la primera vez que se muestra
+        self._refreshed = None
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._refreshed = None
+
+    def begin(self):
+        self.current = {}
+        self._mark = self._frame_start = time.perf_counter()
+
+    def lap(self, phase):
+        """Suma a phase el tiempo desde la marca anterior."""
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + now - self._mark
+        tracer.complete(phase, "frame", self._mark, now)
+        self._mark = now
+
+    def end_frame(self, frame_dt=0.0):
+        total = 0.0
+        for phase in PHASES:
+            value = self.current.get(phase, 0.0)
+            self.phases[phase].append(value)
+            total += value
+        self.frames.append(total)
+        self.dts.append(frame_dt)
+        # manager.draw() ya cerró la cuenta de Surfaces de este cuadro
+        self.surface_counts.append(surfaces.last_frame)
+        misses = text_cache.misses
+        self.text_counts.append(misses - self._misses)
+        self._misses = misses
+        tracer.complete("cuadro", "frame", self._frame_start, time.perf_counter(),
+                        {"dt_ms": round(frame_dt * 1000, 2), "surfaces": surfaces.last_frame})
+
+    def percentile(self, q):
+        """Percentil q (0..1) del tiempo por cuadro, en segundos."""
+        if not self.frames:
+            return 0.0
+        ordered = sorted(self.frames)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def draw(self, screen, scene):
+        """Dibuja el overlay si está visible y devuelve su rect (o None)."""
+        if not self.visible:
+            return None
+        now = time.perf_counter()
+        if self._refreshed is None or now - self._refreshed >= REFRESH:
+            self._render_panel(type(scene).__name__ if scene else "-")
+            self._refreshed = now
+        rect = self.panel.get_rect(topright=(screen.get_width() - 10, 10))
+        screen.blit(self.panel, rect)
+        return rect
+
+    def _render_panel(self, scene_name):
+        font = get_font(None, 20)
+        # Opaco: con DIRTY_RECTS la escena no se redibuja debajo del panel
+        if self.panel is None:
+            self.panel = pygame.Surface((260, 190))
+        panel = self.panel
+        panel.fill((20, 20, 28))
+        pygame.draw.rect(panel, (90, 90, 110), panel.get_rect(), 1)
+
+        avg = lambda values: sum(values) / len(values) * 1000 if values else 0.0
+        last = lambda values: values[-1] if values else 0
+        mean_dt = sum(self.dts) / len(self.dts) if self.dts else 0.0
+        ph = {p: avg(self.phases[p]) for p in PHASES}
+        lines = [
+            f"{scene_name}  {1 / mean_dt if mean_dt else 0:.0f} fps",
+            f"eventos {ph['eventos']:.2f}  update {ph['update']:.2f} ms",
+            f"draw {ph['draw']:.2f}  flip {ph['flip']:.2f} ms",
+            f"cuadro p50 {self.percentile(0.5) * 1000:.2f}  p99 {self.percentile(0.99) * 1000:.2f} ms",
+            f"Surfaces {last(self.surface_counts)}/cuadro (máx {max(self.surface_counts, default=0)})",
+            f"textos {last(self.text_counts)}/cuadro (máx {max(self.text_counts, default=0)})",
+        ]
+        for i, line in enumerate(lines):
+            panel.blit(font.render(line, True, (230, 230, 230)), (8, 6 + i * 17))
+
+        # Gráfico: una barra por cuadro, escala de 0 a 2 presupuestos
+        graph = pygame.Rect(8, 112, 244, 70)
+        pygame.draw.rect(panel, (35, 35, 45), graph)
+        budget = 1.0 / FPS
+        scale = graph.h / (2 * budget)
+        frames = list(self.frames)[-graph.w:]
+        x0 = graph.right - len(frames)
+        for i, value in enumerate(frames):
+            h = min(graph.h, max(1, int(value * scale)))
+            color = (90, 200, 120) if value <= budget else (230, 90, 80)
+            pygame.draw.line(panel, color, (x0 + i, graph.bottom - 1), (x0 + i, graph.bottom - h))
+        y = graph.bottom - int(budget * scale)
+        pygame.draw.line(panel, (200, 200, 90), (graph.left, y), (graph.right - 1, y))
+
+
+# Perfilador único para todo el proceso
+profiler = FrameProfiler()
@@ -0,0 +1,116 @@
+import gzip
+import json
+import time
+import random
+import pygame
+
+REPLAY_VERSION = 1
+
+
+def event_to_json(event):
+    """[tipo, atributos] con solo lo que se puede guardar en JSON."""
+    attrs = {}
+    for key, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if isinstance(value, (bool, int, float, str, list)) or value is None:
+            attrs[key] = value
+    return [event.type, attrs]
+
+
+def event_from_json(data):
+    kind, attrs = data
+    attrs = {k: tuple(v) if isinstance(v, list) else v for k, v in attrs.items()}
+    return pygame.event.Event(kind, **attrs)
+
+
+class Recorder:
+    """Graba el dt y los eventos de cada cuadro del GameLoop.
+
+    El archivo (JSON comprimido con gzip) guarda la semilla de random, la
+    escena inicial y la configuración del paso fijo, más:
+        dts:    el dt real de cada cuadro
+        events: [cuadro, tipo, atributos] por cada evento
+    """
+    def __init__(self, path, seed, scene, sim_hz, max_steps):
+        self.path = path
+        self.data = {
+            "version": REPLAY_VERSION,
+            "seed": seed,
+            "scene": scene,
+            "sim_hz": sim_hz,
+            "max_steps": max_steps,
+            "dts": [],
+            "events": [],
+        }
+
+    def record(self, frame_dt, events):
+        frame = len(self.data["dts"])
+        self.data["dts"].append(round(frame_dt, 6))
+        for event in events:
+            self.data["events"].append([frame, *event_to_json(event)])
+
+    def save(self):
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(self.data, f, separators=(",", ":"))
+        print(f"Repetición guardada en {self.path} ({len(self.data['dts'])} cuadros, "
+              f"{len(self.data['events'])} eventos)")
+
+
+def load_replay(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != REPLAY_VERSION:
+        raise ValueError(f"{path}: versión de repetición {data.get('version')} no soportada")
+    return data
+
+
+class ReplayRunner:
+    """Vuelve a pasar una repetición por un SceneManager.
+
+    Siembra random con la semilla grabada y, cuadro por cuadro, entrega
+    los mismos eventos y avanza el GameLoop con el mismo dt, así la
+    simulación sigue exactamente el mismo camino. frame_times guarda
+    cuánto tardó cada cuadro (update + draw) en esta máquina.
+    """
+    def __init__(self, loop, data, draw=True):
+        self.loop = loop
+        self.manager = loop.manager
+        self.data = data
+        self.draw = draw
+        self.frame_times = []
+
+    @property
+    def frames(self):
+        return len(self.frame_times)
+
+    def run(self):
+        events = {}
+        for frame, kind, attrs in self.data["events"]:
+            events.setdefault(frame, []).append(event_from_json([kind, attrs]))
+        self.loop.running = True
+        try:
+            for frame, dt in enumerate(self.data["dts"]):
+                start = time.perf_counter()
+                # Mismo reparto que en vivo (QUIT, tecla del perfilador)
+                self.loop.handle_events(events.get(frame, ()))
+                if not self.loop.running:
+                    return self
+                self.loop.advance(dt)
+                if self.draw:
+                    self.manager.draw()
+                self.frame_times.append(time.perf_counter() - start)
+                if not self.manager.current():
+                    break
+        except SystemExit:
+            # El botón "Salir" del final cierra el juego
+            pass
+        return self
+
+
+def seed_random(seed=None):
+    """Siembra random (con una semilla nueva si no se pasa) y la devuelve."""
+    if seed is None:
+        seed = random.SystemRandom().randrange(1 << 31)
+    random.seed(seed)
+    return seed
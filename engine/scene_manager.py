@@ -1,51 +1,163 @@
+import time
 import pygame
-from settings import PALETTE
+from settings import PALETTE, DIRTY_RECTS
+from engine.assets import cache
+from engine.prefetch import Prefetcher
+from engine.dirty import merge_rects
+from engine.surfaces import surfaces
+from engine.trace import tracer
+from engine.memory import memory
+from engine.audio import audio_manager
 
 class Scene:
+    # Escenas que probablemente sigan a esta ("modulo.Clase"); el manager
+    # adelanta en segundo plano lo que declaran en preload/preload_sounds
+    successors = ()
+    preload = ()                  # claves de engine.assets.image_key()
+    preload_sounds = ("assets/audio/narrator_beep.wav",)
+    # Atributos Vector2 que se dibujan interpolados entre pasos de simulación
+    interpolated = ()
+
     def __init__(self, manager):
         self.manager = manager
+        self.previous = {}
+        # Inicio de la construcción, para la traza (engine/trace.py)
+        self._built_at = time.perf_counter()
+        # Lo que se cree desde acá hasta el push es de esta escena (engine/memory.py)
+        memory.scene_created(self)
     def on_enter(self): pass
     def on_exit(self): pass
     def handle_event(self, event, game_state): pass  # Agregamos game_state
     def update(self, dt, game_state): pass           # Agregamos game_state
     def draw(self, screen, game_state): pass         # Agregamos game_state y screen
+    def dirty_rects(self, game_state):
+        """Regiones que cambiaron desde el cuadro anterior (modo DIRTY_RECTS).
+        None = redibujar toda la pantalla."""
+        return None
+
+    def snapshot(self):
+        """Guarda las posiciones de interpolated antes de un paso."""
+        self.previous = {name: pygame.Vector2(getattr(self, name)) for name in self.interpolated}
+
+    def lerp(self, name):
+        """Posición para dibujar: entre el paso anterior y el actual, según
+        manager.alpha (1.0 = la del último paso)."""
+        current = getattr(self, name)
+        prev = self.previous.get(name)
+        if prev is None:
+            return current
+        return prev.lerp(current, self.manager.alpha)
+
+    def lerp_center(self, name):
+        """lerp() redondeado a enteros, para usar como centro de un blit."""
+        pos = self.lerp(name)
+        return (int(pos.x), int(pos.y))
 
 class SceneManager:
     def __init__(self, screen, game_state):          # Agregamos game_state
         self.screen = screen
         self.game_state = game_state                  # Almacenamos game_state
         self.stack = []
+        self.prefetcher = Prefetcher()
+        self.full_redraw = True
+        # Fracción del paso de simulación ya transcurrida al dibujar (GameLoop)
+        self.alpha = 1.0
+        # Segundos simulados (suma de los dt de update); las escenas lo usan
+        # en lugar del reloj real para que una repetición dé lo mismo
+        self.time = 0.0
+        self._replacing = False
 
     def push(self, scene):
-        if self.stack:
-            self.stack[-1].on_exit()
-        self.stack.append(scene)
-        scene.on_enter()
+        name = type(scene).__name__
+        built_at = getattr(scene, "_built_at", None)
+        if built_at is not None:
+            # Lo que tardó el constructor (la carga de imágenes cae adentro)
+            tracer.complete(f"{name}()", "scene", built_at, time.perf_counter())
+            scene._built_at = None
+        with tracer.span(f"push {name}", "scene"):
+            if self.stack:
+                self.stack[-1].on_exit()
+            self.full_redraw = True
+            self.stack.append(scene)
+            scene.previous = {}
+            scene.on_enter()
+            self.prefetcher.prefetch_successors(scene)
+        if not self._replacing:
+            memory.after_transition("push", self)
 
     def pop(self):
         if self.stack:
-            self.stack[-1].on_exit()
-            self.stack.pop()
-            if self.stack:
-                self.stack[-1].on_enter()
+            with tracer.span(f"pop {type(self.stack[-1]).__name__}", "scene"):
+                self.stack[-1].on_exit()
+                self.stack.pop()
+                self.full_redraw = True
+                if self.stack:
+                    self.stack[-1].previous = {}
+                    self.stack[-1].on_enter()
+            if not self._replacing:
+                memory.after_transition("pop", self)
 
     def replace(self, scene):
-        self.pop()
-        self.push(scene)
+        with tracer.span(f"replace {type(scene).__name__}", "scene"):
+            self._replacing = True
+            try:
+                self.pop()
+                self.push(scene)
+            finally:
+                self._replacing = False
+        memory.after_transition("replace", self)
 
     def current(self):
         return self.stack[-1] if self.stack else None
 
     def handle_event(self, event):
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            self.full_redraw = True
         if self.current():
             self.current().handle_event(event, self.game_state)  # Pasamos game_state
 
     def update(self, dt):
+        self.time += dt
+        cache.finish_staged()
+        audio_manager.update()
         if self.current():
+            self.current().snapshot()
             self.current().update(dt, self.game_state)           # Pasamos game_state
 
     def draw(self):
-        if self.current():
-            self.current().draw(self.screen, self.game_state)    # Pasamos game_state y screen
-        else:
-            self.screen.fill(PALETTE["bg"])   
\ No newline at end of file
+        """Dibuja la escena actual y devuelve las regiones de pantalla que
+        cambiaron, para pasarlas a pygame.display.update()."""
+        rects = self._draw()
+        # Cierra la cuenta de Surfaces creadas en este cuadro
+        surfaces.end_frame()
+        return rects
+
+    def _draw(self):
+        scene = self.current()
+        bounds = self.screen.get_rect()
+        if not scene:
+            self.screen.fill(PALETTE["bg"])
+            return [bounds]
+
+        rects = None
+        if DIRTY_RECTS:
+            # Se consulta siempre para que la escena registre lo que hay en pantalla
+            rects = scene.dirty_rects(self.game_state)
+            if rects is not None:
+                rects = merge_rects(rects, bounds)
+        if self.full_redraw or rects is None:
+            self.full_redraw = False
+            scene.draw(self.screen, self.game_state)             # Pasamos game_state y screen
+            return [bounds]
+
+        if not rects:
+            return rects
+        # Un solo draw() recortado a la unión de las regiones: el trabajo de
+        # la escena corre una vez por cuadro y cada blit solo toca esa zona.
+        # Lo que queda entre regiones se redibuja igual a como estaba, y a
+        # la pantalla se mandan solo las regiones que cambiaron
+        self.screen.set_clip(rects[0].unionall(rects[1:]))
+        scene.draw(self.screen, self.game_state)
+        self.screen.set_clip(None)
+        return rects
+   
\ No newline at end of file
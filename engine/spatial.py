@@ -0,0 +1,145 @@
+import math
+
+class SpatialHash:
+    """Índice espacial en una grilla uniforme de celdas cell_size x cell_size.
+
+    Guarda elementos (cualquier valor hasheable, por ejemplo un índice)
+    con su posición. query() y nearest() solo miran las celdas que
+    alcanza el radio, así el costo no crece con la cantidad total de
+    elementos. Quien usa el índice saca (remove) lo que deja de ser
+    interactivo; los resultados salen en orden de inserción.
+    """
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> [elementos]
+        self.items = {}   # elemento -> (x, y, orden de inserción)
+        self._order = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def _cell(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, item, pos):
+        if item in self.items:
+            self.remove(item)
+        x, y = pos[0], pos[1]
+        self.items[item] = (x, y, self._order)
+        self._order += 1
+        self.cells.setdefault(self._cell(x, y), []).append(item)
+
+    def remove(self, item):
+        entry = self.items.pop(item, None)
+        if entry is None:
+            return False
+        cell = self._cell(entry[0], entry[1])
+        bucket = self.cells[cell]
+        bucket.remove(item)
+        if not bucket:
+            del self.cells[cell]
+        return True
+
+    def move(self, item, pos):
+        """Cambia la posición conservando el orden de inserción."""
+        entry = self.items.get(item)
+        if entry is None:
+            self.insert(item, pos)
+            return
+        x, y = pos[0], pos[1]
+        old, new = self._cell(entry[0], entry[1]), self._cell(x, y)
+        if old != new:
+            bucket = self.cells[old]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[old]
+            self.cells.setdefault(new, []).append(item)
+        self.items[item] = (x, y, entry[2])
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+
+    def query(self, pos, radius):
+        """Elementos a distancia < radius de pos, en orden de inserción."""
+        x, y = pos[0], pos[1]
+        r2 = radius * radius
+        x0, y0 = self._cell(x - radius, y - radius)
+        x1, y1 = self._cell(x + radius, y + radius)
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item in bucket:
+                    ix, iy, order = self.items[item]
+                    dx, dy = ix - x, iy - y
+                    if dx * dx + dy * dy < r2:
+                        found.append((order, item))
+        found.sort()
+        return [item for _, item in found]
+
+    def any_within(self, pos, radius):
+        """Como bool(query(pos, radius)), pero corta en el primero."""
+        x, y = pos[0], pos[1]
+        r2 = radius * radius
+        x0, y0 = self._cell(x - radius, y - radius)
+        x1, y1 = self._cell(x + radius, y + radius)
+        items = self.items
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for item in self.cells.get((cx, cy), ()):
+                    ix, iy, _ = items[item]
+                    dx, dy = ix - x, iy - y
+                    if dx * dx + dy * dy < r2:
+                        return True
+        return False
+
+    def nearest(self, pos, max_radius=None):
+        """El elemento más cercano a pos (a distancia < max_radius si se
+        pasa), o None. Recorre anillos de celdas alrededor de pos y corta
+        en cuanto ningún anillo siguiente puede tener algo más cerca."""
+        if not self.items:
+            return None
+        x, y = pos[0], pos[1]
+        cx, cy = self._cell(x, y)
+        if max_radius is None:
+            limit = max(max(abs(kx - cx), abs(ky - cy)) for kx, ky in self.cells)
+            best_d2 = math.inf
+        else:
+            limit = int(math.ceil(max_radius / self.cell_size))
+            best_d2 = max_radius * max_radius
+        best = None
+        for ring in range(limit + 1):
+            for kx, ky in ring_cells(cx, cy, ring):
+                bucket = self.cells.get((kx, ky))
+                if not bucket:
+                    continue
+                for item in bucket:
+                    ix, iy, order = self.items[item]
+                    dx, dy = ix - x, iy - y
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2 or (best is not None and d2 == best_d2 and order < self.items[best][2]):
+                        best, best_d2 = item, d2
+            # Lo que está más allá de este anillo queda a >= ring * cell_size
+            reach = ring * self.cell_size
+            if best is not None and best_d2 < reach * reach:
+                break
+        return best
+
+
+def ring_cells(cx, cy, ring):
+    """Celdas a distancia (en celdas) exactamente ring de (cx, cy)."""
+    if ring == 0:
+        yield (cx, cy)
+        return
+    for kx in range(cx - ring, cx + ring + 1):
+        yield (kx, cy - ring)
+        yield (kx, cy + ring)
+    for ky in range(cy - ring + 1, cy + ring):
+        yield (cx - ring, ky)
+        yield (cx + ring, ky)
@@ -0,0 +1,73 @@
+import pygame
+from engine.memory import track
+
+class SurfacePool:
+    """Overlays semitransparentes reutilizables y contador de Surfaces.
+
+    overlay() devuelve una Surface SRCALPHA ya rellenada, compartida por
+    (tamaño, color, alpha); fade() usa una sola Surface opaca por
+    (tamaño, color) y le cambia set_alpha(), así un fundido no crea una
+    Surface por cada valor de alpha. Las Surfaces devueltas son
+    compartidas: no se deben modificar.
+
+    Todo lo que crea Surfaces durante el juego (este pool, la caché de
+    textos, la de imágenes, los diálogos) llama a note_alloc(); el total
+    de cada cuadro queda en last_frame para perfilar.
+    """
+    def __init__(self):
+        self.overlays = {}
+        self.fades = {}
+        self.frame = 0        # Surfaces creadas en el cuadro en curso
+        self.last_frame = 0   # ... y en el último cuadro terminado
+        self.total = 0
+
+    def overlay(self, size, color, alpha=None):
+        """color puede ser RGBA; alpha, si se pasa, tiene prioridad."""
+        if alpha is None:
+            alpha = color[3] if len(color) > 3 else 255
+        key = (tuple(size), tuple(color[:3]), alpha)
+        surf = self.overlays.get(key)
+        if surf is None:
+            self.note_alloc()
+            surf = self.overlays[key] = track(pygame.Surface(key[0], pygame.SRCALPHA), "overlay")
+            surf.fill((*key[1], alpha))
+        return surf
+
+    def fade(self, size, color, alpha):
+        key = (tuple(size), tuple(color[:3]))
+        surf = self.fades.get(key)
+        if surf is None:
+            self.note_alloc()
+            surf = self.fades[key] = track(pygame.Surface(key[0]).convert(), "overlay")
+            surf.fill(key[1])
+        surf.set_alpha(alpha)
+        return surf
+
+    def note_alloc(self, count=1):
+        self.frame += count
+        self.total += count
+
+    def end_frame(self):
+        self.last_frame = self.frame
+        self.frame = 0
+
+    def clear(self):
+        self.overlays.clear()
+        self.fades.clear()
+
+
+# Pool único para todo el proceso
+surfaces = SurfacePool()
+
+def get_overlay(size, color, alpha=None):
+    """Atajo para surfaces.overlay(): Surface translúcida compartida."""
+    return surfaces.overlay(size, color, alpha)
+
+
+def get_fade(size, color, alpha):
+    """Atajo para surfaces.fade(): Surface opaca con set_alpha(alpha)."""
+    return surfaces.fade(size, color, alpha)
+
+
+def note_alloc(count=1):
+    surfaces.note_alloc(count)
@@ -0,0 +1,86 @@
+import os
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+# Ruta del archivo de traza; si la variable no está, no se graba nada
+TRACE_ENV = "COSY_TRACE"
+MAX_EVENTS = 500000   # tope para que una sesión larga no llene la memoria
+
+class Tracer:
+    """Línea de tiempo en formato Chrome trace-event (JSON).
+
+    Se activa con COSY_TRACE=archivo.json. Graba spans ("ph": "X") con
+    inicio y duración en microsegundos, por hilo: las fases de cada
+    cuadro (engine/profiler.py), push/pop/replace del SceneManager y la
+    construcción de cada escena, y cada lectura, convert() y escalado
+    de imágenes con su ruta y tamaño en bytes (engine/assets.py). Al
+    salir se escribe el archivo, que se abre con chrome://tracing o
+    https://ui.perfetto.dev. Apagado, span() y complete() no hacen nada.
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.events = []
+        self.threads = {}   # id de hilo -> nombre
+        self.dropped = 0
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        if self.enabled:
+            atexit.register(self.save)
+
+    def complete(self, name, cat, start, end, args=None):
+        """Agrega un span; start y end son valores de time.perf_counter()."""
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            if len(self.events) >= MAX_EVENTS:
+                self.dropped += 1
+                return
+            self.threads[thread.ident] = thread.name
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name, cat, **args):
+        """with tracer.span(...) as args: mide el bloque. Se pueden
+        agregar datos a args dentro del bloque (por ejemplo los bytes)."""
+        if not self.enabled:
+            yield args
+            return
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.complete(name, cat, start, time.perf_counter(), args)
+
+    def save(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        pid = os.getpid()
+        meta = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                for tid, name in threads.items()]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+        note = f", {self.dropped} descartados" if self.dropped else ""
+        print(f"Traza guardada en {self.path} ({len(events)} eventos{note})")
+
+
+# Trazador único para todo el proceso
+tracer = Tracer(os.environ.get(TRACE_ENV))
@@ -1,14 +1,24 @@
 import pygame
 from settings import PALETTE
+from engine.assets import load_image
+from engine.fonts import get_font, render_text
+from engine.memory import track
 
 class StatsDisplay:
-    """Muestra las estadísticas del personaje como barras de dualidad"""
+    """Muestra las estadísticas del personaje como barras de dualidad.
+
+    El panel se pre-renderiza en una Surface y solo se vuelve a dibujar
+    cuando GameState avisa que cambió una de las claves que muestra.
+    """
+    KEYS = ("panic_selfcontrol", "rejection_understanding", "intelligence")
+    MARGIN = 8   # el marcador sobresale de la barra en los extremos
+
     def __init__(self, game_state, position=(20, 20)):
         self.game_state = game_state
         self.position = position
         self.visible = True
-        self.font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font = get_font(None, 20)
+        self.small_font = get_font(None, 16)
         
         # Colores para las dualidades
         self.negative_color = (220, 80, 80)    # Rojo para lado negativo (pánico, rechazo)
@@ -16,17 +26,41 @@ class StatsDisplay:
         self.neutral_color = (200, 200, 200)   # Gris para fondo
         self.intelligence_color = (200, 180, 80) # Amarillo para inteligencia
 
+        self.panel = track(pygame.Surface((280, 150), pygame.SRCALPHA), "panel")
+        self.dirty = True
+        self.revision = 0
+        for key in self.KEYS:
+            game_state.subscribe(key, self._on_change)
+
+    def _on_change(self, key, old, new):
+        self.dirty = True
+        self.revision += 1
+
+    def dirty_region(self):
+        x, y = self.position
+        rect = self.panel.get_rect(topleft=(x - self.MARGIN, y))
+        return rect, (self.visible, self.revision)
+
     def draw(self, surf):
         if not self.visible:
             return
-
+        if self.dirty:
+            self._render_panel()
         x, y = self.position
+        surf.blit(self.panel, (x - self.MARGIN, y))
+
+    def _render_panel(self):
+        self.dirty = False
+        surf = self.panel
+        surf.fill((0, 0, 0, 0))
+
+        x, y = self.MARGIN, 0
         bar_width = 200
         bar_height = 8
         marker_size = 12
         
         # Título
-        title = self.font.render("ESTADO MENTAL", True, PALETTE["text"])
+        title = render_text(self.font, "ESTADO MENTAL", True, PALETTE["text"])
         surf.blit(title, (x, y))
         y += 30
 
@@ -43,12 +77,11 @@ class StatsDisplay:
         # Inteligencia (barra normal)
         intelligence = self.game_state.get_stat("intelligence")
         self._draw_single_bar(surf, x, y, "Inteligencia", intelligence, bar_width, bar_height)
-        y += 30
 
     def _draw_duality_bar(self, surf, x, y, label_neg, label_pos, value, width, height, marker_size):
         # Dibujar etiquetas
-        label_neg_surf = self.small_font.render(label_neg, True, PALETTE["text"])
-        label_pos_surf = self.small_font.render(label_pos, True, PALETTE["text"])
+        label_neg_surf = render_text(self.small_font, label_neg, True, PALETTE["text"])
+        label_pos_surf = render_text(self.small_font, label_pos, True, PALETTE["text"])
         
         surf.blit(label_neg_surf, (x, y))
         surf.blit(label_pos_surf, (x + width - label_pos_surf.get_width(), y))
@@ -70,7 +103,7 @@ class StatsDisplay:
 
     def _draw_single_bar(self, surf, x, y, label, value, width, height):
         # Dibujar etiqueta
-        label_surf = self.small_font.render(label, True, PALETTE["text"])
+        label_surf = render_text(self.small_font, label, True, PALETTE["text"])
         surf.blit(label_surf, (x, y))
         
         # Barra de fondo
@@ -84,7 +117,7 @@ class StatsDisplay:
             pygame.draw.rect(surf, self.intelligence_color, fill_rect, border_radius=3)
         
         # Texto del valor
-        value_text = self.small_font.render(f"{value}/100", True, PALETTE["text"])
+        value_text = render_text(self.small_font, f"{value}/100", True, PALETTE["text"])
         surf.blit(value_text, (x + width + 5, y + 18))
 
 class Button:
@@ -98,11 +131,13 @@ class Button:
         self.pressed = False
         self.skin = None
         try:
-            img = pygame.image.load("assets/ui_button.png").convert_alpha()
-            self.skin = pygame.transform.smoothscale(img, (self.rect.w, self.rect.h))
+            self.skin = load_image("assets/ui_button.png", (self.rect.w, self.rect.h))
         except Exception:
             self.skin = None
 
+    def dirty_region(self):
+        return self.rect, (self.hover, self.text)
+
     def handle_event(self, event, audio=None):
         if event.type == pygame.MOUSEMOTION:
             self.hover = self.rect.collidepoint(event.pos)
@@ -126,6 +161,6 @@ class Button:
             color = PALETTE["accent2"] if self.hover else PALETTE["accent"]
             pygame.draw.rect(surf, color, self.rect, border_radius=14)
             pygame.draw.rect(surf, PALETTE["shadow"], self.rect, width=2, border_radius=14)
-        txt = self.font.render(self.text, True, (255, 255, 255))
+        txt = render_text(self.font, self.text, True, (255, 255, 255))
         txtr = txt.get_rect(center=self.rect.center)
         surf.blit(txt, txtr)
\ No newline at end of file
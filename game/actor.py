@@ -1,4 +1,6 @@
 import pygame
+from engine.assets import load_image
+from engine.atlas import daniela_atlas
 
 class Character:
     def __init__(self, x, y):
@@ -8,9 +10,8 @@ class Character:
         self.radius = 18
         self.sprite = None
         try:
-            img = pygame.image.load("assets/images/hero_idle.png").convert_alpha()
             # escalar a 64x64 aprox para encajar
-            self.sprite = pygame.transform.smoothscale(img, (64, 64))
+            self.sprite = load_image("assets/images/hero_idle.png", (64, 64))
         except Exception:
             self.sprite = None
 
@@ -40,8 +41,7 @@ class NPC:
         self.name = name
         self.sprite = None
         try:
-            img = pygame.image.load("assets/images/npc1.png").convert_alpha()
-            self.sprite = pygame.transform.smoothscale(img, (64, 64))
+            self.sprite = load_image("assets/images/npc1.png", (64, 64))
         except Exception:
             self.sprite = None
 
@@ -52,3 +52,34 @@ class NPC:
         else:
             pygame.draw.rect(surf, (180, 160, 190), self.rect, border_radius=8)
             pygame.draw.rect(surf, (55, 65, 81), self.rect, 2, border_radius=8)
+
+
+class CharacterSprite:
+    """Poses de un personaje servidas desde un atlas (engine/atlas.py).
+
+    Las escenas piden las poses por nombre. flipped son las poses que la
+    escena usa espejadas por defecto (las que antes cargaba con flip_x);
+    mirrored=True pide la orientación contraria.
+    """
+    def __init__(self, size, flipped=(), atlas=None):
+        self.atlas = atlas or daniela_atlas(size)
+        self.flipped = set(flipped)
+
+    def has(self, pose):
+        return (pose, False) in self.atlas.frames
+
+    def frame(self, pose, mirrored=False):
+        """Subsurface de la pose, o None si no está en el atlas."""
+        return self.atlas.frames.get((pose, mirrored != (pose in self.flipped)))
+
+    def rect(self, pose, center):
+        img = self.frame(pose)
+        return img.get_rect(center=center) if img else None
+
+    def draw(self, surf, pose, center, mirrored=False):
+        img = self.frame(pose, mirrored)
+        if img is None:
+            return None
+        r = img.get_rect(center=center)
+        surf.blit(img, r)
+        return r
@@ -1,5 +1,12 @@
+import weakref
+
 class GameState:
-    """Estado global del juego: estadísticas que afectan la historia."""
+    """Estado global del juego: estadísticas que afectan la historia.
+
+    Cada cambio real de una dualidad, estadística o flag incrementa
+    version y avisa a los observadores suscritos a esa clave, para que la
+    interfaz pueda saltarse el trabajo cuando nada cambió.
+    """
     def __init__(self):
         # Sistema de dualidades - EL JARDÍN DE LOS SUSURROS
         self.dualities = {
@@ -13,26 +20,58 @@ class GameState:
             "vio_mariposa": False,
         }
         self.max_stat_value = 100
+        self.version = 0
+        self.observers = {}   # clave (o None = todas) -> lista de referencias débiles
+
+    def subscribe(self, key, callback):
+        """Llama a callback(key, anterior, nuevo) cuando cambia key.
+        key=None se suscribe a todas las claves. Los métodos se guardan como
+        referencia débil, así un widget descartado no queda vivo por esto."""
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        refs = [r for r in self.observers.get(key, []) if r() is not None]
+        self.observers[key] = refs + [ref]
+
+    def unsubscribe(self, key, callback):
+        refs = self.observers.get(key, [])
+        self.observers[key] = [r for r in refs if r() is not None and r() != callback]
+
+    def _set(self, values, key, value):
+        old = values[key]
+        if old == value:
+            return
+        values[key] = value
+        self.version += 1
+        for watched in (key, None):
+            refs = self.observers.get(watched)
+            if not refs:
+                continue
+            alive = []
+            for ref in refs:
+                callback = ref()
+                if callback is not None:
+                    callback(key, old, value)
+                    alive.append(ref)
+            self.observers[watched] = alive
 
     def add_duality(self, key, value):
         """Añade valor a una dualidad, respetando los límites"""
         if key in self.dualities:
-            self.dualities[key] = max(-100, min(100, self.dualities[key] + value))
+            self._set(self.dualities, key, max(-100, min(100, self.dualities[key] + value)))
 
     def set_duality(self, key, value):
         """Establece directamente una dualidad"""
         if key in self.dualities:
-            self.dualities[key] = max(-100, min(value, 100))
+            self._set(self.dualities, key, max(-100, min(value, 100)))
 
     def add_stat(self, key, value):
         """Añade valor a una estadística simple"""
         if key in self.stats:
-            self.stats[key] = max(0, min(self.stats[key] + value, self.max_stat_value))
+            self._set(self.stats, key, max(0, min(self.stats[key] + value, self.max_stat_value)))
 
     def set_stat(self, key, value):
         """Establece directamente una estadística simple"""
         if key in self.stats:
-            self.stats[key] = max(0, min(value, self.max_stat_value))
+            self._set(self.stats, key, max(0, min(value, self.max_stat_value)))
 
     def get_duality(self, key):
         """Obtiene el valor de una dualidad"""
@@ -43,7 +82,8 @@ class GameState:
         return self.stats.get(key, 0)
 
     def set_flag(self, key, value=True):
-        self.flags[key] = value
+        self.flags.setdefault(key, None)
+        self._set(self.flags, key, value)
 
     def get_primary_tendency(self):
         """Calcula la tendencia principal del personaje para finales"""
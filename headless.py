@@ -0,0 +1,182 @@
+"""Corre la lógica del juego sin ventana y sin esperar entre cuadros.
+
+Uso (desde la raíz del proyecto):
+    python headless.py [--scene scenes.garden.GardenScene] [--seconds 60]
+                       [--dt 0.016] [--script entrada.json] [--no-draw]
+                       [--seed N] [--json]
+    python headless.py --replay partida.replay.gz [--no-draw] [--json]
+
+Usa los drivers "dummy" de SDL (no hace falta pantalla ni placa de
+sonido) y avanza el GameLoop con un dt sintético en vez de clock.tick(),
+así una partida guionada corre tan rápido como dé la CPU.
+
+El guion es una lista JSON de entradas ordenadas por tiempo de
+simulación (segundos):
+    [{"at": 0.5, "type": "click", "pos": [510, 400]},
+     {"at": 2.0, "type": "move", "pos": [300, 300]},
+     {"at": 3.0, "type": "key", "key": "space"}]
+type puede ser click (botón abajo y arriba), down, up, move o key.
+
+Con --replay repite una partida grabada con main.py --record (misma
+semilla, mismos eventos y mismos dt por cuadro) y agrega al resumen los
+tiempos por cuadro medidos en esta máquina.
+"""
+import os
+import sys
+import json
+import time
+import math
+import random
+import inspect
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import WIDTH, HEIGHT, SIM_HZ
+from engine.scene_manager import SceneManager
+from engine.loop import GameLoop
+from engine.replay import ReplayRunner, load_replay
+from engine.prefetch import resolve_scene
+from engine.audio import Audio
+from game.state import GameState
+
+
+def make_scene(name, manager, state, audio):
+    """Construye una escena por nombre ("modulo.Clase"). El título recibe
+    solo el manager; las demás, también el estado y el audio."""
+    cls = resolve_scene(name)
+    if cls is None:
+        raise SystemExit(f"Escena desconocida: {name}")
+    if len(inspect.signature(cls.__init__).parameters) > 2:
+        return cls(manager, state, audio)
+    return cls(manager)
+
+
+def script_events(entry):
+    """Eventos de pygame para una entrada del guion."""
+    kind = entry["type"]
+    pos = tuple(entry.get("pos", (0, 0)))
+    button = entry.get("button", 1)
+    if kind == "click":
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button),
+                pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)]
+    if kind == "down":
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)]
+    if kind == "up":
+        return [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)]
+    if kind == "move":
+        return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))]
+    if kind == "key":
+        key = pygame.key.key_code(entry["key"])
+        return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0),
+                pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0)]
+    raise ValueError(f"Tipo de entrada desconocido: {kind}")
+
+
+def load_script(path):
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    return sorted(entries, key=lambda e: e["at"])
+
+
+class HeadlessRunner:
+    """Avanza un SceneManager con dt sintético y entrada guionada."""
+    def __init__(self, manager, dt=1.0 / SIM_HZ, draw=True):
+        self.manager = manager
+        self.dt = dt
+        self.draw = draw
+        # Sin tope de pasos: acá nunca conviene descartar simulación
+        self.loop = GameLoop(manager, max_steps=max(1, math.ceil(dt * SIM_HZ)) + 1)
+        self.frames = 0
+
+    def run(self, seconds, script=()):
+        pending = list(script)
+        try:
+            while self.loop.sim_time < seconds and self.manager.current():
+                while pending and pending[0]["at"] <= self.loop.sim_time:
+                    for event in script_events(pending.pop(0)):
+                        self.manager.handle_event(event)
+                self.loop.advance(self.dt)
+                if self.draw:
+                    self.manager.draw()
+                self.frames += 1
+        except SystemExit:
+            # El botón "Salir" del final cierra el juego
+            pass
+        return self
+
+
+def frame_time_stats(times):
+    """p50/p99/máximo en milisegundos y el cuadro más lento."""
+    if not times:
+        return {}
+    ordered = sorted(times)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    worst = max(range(len(times)), key=times.__getitem__)
+    return {"p50_ms": round(pick(0.5), 3), "p99_ms": round(pick(0.99), 3),
+            "max_ms": round(times[worst] * 1000, 3), "worst_frame": worst}
+
+
+def summary(runner, state, wall):
+    scene = runner.manager.current()
+    return {
+        "frames": runner.frames,
+        "sim_seconds": round(runner.loop.sim_time, 3),
+        "wall_seconds": round(wall, 3),
+        "speedup": round(runner.loop.sim_time / wall, 1) if wall > 0 else None,
+        "scene": type(scene).__name__ if scene else None,
+        "dualities": dict(state.dualities),
+        "stats": dict(state.stats),
+        "flags": dict(state.flags),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Corre el juego sin ventana, a máxima velocidad")
+    parser.add_argument("--scene", default="scenes.title.TitleScene", help="escena inicial (modulo.Clase)")
+    parser.add_argument("--seconds", type=float, default=60.0, help="segundos de simulación")
+    parser.add_argument("--dt", type=float, default=1.0 / SIM_HZ, help="dt sintético por cuadro")
+    parser.add_argument("--script", help="guion de entrada (JSON)")
+    parser.add_argument("--no-draw", action="store_true", help="no llamar a draw()")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de random")
+    parser.add_argument("--json", action="store_true", help="imprimir el resumen como JSON")
+    parser.add_argument("--replay", help="repetir una partida grabada con main.py --record")
+    args = parser.parse_args(argv)
+
+    replay = load_replay(args.replay) if args.replay else None
+    random.seed(replay["seed"] if replay else args.seed)
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    state = GameState()
+    manager = SceneManager(screen, state)
+    manager.push(make_scene(replay["scene"] if replay else args.scene, manager, state, Audio()))
+
+    start = time.perf_counter()
+    if replay:
+        loop = GameLoop(manager, sim_hz=replay["sim_hz"], max_steps=replay["max_steps"])
+        runner = ReplayRunner(loop, replay, draw=not args.no_draw).run()
+    else:
+        script = load_script(args.script) if args.script else ()
+        runner = HeadlessRunner(manager, dt=args.dt, draw=not args.no_draw).run(args.seconds, script)
+    result = summary(runner, state, time.perf_counter() - start)
+    if replay:
+        result.update(frame_time_stats(runner.frame_times))
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=1))
+    else:
+        print(f"{result['frames']} cuadros, {result['sim_seconds']} s simulados en "
+              f"{result['wall_seconds']} s (x{result['speedup']}), escena final: {result['scene']}")
+        if "p50_ms" in result:
+            print(f"cuadro p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, "
+                  f"máximo {result['max_ms']} ms (cuadro {result['worst_frame']})")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
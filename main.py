@@ -1,32 +1,45 @@
 import pygame
 import sys
-from settings import WIDTH, HEIGHT, TITLE, FPS
+import argparse
+from settings import WIDTH, HEIGHT, TITLE, SIM_HZ, MAX_CATCHUP_STEPS
 from engine.scene_manager import SceneManager
+from engine.loop import GameLoop
+from engine.replay import Recorder, seed_random
+from engine.hitch import hitches
 from scenes.title import TitleScene
 from game.state import GameState  # Importamos el GameState
+from engine.fonts import fonts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--record", metavar="ARCHIVO", help="grabar la partida (ej. partida.replay.gz)")
+    args = parser.parse_args(argv)
 
-def main():
     pygame.init()
     pygame.mixer.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption(TITLE)
-    clock = pygame.time.Clock()
+
+    # Resolver de una vez las fuentes comunes y reportar cuánto costó
+    fonts.preload()
+    print(fonts.report())
+
+    recorder = None
+    if args.record:
+        # Con semilla conocida, la repetición ubica igual a los espíritus
+        recorder = Recorder(args.record, seed_random(), "scenes.title.TitleScene", SIM_HZ, MAX_CATCHUP_STEPS)
 
     # Creamos el estado del juego y lo pasamos al manager
     game_state = GameState()
     manager = SceneManager(screen, game_state)  # Pasamos game_state
     manager.push(TitleScene(manager))
 
-    while True:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit(0)
-            manager.handle_event(event)
+    # Vigía de tirones: los cuadros lentos quedan en logs/hitches.log
+    hitches.start()
 
-        manager.update(dt)
-        manager.draw()
-        pygame.display.flip()
+    # Lógica a paso fijo (SIM_HZ) y dibujo interpolado, ver engine/loop.py
+    GameLoop(manager, recorder=recorder).run()
+    pygame.quit(); sys.exit(0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
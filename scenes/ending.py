@@ -1,15 +1,24 @@
 import pygame, json, sys
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.fonts import get_font, render_text
 from engine.ui import Button
+from engine.layers import StaticLayer
 
 class EndingScene(Scene):
+    successors = ("scenes.title.TitleScene",)
+    preload = (
+        image_key("assets/images/ending_bg.png", (WIDTH, HEIGHT), alpha=False),
+    )
+    preload_sounds = ()
+
     def __init__(self, manager, state, audio):
         super().__init__(manager)
         self.state = state
         self.audio = audio
-        self.font_big = pygame.font.SysFont("arial", 36)
-        self.font = pygame.font.SysFont("arial", 22)
+        self.font_big = get_font("arial", 36)
+        self.font = get_font("arial", 22)
         with open("narrative/script.json", "r", encoding="utf-8") as f:
             self.script = json.load(f)
 
@@ -18,8 +27,7 @@ class EndingScene(Scene):
         self.buttons = []
 
         try:
-            self.bg = pygame.image.load("assets/images/ending_bg.png").convert()
-            self.bg = pygame.transform.smoothscale(self.bg, (WIDTH, HEIGHT))
+            self.bg = load_image("assets/images/ending_bg.png", (WIDTH, HEIGHT), alpha=False)
         except Exception:
             self.bg = None
 
@@ -39,6 +47,7 @@ class EndingScene(Scene):
             self.text = "Mantienes un frágil equilibrio entre el miedo y la curiosidad."
 
         self.audio.stop_ambience()
+        self.build_layer()
 
         # Botones (código existente)
         btn_w, btn_h = 220, 48
@@ -82,16 +91,12 @@ class EndingScene(Scene):
         if self.input_cooldown > 0:
             self.input_cooldown -= dt
 
-    def draw(self, screen, game_state):
-        surf = screen
-        if self.bg:
-            surf.blit(self.bg, (0, 0))
-        else:
-            surf.fill(PALETTE["bg"])
-
-        t1 = self.font_big.render("Fin del demo", True, PALETTE["ink"])
-        t1r = t1.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
-        surf.blit(t1, t1r)
+    def build_layer(self):
+        """Fondo, título y texto final no cambian: se aplanan una vez"""
+        self.layer = StaticLayer(fill=PALETTE["bg"])
+        self.layer.add("bg", self.bg)
+        t1 = render_text(self.font_big, "Fin del demo", True, PALETTE["ink"])
+        self.layer.add("titulo", t1, (WIDTH // 2, HEIGHT // 2 - 40), center=True)
 
         y = HEIGHT // 2 + 10
         wrapped, line = [], ""
@@ -105,8 +110,12 @@ class EndingScene(Scene):
         if line:
             wrapped.append(line)
         for i, s in enumerate(wrapped):
-            tx = self.font.render(s, True, PALETTE["ink"])
-            surf.blit(tx, (WIDTH // 2 - 280, y + i * 28))
+            tx = render_text(self.font, s, True, PALETTE["ink"])
+            self.layer.add(("linea", i), tx, (WIDTH // 2 - 280, y + i * 28))
+
+    def draw(self, screen, game_state):
+        surf = screen
+        self.layer.draw(surf)
 
         for b in self.buttons:
             b.draw(surf)
\ No newline at end of file
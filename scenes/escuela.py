@@ -2,71 +2,76 @@ import pygame
 import math
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.atlas import atlas_keys
+from engine.fonts import get_font, render_text
 from engine.narrator import Narrator
 from engine.ui import StatsDisplay
+from engine.dialogue import DialogueBox, next_page
+from engine.layers import StaticLayer
+from engine.dirty import DirtyTracker
+from engine.surfaces import get_overlay
+from game.actor import CharacterSprite
 
 class EscuelaScene(Scene):
+    successors = ("scenes.tarot.TarotScene", "scenes.title.TitleScene")
+    interpolated = ("daniela_pos",)   # se dibuja interpolada entre pasos
+    preload = (
+        image_key("assets/images/aula2_bg.jpeg", (WIDTH, HEIGHT), alpha=False),
+        image_key("assets/images/silla_icon.png", (180, 240)),
+        image_key("assets/images/espiritu_escolar_npc.png", (200, 320)),
+        *atlas_keys((140, 280)),
+        *atlas_keys((160, 300)),
+    )
+
     def __init__(self, manager, game_state, audio):
         super().__init__(manager)
         self.game_state = game_state
         self.audio = audio
-        self.font = pygame.font.SysFont("arial", 28)
-        self.speaker_font = pygame.font.SysFont("arial", 24, bold=True)
+        self.font = get_font("arial", 28)
+        self.speaker_font = get_font("arial", 24, bold=True)
         self.narrator = Narrator(self.font)
         self.stats_display = StatsDisplay(game_state)
+        self.dirty = DirtyTracker()
+        self.dialogue_box = DialogueBox(self.font, self.speaker_font, {
+            "Espíritu": (255, 100, 100),
+            "Narrador": (200, 200, 100),
+        })
 
         # Fondo
         try:
-            self.bg = pygame.image.load("assets/images/aula2_bg.jpeg").convert()
-            self.bg = pygame.transform.smoothscale(self.bg, (WIDTH, HEIGHT))
+            self.bg = load_image("assets/images/aula2_bg.jpeg", (WIDTH, HEIGHT), alpha=False)
         except:
             self.bg = pygame.Surface((WIDTH, HEIGHT))
             self.bg.fill((150, 180, 200))
 
         # Silla interactiva MUCHO MÁS GRANDE
         try:
-            self.silla_img = pygame.image.load("assets/images/silla_icon.png").convert_alpha()
-            self.silla_img = pygame.transform.smoothscale(self.silla_img, (180, 240))  # AÚN MÁS GRANDE: 180x240
+            self.silla_img = load_image("assets/images/silla_icon.png", (180, 240))  # AÚN MÁS GRANDE: 180x240
         except:
             self.silla_img = None
 
         # Daniela sentada en la silla
-        try:
-            self.daniela_sentada_img = pygame.image.load("assets/images/silla_escola_pr.png").convert_alpha()
-            self.daniela_sentada_img = pygame.transform.smoothscale(self.daniela_sentada_img, (160, 300))  # Más grande
-        except:
-            self.daniela_sentada_img = None
+        self.daniela_sentada_img = CharacterSprite((160, 300)).frame("silla_escola")  # Más grande
 
         # Espíritu aterrador
         try:
-            self.espiritu_img = pygame.image.load("assets/images/espiritu_escolar_npc.png").convert_alpha()
-            self.espiritu_img = pygame.transform.smoothscale(self.espiritu_img, (200, 320))  # Más grande
+            self.espiritu_img = load_image("assets/images/espiritu_escolar_npc.png", (200, 320))  # Más grande
         except:
             self.espiritu_img = None
 
-        # Estados de Daniela de pie (para movimiento)
-        self.daniela_states = {}
-        sprites = {
-            "parada_frente": "parada_frente_pr.png",
-            "parada_costado": "parada_costado_pr.png",
-            "caminando": "caminando_pr.png",
-            "corriendo": "corriendo_pr.png",
-            "asustada": "asustada_pr.png"
-        }
-        
-        for state, file in sprites.items():
-            try:
-                img = pygame.image.load(f"assets/images/{file}").convert_alpha()
-                if state in ["parada_costado", "caminando"]:
-                    img = pygame.transform.flip(img, True, False)  # Voltear para que mire a la izquierda
-                self.daniela_states[state] = pygame.transform.smoothscale(img, (140, 280))  # Más grande
-            except:
-                print(f"Error cargando: {file}")
+        # Poses de Daniela de pie (para movimiento), más grandes que en casa
+        self.daniela = CharacterSprite((140, 280), flipped=("parada_costado", "caminando"))
 
         # Posiciones - SILLA MÁS ARRIBA
         self.silla_pos = (WIDTH // 2, HEIGHT - 250)  # Silla más arriba (HEIGHT - 250)
         # Zona de la silla MÁS GRANDE para facilitar clic
         self.silla_zone = pygame.Rect(self.silla_pos[0] - 90, self.silla_pos[1] - 120, 180, 240)
+
+        # Aula y silla (siempre visible, ENORME) aplanadas en una capa
+        self.layer = StaticLayer()
+        self.layer.add("bg", self.bg)
+        self.layer.add("silla", self.silla_img, self.silla_pos, center=True)
         
         # Variables para movimiento del espíritu
         self.espiritu_base_pos = (WIDTH // 2, HEIGHT - 280)  # Posición base cerca de Daniela
@@ -149,6 +154,8 @@ class EscuelaScene(Scene):
         # Manejar clic en diálogos
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dialogue_cooldown <= 0:
             if self.can_skip and self.current_dialogue:
+                if next_page(self):
+                    return
                 self.current_dialogue = None
                 self.current_speaker = None
                 self.dialogue_cooldown = 0.5
@@ -170,7 +177,7 @@ class EscuelaScene(Scene):
 
         # MOVIMIENTO NORMAL - clic para moverse (solo si puede moverse)
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.can_move and not self.has_sentado:
-            current_time = pygame.time.get_ticks() / 1000.0
+            current_time = self.manager.time
             is_double_click = (current_time - self.last_click_time) < 0.3
             self.last_click_time = current_time
 
@@ -328,34 +335,61 @@ class EscuelaScene(Scene):
             self.espiritu_visible = False
             self.show_dialogue("Daniela", "¡No soporto más! ¡Tengo que salir de aquí!")
 
+    def silla_highlighted(self):
+        """Indicador de interacción si está cerca y puede sentarse"""
+        if not self.silla_img or not self.can_move or self.has_sentado:
+            return False
+        silla_center = pygame.Vector2(self.silla_pos)
+        return silla_center.distance_to(self.daniela_pos) < 150  # Mayor tolerancia para silla más grande
+
+    def dirty_rects(self, game_state):
+        d = self.dirty
+        # La pantalla negra inicial tapa todo
+        d.track("pantalla", (0, 0, WIDTH, HEIGHT), self.show_black_screen)
+        if self.show_black_screen:
+            return d.collect()
+        d.track("silla", self.silla_zone, self.silla_highlighted())
+        rect = None
+        if self.espiritu_visible and self.espiritu_img:
+            rect = self.espiritu_img.get_rect(center=self.espiritu_pos)
+            if self.has_sentado:
+                # La línea fantasmal hasta la silla
+                line = pygame.Rect(self.espiritu_pos, (0, 0))
+                line.union_ip(pygame.Rect(self.silla_pos, (0, 0)))
+                rect.union_ip(line.inflate(8, 8))
+        d.track("espiritu", rect, self.has_sentado)
+        if self.has_sentado and self.daniela_sentada_img:
+            rect = self.daniela_sentada_img.get_rect(center=self.silla_pos)
+        elif not self.has_sentado:
+            center = self.lerp_center("daniela_pos")
+            rect = self.daniela.rect(self.daniela_state, center) or pygame.Rect(0, 0, 80, 80).move(center[0] - 40, center[1] - 40)
+        else:
+            rect = None
+        d.track("daniela", rect, (self.has_sentado, self.daniela_state, self.facing_right))
+        exit_rect = pygame.Rect((WIDTH - 80, HEIGHT // 2 - 50), self.font.size("SALIR →"))
+        d.track("salida", exit_rect, self.is_huyendo)
+        d.track("dialogo", *self.dialogue_box.dirty_region(self.current_speaker, self.current_dialogue, self.can_skip))
+        d.track("stats", *self.stats_display.dirty_region())
+        return d.collect()
+
     def draw(self, screen, game_state):
         surf = screen
         
         # Pantalla negra inicial
         if self.show_black_screen:
             surf.fill((0, 0, 0))
-            title_font = pygame.font.SysFont("arial", 48, bold=True)
-            title = title_font.render(self.black_screen_text, True, (255, 255, 255))
+            title_font = get_font("arial", 48, bold=True)
+            title = render_text(title_font, self.black_screen_text, True, (255, 255, 255))
             surf.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 50))
             return
         
-        # Fondo del aula
-        surf.blit(self.bg, (0, 0))
+        # Fondo del aula y silla en un solo blit
+        self.layer.draw(surf)
 
-        # Dibujar silla (siempre visible, ENORME)
-        if self.silla_img:
-            silla_rect = self.silla_img.get_rect(center=self.silla_pos)
-            surf.blit(self.silla_img, silla_rect)
-            
-            # Indicador de interacción si está cerca y puede sentarse
-            if self.can_move and not self.has_sentado:
-                silla_center = pygame.Vector2(self.silla_pos)
-                distancia = silla_center.distance_to(self.daniela_pos)
-                if distancia < 150:  # Mayor tolerancia para silla más grande
-                    # Solo un efecto visual sutil (sin texto)
-                    highlight = pygame.Surface((self.silla_zone.width, self.silla_zone.height), pygame.SRCALPHA)
-                    highlight.fill((255, 255, 0, 50))  # Amarillo semi-transparente
-                    surf.blit(highlight, self.silla_zone.topleft)
+        if self.silla_highlighted():
+            # Solo un efecto visual sutil (sin texto)
+            highlight = get_overlay(self.silla_zone.size, (255, 255, 0, 50))  # Amarillo semi-transparente
+            surf.blit(highlight, self.silla_zone.topleft)
 
         # Dibujar espíritu (EN MOVIMIENTO)
         if self.espiritu_visible and self.espiritu_img:
@@ -381,19 +415,15 @@ class EscuelaScene(Scene):
             surf.blit(self.daniela_sentada_img, sentada_rect)
         elif not self.has_sentado:
             # Daniela de pie y moviéndose
-            current_sprite = self.daniela_states.get(self.daniela_state)
-            if current_sprite:
-                # Voltear sprite si mira hacia la derecha
-                if self.facing_right:
-                    current_sprite = pygame.transform.flip(current_sprite, True, False)
-                surf.blit(current_sprite, current_sprite.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y))))
-            else:
+            # Espejada si mira hacia la derecha
+            center = self.lerp_center("daniela_pos")
+            if not self.daniela.draw(surf, self.daniela_state, center, mirrored=self.facing_right):
                 # Placeholder
-                pygame.draw.circle(surf, (0, 0, 255), (int(self.daniela_pos.x), int(self.daniela_pos.y)), 40)
+                pygame.draw.circle(surf, (0, 0, 255), center, 40)
 
         # Dibujar zona de salida cuando esté huyendo
         if self.is_huyendo:
-            exit_text = self.font.render("SALIR →", True, (255, 0, 0))
+            exit_text = render_text(self.font, "SALIR →", True, (255, 0, 0))
             surf.blit(exit_text, (WIDTH - 80, HEIGHT // 2 - 50))
 
         # Dibujar diálogo
@@ -403,52 +433,5 @@ class EscuelaScene(Scene):
         self.stats_display.draw(surf)
 
     def draw_dialogue_with_speaker(self, screen):
-        if not self.current_dialogue:
-            return
-            
-        box_width = WIDTH - 100
-        box_height = 100
-        box_x = 50
-        box_y = HEIGHT - box_height - 20
-        
-        pygame.draw.rect(screen, (0, 0, 0, 200), (box_x, box_y, box_width, box_height))
-        pygame.draw.rect(screen, (255, 255, 255), (box_x, box_y, box_width, box_height), 2)
-        
-        if self.current_speaker:
-            if self.current_speaker == "Daniela":
-                speaker_color = (0, 200, 255)
-            elif self.current_speaker == "Espíritu":
-                speaker_color = (255, 100, 100)
-            elif self.current_speaker == "Narrador":
-                speaker_color = (200, 200, 100)
-            else:
-                speaker_color = (255, 255, 255)
-            
-            speaker_text = self.speaker_font.render(self.current_speaker, True, speaker_color)
-            screen.blit(speaker_text, (box_x + 10, box_y - 30))
-        
-        words = self.current_dialogue.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_width = self.font.size(test_line)[0]
-            
-            if test_width <= box_width - 40:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        for i, line in enumerate(lines):
-            if i < 3:
-                text_surf = self.font.render(line, True, (255, 255, 255))
-                screen.blit(text_surf, (box_x + 20, box_y + 15 + i * 30))
-        
-        if self.can_skip:
-            skip_text = self.font.render("Clic para continuar", True, (200, 200, 200))
-            screen.blit(skip_text, (box_x + box_width - skip_text.get_width() - 20, box_y + box_height - 30))
\ No newline at end of file
+        """Dibuja el diálogo con el nombre del hablante arriba"""
+        self.dialogue_box.draw(screen, self.current_speaker, self.current_dialogue, self.can_skip)
@@ -1,22 +1,28 @@
 import pygame
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.fonts import get_font, render_text
 from engine.narrator import Narrator
 from engine.ui import StatsDisplay
 
 class ForestScene(Scene):
+    successors = ("scenes.title.TitleScene",)
+    preload = (
+        image_key("assets/images/forest_bg.png", (WIDTH, HEIGHT), alpha=False),
+    )
+
     def __init__(self, manager, state, audio):
         super().__init__(manager)
         self.state = state
         self.audio = audio
-        self.font = pygame.font.SysFont("arial", 28)
+        self.font = get_font("arial", 28)
         self.narrator = Narrator(self.font)
         self.stats_display = StatsDisplay(state)
         
         # Cargar fondo del parque
         try:
-            self.bg = pygame.image.load("assets/images/forest_bg.png").convert()
-            self.bg = pygame.transform.smoothscale(self.bg, (WIDTH, HEIGHT))
+            self.bg = load_image("assets/images/forest_bg.png", (WIDTH, HEIGHT), alpha=False)
         except:
             self.bg = pygame.Surface((WIDTH, HEIGHT))
             self.bg.fill((100, 150, 100))
@@ -37,11 +43,11 @@ class ForestScene(Scene):
         surf = screen
         surf.blit(self.bg, (0, 0))
         
-        title = self.font.render("ESCENA 2: EL PARQUE", True, PALETTE["ink"])
+        title = render_text(self.font, "ESCENA 2: EL PARQUE", True, PALETTE["ink"])
         title_rect = title.get_rect(center=(WIDTH//2, HEIGHT//2))
         surf.blit(title, title_rect)
         
-        instruction = self.font.render("Presiona ESC para volver al menú", True, PALETTE["ink"])
+        instruction = render_text(self.font, "Presiona ESC para volver al menú", True, PALETTE["ink"])
         instruction_rect = instruction.get_rect(center=(WIDTH//2, HEIGHT//2 + 50))
         surf.blit(instruction, instruction_rect)
         
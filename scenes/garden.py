@@ -1,43 +1,65 @@
 import pygame
 import random
+import numpy as np
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.atlas import atlas_keys
+from engine.fonts import get_font
 from engine.narrator import Narrator
 from engine.ui import StatsDisplay
+from engine.dialogue import DialogueBox, next_page
+from engine.layers import StaticLayer
+from engine.dirty import DirtyTracker
+from engine.surfaces import get_fade
+from engine.entities import EntityStore, ACTIVE
+from engine.placement import poisson_disk
+from engine.spatial import SpatialHash
+from game.actor import CharacterSprite
 
 class GardenScene(Scene):
+    successors = ("scenes.tarot_acep.TarotAcepScene", "scenes.tarot_rechas.TarotRechasScene", "scenes.title.TitleScene")
+    interpolated = ("daniela_pos",)   # se dibuja interpolada entre pasos
+    preload = (
+        image_key("assets/images/forest_glitter.png", (WIDTH, HEIGHT), alpha=False),
+        *atlas_keys((120, 240)),
+        image_key("assets/images/espiritu1_npc.png", (100, 150)),
+        image_key("assets/images/espiritu2_npc.png", (100, 150)),
+        image_key("assets/images/fantasma_limpio1_npc.png", (100, 150)),
+        image_key("assets/images/fantasma_limpio2_npc.png", (100, 150)),
+        image_key("assets/images/fantasma_limpio3_npc.png", (100, 150)),
+        image_key("assets/images/oscuridad_icon.png", (80, 80)),
+    )
+    POSES = {"quieta": "parada_frente", "escuchando": "agachada"}   # estado -> pose del atlas
+    SPIRIT_RADIUS = 50
+    DARKNESS_RADIUS = 40
+    REACH = 200   # distancia máxima de Daniela para interactuar
+    NEAR = 100    # distancia a la que reacciona a lo que tiene cerca
+    SPACING = 150  # separación mínima entre espíritus
+    # Banderas propias de los espíritus (además de ACTIVE y HOVERED)
+    LISTENED = 1 << 4
+    CLEANED = 1 << 5
+
     def __init__(self, manager, game_state, audio):
         super().__init__(manager)
         self.game_state = game_state
         self.audio = audio
-        self.font = pygame.font.SysFont("arial", 28)
-        self.speaker_font = pygame.font.SysFont("arial", 24, bold=True)
+        self.font = get_font("arial", 28)
+        self.speaker_font = get_font("arial", 24, bold=True)
         self.narrator = Narrator(self.font)
         self.stats_display = StatsDisplay(game_state)
+        self.dialogue_box = DialogueBox(self.font, self.speaker_font, default_color=(200, 150, 255), translucent=True)
+        self.dirty = DirtyTracker()
 
         # Cargar fondo
         try:
-            self.bg = pygame.image.load("assets/images/forest_glitter.png").convert()
-            self.bg = pygame.transform.smoothscale(self.bg, (WIDTH, HEIGHT))
+            self.bg = load_image("assets/images/forest_glitter.png", (WIDTH, HEIGHT), alpha=False)
         except:
             self.bg = pygame.Surface((WIDTH, HEIGHT))
             self.bg.fill((30, 60, 40))
 
-        # Cargar imágenes de Daniela
-        self.daniela_sprites = {}
-        sprite_files = {
-            "quieta": "parada_frente_pr.png",
-            "caminando": "caminando_pr.png",
-            "asustada": "asustada_pr.png",
-            "escuchando": "agachada_pr.png"
-        }
-        
-        for name, file in sprite_files.items():
-            try:
-                img = pygame.image.load(f"assets/images/{file}").convert_alpha()
-                self.daniela_sprites[name] = pygame.transform.smoothscale(img, (120, 240))
-            except:
-                pass
+        # Poses de Daniela (del atlas compartido)
+        self.daniela = CharacterSprite((120, 240))
 
         # Cargar imágenes de espíritus y oscuridades
         self.load_images()
@@ -72,12 +94,10 @@ class GardenScene(Scene):
         # Espíritus afectados
         self.spirit_affected_images = []
         try:
-            esp1 = pygame.image.load("assets/images/espiritu1_npc.png").convert_alpha()
-            esp1 = pygame.transform.smoothscale(esp1, (100, 150))
+            esp1 = load_image("assets/images/espiritu1_npc.png", (100, 150))
             self.spirit_affected_images.append(esp1)
             
-            esp2 = pygame.image.load("assets/images/espiritu2_npc.png").convert_alpha()
-            esp2 = pygame.transform.smoothscale(esp2, (100, 150))
+            esp2 = load_image("assets/images/espiritu2_npc.png", (100, 150))
             self.spirit_affected_images.append(esp2)
         except:
             pass
@@ -86,16 +106,14 @@ class GardenScene(Scene):
         self.spirit_cleaned_images = []
         for i in range(1, 4):
             try:
-                img = pygame.image.load(f"assets/images/fantasma_limpio{i}_npc.png").convert_alpha()
-                img = pygame.transform.smoothscale(img, (100, 150))
+                img = load_image(f"assets/images/fantasma_limpio{i}_npc.png", (100, 150))
                 self.spirit_cleaned_images.append(img)
             except:
                 pass
         
         # Oscuridad
         try:
-            self.darkness_image = pygame.image.load("assets/images/oscuridad_icon.png").convert_alpha()
-            self.darkness_image = pygame.transform.smoothscale(self.darkness_image, (80, 80))
+            self.darkness_image = load_image("assets/images/oscuridad_icon.png", (80, 80))
         except:
             self.darkness_image = None
 
@@ -103,8 +121,10 @@ class GardenScene(Scene):
         """Inicializa todos los elementos del juego"""
         # Número de elementos
         self.num_spirits = 8
-        self.spirits = []
-        self.darknesses = []
+        # Posiciones, radios y banderas en arrays (engine/entities.py);
+        # diálogos e índices de imagen en .data
+        self.spirits = EntityStore()
+        self.darknesses = EntityStore()
         
         # Contadores
         self.spirits_listened = 0
@@ -137,66 +157,70 @@ class GardenScene(Scene):
         
         # Crear espíritus y oscuridades
         self.create_spirits_and_darknesses()
+        self.build_layer()
+
+    def build_layer(self):
+        """Aplana el fondo, las oscuridades y los espíritus (no se mueven)"""
+        self.layer = StaticLayer()
+        self.layer.add("bg", self.bg)
+        visible = set(self.darknesses.indices().tolist())
+        for i in range(len(self.darknesses)):
+            self.layer.add(("oscuridad", i), self.darkness_image, self.darknesses.position(i),
+                           visible=i in visible, center=True)
+        for i in self.spirits.indices().tolist():
+            img = self.spirit_image(i)
+            self.layer.add(("espiritu", i), img, self.spirits.position(i), visible=img is not None, center=True)
+
+    def spirit_image(self, i):
+        """Imagen del espíritu según si ya fue limpiado"""
+        data = self.spirits.data[i]
+        if self.spirits.has(i, self.CLEANED) and self.spirit_cleaned_images:
+            return self.spirit_cleaned_images[data["cleaned_image_index"]]
+        elif self.spirit_affected_images:
+            return self.spirit_affected_images[data["affected_image_index"]]
+        return None
 
     def create_spirits_and_darknesses(self):
-        """Crea los espíritus y oscuridades en posiciones aleatorias"""
-        used_positions = []
-        
-        for i in range(self.num_spirits):
-            # Encontrar posición para espíritu
-            attempts = 0
-            while attempts < 50:
-                x = random.randint(100, WIDTH - 100)
-                y = random.randint(100, HEIGHT - 200)
-                pos = pygame.Vector2(x, y)
-                
-                # Verificar que no esté demasiado cerca de otras posiciones
-                too_close = False
-                for other_pos in used_positions:
-                    if pos.distance_to(other_pos) < 150:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    used_positions.append(pos)
-                    
-                    # Crear espíritu
-                    spirit = {
-                        "pos": pos,
-                        "radius": 50,
-                        "active": True,
-                        "hovered": False,
-                        "listened": False,
-                        "cleaned": False,
-                        "affected_image_index": i % 2 if self.spirit_affected_images else 0,
-                        "cleaned_image_index": random.randint(0, len(self.spirit_cleaned_images)-1) if self.spirit_cleaned_images else 0,
-                        "dialogue": self.spirit_dialogues[i % len(self.spirit_dialogues)],
-                        "can_be_cleaned": True
-                    }
-                    self.spirits.append(spirit)
-                    
-                    # Crear oscuridad cerca del espíritu
-                    offset_x = random.choice([-80, -60, 60, 80])
-                    offset_y = random.choice([-80, -60, 60, 80])
-                    darkness_pos = pygame.Vector2(
-                        max(50, min(WIDTH - 50, x + offset_x)),
-                        max(50, min(HEIGHT - 50, y + offset_y))
-                    )
-                    
-                    darkness = {
-                        "pos": darkness_pos,
-                        "radius": 40,
-                        "active": True,
-                        "hovered": False,
-                        "spirit_index": i,
-                        "dialogue": self.darkness_dialogues[i % len(self.darkness_dialogues)]
-                    }
-                    self.darknesses.append(darkness)
-                    
-                    used_positions.append(darkness_pos)
-                    break
-                
-                attempts += 1
+        """Reparte los espíritus (Poisson por disco) y pone cada oscuridad cerca del suyo"""
+        # Donde puede caer el centro de un espíritu, sin tapar el panel de estadísticas
+        bounds = pygame.Rect(100, 100, WIDTH - 200, HEIGHT - 300)
+        panel = self.stats_display.dirty_region()[0]
+        positions = poisson_disk(self.num_spirits, self.SPACING, bounds,
+                                 exclude=[panel.inflate(100, 150)], rng=random)
+        spirits_grid = SpatialHash(self.SPACING)
+        for i, (x, y) in enumerate(positions):
+            spirits_grid.insert(i, (x, y))
+        darkness_grid = SpatialHash(self.SPACING)
+        
+        for i, (x, y) in enumerate(positions):
+            pos = pygame.Vector2(x, y)
+            
+            # Crear espíritu
+            self.spirits.add(
+                pos, self.SPIRIT_RADIUS,
+                affected_image_index=i % 2 if self.spirit_affected_images else 0,
+                cleaned_image_index=random.randint(0, len(self.spirit_cleaned_images)-1) if self.spirit_cleaned_images else 0,
+                dialogue=self.spirit_dialogues[i % len(self.spirit_dialogues)],
+                can_be_cleaned=True,
+            )
+            
+            # Crear oscuridad cerca del espíritu, del lado donde no pise a otro
+            offsets = [(ox, oy) for ox in (-80, -60, 60, 80) for oy in (-80, -60, 60, 80)]
+            random.shuffle(offsets)
+            candidates = [pygame.Vector2(max(50, min(WIDTH - 50, x + ox)), max(50, min(HEIGHT - 50, y + oy)))
+                          for ox, oy in offsets]
+            darkness_pos = next((c for c in candidates
+                                 if spirits_grid.query(c, self.SPIRIT_RADIUS + self.DARKNESS_RADIUS) in ([], [i])
+                                 and not darkness_grid.any_within(c, 2 * self.DARKNESS_RADIUS)
+                                 and not panel.inflate(80, 80).collidepoint(c)),
+                                candidates[0])
+            darkness_grid.insert(i, darkness_pos)
+            
+            self.darknesses.add(
+                darkness_pos, self.DARKNESS_RADIUS,
+                spirit_index=i,
+                dialogue=self.darkness_dialogues[i % len(self.darkness_dialogues)],
+            )
 
     def on_enter(self):
         self.show_dialogue("Daniela", "El Jardín de los Susurros... veo espíritus atrapados en la oscuridad. ¿Debería escucharlos o limpiar las sombras?")
@@ -213,7 +237,7 @@ class GardenScene(Scene):
         if self.state != "JUGANDO":
             # Permitir clic para saltar diálogo inicial
             if self.state == "ENTRADA" and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.current_dialogue and self.can_skip:
+                if self.current_dialogue and self.can_skip and not next_page(self):
                     self.current_dialogue = None
                     self.current_speaker = None
                     self.state = "JUGANDO"
@@ -221,7 +245,7 @@ class GardenScene(Scene):
             
             # Permitir clic para saltar diálogo final
             if self.state == "FINAL" and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.current_dialogue and self.can_skip:
+                if self.current_dialogue and self.can_skip and not next_page(self):
                     self.current_dialogue = None
                     self.current_speaker = None
                     # Comenzar transición inmediatamente
@@ -230,9 +254,16 @@ class GardenScene(Scene):
             
             return
         
+        # Hover sobre espíritus y oscuridades (todas a la vez, con arrays)
+        if event.type == pygame.MOUSEMOTION:
+            self.spirits.update_hover(event.pos, exclude=self.LISTENED)
+            self.darknesses.update_hover(event.pos)
+        
         # Manejar clic en diálogo
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.can_skip and self.current_dialogue:
+                if next_page(self):
+                    return
                 self.current_dialogue = None
                 self.current_speaker = None
                 self.dialogue_cooldown = 0.5
@@ -266,55 +297,56 @@ class GardenScene(Scene):
 
     def handle_spirit_click(self, mouse_pos, game_state):
         """Maneja clic en espíritus"""
-        for i, spirit in enumerate(self.spirits):
-            if spirit["active"] and not spirit["listened"]:
-                distance_to_spirit = spirit["pos"].distance_to(mouse_pos)
-                distance_to_daniela = spirit["pos"].distance_to(self.daniela_pos)
-                
-                if distance_to_spirit < spirit["radius"] and distance_to_daniela < 200:
-                    # Escuchar al espíritu
-                    spirit["listened"] = True
-                    self.spirits_listened += 1
-                    
-                    game_state.add_duality("rejection_understanding", 20)
-                    self.show_dialogue("Espíritu", spirit["dialogue"])
-                    
-                    return True
-        return False
+        # Espíritus sin escuchar bajo el cursor y al alcance de Daniela
+        clicked = self.spirits.within(mouse_pos, exclude=self.LISTENED)
+        in_reach = self.spirits.within(self.daniela_pos, self.REACH, exclude=self.LISTENED)
+        hits = clicked[np.isin(clicked, in_reach)]
+        if not len(hits):
+            return False
+        i = int(hits[0])
+        # Escuchar al espíritu
+        self.spirits.set(i, self.LISTENED)
+        self.spirits_listened += 1
+        
+        game_state.add_duality("rejection_understanding", 20)
+        self.show_dialogue("Espíritu", self.spirits.data[i]["dialogue"])
+        
+        return True
 
     def handle_darkness_click(self, mouse_pos, game_state):
         """Maneja clic en oscuridades"""
-        for darkness in self.darknesses:
-            if darkness["active"]:
-                distance_to_darkness = darkness["pos"].distance_to(mouse_pos)
-                distance_to_daniela = darkness["pos"].distance_to(self.daniela_pos)
-                
-                if distance_to_darkness < darkness["radius"] and distance_to_daniela < 200:
-                    # Limpiar oscuridad
-                    darkness["active"] = False
-                    self.darknesses_cleaned += 1
-                    
-                    # Obtener espíritu asociado
-                    spirit_index = darkness["spirit_index"]
-                    spirit = self.spirits[spirit_index]
-                    
-                    if spirit["listened"] and not spirit["cleaned"]:
-                        # Limpiar espíritu
-                        spirit["cleaned"] = True
-                        self.spirits_cleaned += 1
-                        game_state.add_duality("rejection_understanding", 15)
-                        self.show_dialogue("Daniela", "La oscuridad se disipa... el espíritu recupera su forma.")
-                    else:
-                        # No escuchó al espíritu - SOLO afecta rechazo/comprensión
-                        game_state.add_duality("rejection_understanding", -15)
-                        self.show_dialogue("Daniela", darkness["dialogue"])
-                    
-                    # Verificar si se limpiaron todas las oscuridades
-                    if self.darknesses_cleaned >= self.num_spirits:
-                        self.end_game(game_state)
-                    
-                    return True
-        return False
+        clicked = self.darknesses.within(mouse_pos)
+        in_reach = self.darknesses.within(self.daniela_pos, self.REACH)
+        hits = clicked[np.isin(clicked, in_reach)]
+        if not len(hits):
+            return False
+        i = int(hits[0])
+        darkness = self.darknesses.data[i]
+        # Limpiar oscuridad
+        self.darknesses.set(i, ACTIVE, False)
+        self.darknesses_cleaned += 1
+        self.layer.set_visible(("oscuridad", i), False)
+        
+        # Obtener espíritu asociado
+        spirit_index = darkness["spirit_index"]
+        
+        if self.spirits.has(spirit_index, self.LISTENED) and not self.spirits.has(spirit_index, self.CLEANED):
+            # Limpiar espíritu
+            self.spirits.set(spirit_index, self.CLEANED)
+            self.spirits_cleaned += 1
+            self.layer.set_image(("espiritu", spirit_index), self.spirit_image(spirit_index))
+            game_state.add_duality("rejection_understanding", 15)
+            self.show_dialogue("Daniela", "La oscuridad se disipa... el espíritu recupera su forma.")
+        else:
+            # No escuchó al espíritu - SOLO afecta rechazo/comprensión
+            game_state.add_duality("rejection_understanding", -15)
+            self.show_dialogue("Daniela", darkness["dialogue"])
+        
+        # Verificar si se limpiaron todas las oscuridades
+        if self.darknesses_cleaned >= self.num_spirits:
+            self.end_game(game_state)
+        
+        return True
 
     def update(self, dt, game_state):
         if self.dialogue_cooldown > 0:
@@ -372,21 +404,11 @@ class GardenScene(Scene):
         new_state = "quieta"
         
         # Verificar cercanía a espíritus no escuchados (distancia más pequeña para que sea más preciso)
-        for spirit in self.spirits:
-            if spirit["active"] and not spirit["listened"]:
-                distance = spirit["pos"].distance_to(self.daniela_pos)
-                if distance < 100:
-                    new_state = "escuchando"
-                    break
-        
+        if self.spirits.nearest(self.daniela_pos, self.NEAR, exclude=self.LISTENED) is not None:
+            new_state = "escuchando"
         # Si no encontró espíritu cerca, verificar oscuridades
-        if new_state == "quieta":
-            for darkness in self.darknesses:
-                if darkness["active"]:
-                    distance = darkness["pos"].distance_to(self.daniela_pos)
-                    if distance < 100:
-                        new_state = "asustada"
-                        break
+        elif self.darknesses.nearest(self.daniela_pos, self.NEAR) is not None:
+            new_state = "asustada"
         
         # Actualizar estado
         self.daniela_state = new_state
@@ -419,10 +441,10 @@ class GardenScene(Scene):
         if not hasattr(game_state, 'flags'):
             game_state.flags = {}
         
-        game_state.flags["jardin_decision"] = self.decision_made
-        game_state.flags["espiritus_escuchados"] = self.spirits_listened
-        game_state.flags["oscuridades_limpiadas"] = self.darknesses_cleaned
-        game_state.flags["espiritus_limpiados"] = self.spirits_cleaned
+        game_state.set_flag("jardin_decision", self.decision_made)
+        game_state.set_flag("espiritus_escuchados", self.spirits_listened)
+        game_state.set_flag("oscuridades_limpiadas", self.darknesses_cleaned)
+        game_state.set_flag("espiritus_limpiados", self.spirits_cleaned)
         
         # DEBUG: Mostrar lo que se guardó
         print(f"DEBUG: Guardando decisión: {self.decision_made}")
@@ -474,55 +496,47 @@ class GardenScene(Scene):
             from scenes.title import TitleScene
             self.manager.replace(TitleScene(self.manager))
 
+    def daniela_pose(self):
+        """(pose del atlas, espejada) según el estado de Daniela"""
+        pose = self.POSES.get(self.daniela_state, self.daniela_state)
+        if not self.daniela.has(pose):
+            pose = "parada_frente"
+        # CORRECCIÓN: la imagen original mira hacia la izquierda, así que
+        # con facing_right=True se usa la variante espejada.
+        # Los estados especiales (asustada, escuchando) no se voltean
+        flip = self.facing_right and self.daniela_state not in ("asustada", "escuchando")
+        return pose, flip
+
+    def dirty_rects(self, game_state):
+        d = self.dirty
+        # Espíritus y oscuridades: cambian con las banderas (hover, escuchado,
+        # limpiado, activa)
+        for i, flags in enumerate(self.spirits.flags.tolist()):
+            d.track(("espiritu", i), self.layer.rect(("espiritu", i)), flags)
+        for i, flags in enumerate(self.darknesses.flags.tolist()):
+            d.track(("oscuridad", i), self.layer.rect(("oscuridad", i)), flags)
+        pose, flip = self.daniela_pose()
+        center = self.lerp_center("daniela_pos")
+        rect = self.daniela.rect(pose, center) or pygame.Rect(0, 0, 60, 60).move(center[0] - 30, center[1] - 30)
+        d.track("daniela", rect, (pose, flip))
+        d.track("stats", *self.stats_display.dirty_region())
+        d.track("dialogo", *self.dialogue_box.dirty_region(self.current_speaker, self.current_dialogue, self.can_skip))
+        # El fundido final cubre toda la pantalla
+        fading = self.state == "FINAL" and self.transition_timer > 0
+        d.track("fundido", (0, 0, WIDTH, HEIGHT) if fading else None,
+                int(255 * (1 - self.transition_timer / 2.0)) if fading else None)
+        return d.collect()
+
     def draw(self, screen, game_state):
-        # Dibujar fondo
-        screen.blit(self.bg, (0, 0))
-        
-        # Dibujar oscuridades
-        for darkness in self.darknesses:
-            if darkness["active"] and self.darkness_image:
-                darkness_rect = self.darkness_image.get_rect(center=(int(darkness["pos"].x), int(darkness["pos"].y)))
-                screen.blit(self.darkness_image, darkness_rect)
-        
-        # Dibujar espíritus
-        for spirit in self.spirits:
-            if spirit["active"]:
-                # Determinar qué imagen usar
-                if spirit["cleaned"] and self.spirit_cleaned_images:
-                    img = self.spirit_cleaned_images[spirit["cleaned_image_index"]]
-                elif self.spirit_affected_images:
-                    img = self.spirit_affected_images[spirit["affected_image_index"]]
-                else:
-                    continue
-                
-                if img:
-                    img_rect = img.get_rect(center=(int(spirit["pos"].x), int(spirit["pos"].y)))
-                    screen.blit(img, img_rect)
+        # Fondo, oscuridades y espíritus en un solo blit
+        self.layer.draw(screen)
         
         # Dibujar Daniela - CORRECCIÓN DE DIRECCIÓN
-        current_sprite = self.daniela_sprites.get(self.daniela_state, self.daniela_sprites.get("quieta"))
-        if current_sprite:
-            # CORRECCIÓN: Voltear sprite cuando mira hacia la izquierda (dirección contraria)
-            # Si se mueve hacia la derecha (facing_right=True), la imagen original mira hacia la izquierda
-            # Entonces volteamos la imagen cuando facing_right=True para que mire hacia la derecha
-            if self.daniela_state == "caminando":
-                # Si está caminando, voltear según la dirección
-                if self.facing_right:
-                    # Si mira hacia la derecha, voltear horizontalmente para que mire a la derecha
-                    current_sprite = pygame.transform.flip(current_sprite, True, False)
-            elif self.daniela_state in ["asustada", "escuchando"]:
-                # Estados especiales no se voltean
-                pass
-            else:
-                # Estados normales, voltear según facing_right
-                if self.facing_right:
-                    current_sprite = pygame.transform.flip(current_sprite, True, False)
-            
-            sprite_rect = current_sprite.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y)))
-            screen.blit(current_sprite, sprite_rect)
-        else:
+        pose, flip = self.daniela_pose()
+        center = self.lerp_center("daniela_pos")
+        if not self.daniela.draw(screen, pose, center, mirrored=flip):
             # Fallback si no hay sprites
-            pygame.draw.circle(screen, (0, 0, 255), (int(self.daniela_pos.x), int(self.daniela_pos.y)), 30)
+            pygame.draw.circle(screen, (0, 0, 255), center, 30)
         
         # Dibujar estadísticas
         self.stats_display.draw(screen)
@@ -537,52 +551,7 @@ class GardenScene(Scene):
 
     def draw_dialogue(self, screen):
         """Dibuja el cuadro de diálogo"""
-        box_width = WIDTH - 100
-        box_height = 100
-        box_x = 50
-        box_y = HEIGHT - box_height - 20
-        
-        # Fondo del diálogo
-        dialogue_bg = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        dialogue_bg.fill((0, 0, 0, 200))
-        screen.blit(dialogue_bg, (box_x, box_y))
-        pygame.draw.rect(screen, (255, 255, 255), (box_x, box_y, box_width, box_height), 2)
-        
-        # Nombre del hablante
-        if self.current_speaker:
-            color = (0, 200, 255) if self.current_speaker == "Daniela" else (200, 150, 255)
-            speaker_text = self.speaker_font.render(self.current_speaker, True, color)
-            screen.blit(speaker_text, (box_x + 10, box_y - 30))
-        
-        # Texto del diálogo
-        words = self.current_dialogue.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_width = self.font.size(test_line)[0]
-            
-            if test_width <= box_width - 40:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        # Dibujar máximo 3 líneas
-        for i, line in enumerate(lines[:3]):
-            text_surf = self.font.render(line, True, (255, 255, 255))
-            screen.blit(text_surf, (box_x + 20, box_y + 15 + i * 30))
-        
-        # Indicador para continuar
-        if self.can_skip:
-            skip_text = self.font.render("Clic para continuar", True, (200, 200, 200))
-            skip_x = box_x + box_width - skip_text.get_width() - 20
-            skip_y = box_y + box_height - 30
-            screen.blit(skip_text, (skip_x, skip_y))
+        self.dialogue_box.draw(screen, self.current_speaker, self.current_dialogue, self.can_skip)
 
     def draw_final_transition(self, screen):
         """Dibuja la transición final"""
@@ -590,6 +559,5 @@ class GardenScene(Scene):
             # Fade out gradual
             alpha = int(255 * (1 - self.transition_timer / 2.0))
             if alpha > 0:
-                overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, alpha))
-                screen.blit(overlay, (0, 0))
\ No newline at end of file
+                # Una sola Surface opaca; solo cambia su alpha
+                screen.blit(get_fade((WIDTH, HEIGHT), (0, 0, 0), alpha), (0, 0))
\ No newline at end of file
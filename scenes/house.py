@@ -1,49 +1,50 @@
 import pygame
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.atlas import atlas_keys
+from engine.fonts import get_font
 from engine.narrator import Narrator
 from engine.ui import StatsDisplay
+from engine.dialogue import DialogueBox, next_page
+from engine.dirty import DirtyTracker
+from engine.layers import StaticLayer
+from game.actor import CharacterSprite
 
 class HouseScene(Scene):
+    successors = ("scenes.kitchen.KitchenScene",)
+    interpolated = ("daniela_pos",)   # se dibuja interpolada entre pasos
+    POSES = {"en_cama": "dormida"}   # estado -> pose del atlas, cuando difieren
+    preload = (
+        image_key("assets/images/habitacion_bg.jpeg", (WIDTH, HEIGHT), alpha=False),
+        image_key("assets/images/cama_icon.png", (250, 180)),
+        *atlas_keys((120, 240)),
+        image_key("assets/images/anciana_fan_npc.png", (180, 280)),
+        image_key("assets/images/percha_con_uniforme.png", (130, 220)),
+        image_key("assets/images/percha_sin_uniforme.png", (130, 220)),
+        image_key("assets/images/puerta_icon.png", (200, 400)),
+    )
+
     def __init__(self, manager, state, audio):
         super().__init__(manager)
         self.state = state
         self.audio = audio
-        self.font = pygame.font.SysFont("arial", 28)
-        self.speaker_font = pygame.font.SysFont("arial", 24, bold=True)
+        self.font = get_font("arial", 28)
+        self.speaker_font = get_font("arial", 24, bold=True)
         self.narrator = Narrator(self.font)
         self.stats_display = StatsDisplay(state)
+        self.dialogue_box = DialogueBox(self.font, self.speaker_font)
+        self.dirty = DirtyTracker()
 
         # Cargar imágenes
-        self.bg = pygame.image.load("assets/images/habitacion_bg.jpeg").convert()
-        self.bg = pygame.transform.smoothscale(self.bg, (WIDTH, HEIGHT))
+        self.bg = load_image("assets/images/habitacion_bg.jpeg", (WIDTH, HEIGHT), alpha=False)
         
         # Cama sin deformar
-        self.cama_icon = pygame.image.load("assets/images/cama_icon.png").convert_alpha()
-        self.cama_icon = pygame.transform.smoothscale(self.cama_icon, (250, 180))
+        self.cama_icon = load_image("assets/images/cama_icon.png", (250, 180))
 
-        # Estados de Daniela - volteamos las imágenes problemáticas al cargarlas
-        self.daniela_states = {}
-        sprites = {
-            "en_cama": "dormida_pr.png",
-            "parada_pijama": "parada_pijama_pr.png", 
-            "corriendo_pijama": "corriendo_pijama_pr.png",
-            "parada_frente": "parada_frente_pr.png",
-            "parada_costado": "parada_costado_pr.png",  # Esta la volteamos
-            "caminando": "caminando_pr.png",           # Esta la volteamos
-            "corriendo": "corriendo_pr.png",
-            "asustada": "asustada_pr.png"
-        }
-        
-        for state, file in sprites.items():
-            try:
-                img = pygame.image.load(f"assets/images/{file}").convert_alpha()
-                # Voltear las imágenes que miran al lado incorrecto
-                if state in ["parada_costado", "caminando"]:
-                    img = pygame.transform.flip(img, True, False)
-                self.daniela_states[state] = pygame.transform.smoothscale(img, (120, 240))
-            except:
-                print(f"Error cargando: {file}")
+        # Poses de Daniela desde el atlas compartido; parada_costado y
+        # caminando miran al lado incorrecto, así que se usan espejadas
+        self.daniela = CharacterSprite((120, 240), flipped=("parada_costado", "caminando"))
 
         # Posiciones
         self.daniela_pos = pygame.Vector2(WIDTH - 640, HEIGHT - 370)
@@ -54,24 +55,35 @@ class HouseScene(Scene):
 
         # Cargar otros elementos
         try:
-            self.anciana = pygame.image.load("assets/images/anciana_fan_npc.png").convert_alpha()
-            self.anciana = pygame.transform.smoothscale(self.anciana, (180, 280))
+            self.anciana = load_image("assets/images/anciana_fan_npc.png", (180, 280))
         except:
             self.anciana = None
         
         # Placard más pequeño
         try:
-            self.placard_img = pygame.image.load("assets/images/percha_con_uniforme.png").convert_alpha()
-            self.placard_img = pygame.transform.smoothscale(self.placard_img, (130, 220))
+            self.placard_img = load_image("assets/images/percha_con_uniforme.png", (130, 220))
         except:
             self.placard_img = None
+
+        # Percha vacía (al vestirse); se pide ahora para no decodificarla en medio de la escena
+        try:
+            self.placard_vacio_img = load_image("assets/images/percha_sin_uniforme.png", (130, 220))
+        except:
+            self.placard_vacio_img = None
         
         try:
-            self.door_img = pygame.image.load("assets/images/puerta_icon.png").convert_alpha()
-            self.door_img = pygame.transform.smoothscale(self.door_img, (200, 400))
+            self.door_img = load_image("assets/images/puerta_icon.png", (200, 400))
         except:
             self.door_img = None
 
+        # Fondo y muebles aplanados; la cama aparece cuando se levanta
+        self.layer = StaticLayer()
+        self.layer.add("bg", self.bg)
+        self.layer.add("cama", self.cama_icon, (WIDTH - 640, HEIGHT - 370), visible=False, center=True)
+        self.layer.add("anciana", self.anciana, self.anciana_zone.topleft)
+        self.layer.add("placard", self.placard_img, self.placard_zone.topleft)
+        self.layer.add("puerta", self.door_img, self.door_zone.topleft)
+
         # Variables de control
         self.daniela_state = "en_cama"
         self.daniela_speed = 200
@@ -137,11 +149,13 @@ class HouseScene(Scene):
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dialogue_cooldown <= 0:
             if self.can_skip and self.current_dialogue:
                 # Si hay diálogo activo y se puede saltar, pasamos al siguiente
-                self.next_dialogue()
+                # (o a su página siguiente, si no entró en el cuadro)
+                if not next_page(self):
+                    self.next_dialogue()
                 return
 
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            current_time = pygame.time.get_ticks() / 1000.0
+            current_time = self.manager.time
             is_double_click = (current_time - self.last_click_time) < 0.3
             self.last_click_time = current_time
 
@@ -149,6 +163,7 @@ class HouseScene(Scene):
             if self.daniela_state == "en_cama" and not self.has_clicked_bed:
                 self.daniela_state = "parada_pijama"
                 self.has_clicked_bed = True
+                self.layer.set_visible("cama", True)
                 
                 # Mostrar primer diálogo inmediatamente
                 self.current_dialogue = "No está ahí. No ella está ahí."
@@ -238,11 +253,9 @@ class HouseScene(Scene):
                     self.show_dialogue("Daniela", "Listo, ya me puedo ir")
                     # Cambiar inmediatamente al sprite vestido
                     self.daniela_state = "parada_frente"
-                    try:
-                        self.placard_img = pygame.image.load("assets/images/percha_sin_uniforme.png").convert_alpha()
-                        self.placard_img = pygame.transform.smoothscale(self.placard_img, (130, 220))
-                    except:
-                        pass
+                    if self.placard_vacio_img:
+                        self.placard_img = self.placard_vacio_img
+                        self.layer.set_image("placard", self.placard_img)
 
                 # CAMBIO IMPORTANTE: Se eliminó la condición "and self.vestida"
                 if self.door_zone.collidepoint(self.daniela_pos) and not self.has_exited:
@@ -251,31 +264,28 @@ class HouseScene(Scene):
                     self.show_dialogue("Daniela", "Saliendo de la habitación...")
                     self.transition_timer = 1.5
 
-    def draw(self, screen, game_state):
-        surf = screen
-        surf.blit(self.bg, (0, 0))
+    def daniela_pose(self):
+        return self.POSES.get(self.daniela_state, self.daniela_state)
 
-        # Dibujar cama vacía
-        if self.daniela_state != "en_cama":
-            surf.blit(self.cama_icon, self.cama_icon.get_rect(center=(WIDTH - 640, HEIGHT - 370)))
+    def dirty_rects(self, game_state):
+        d = self.dirty
+        rect = self.daniela.rect(self.daniela_pose(), self.lerp_center("daniela_pos"))
+        d.track("daniela", rect, (self.daniela_state, self.facing_right))
+        d.track("cama", self.cama_icon.get_rect(center=(WIDTH - 640, HEIGHT - 370)), self.daniela_state != "en_cama")
+        d.track("placard", self.placard_zone, self.vestida)
+        d.track("dialogo", *self.dialogue_box.dirty_region(self.current_speaker, self.current_dialogue, self.can_skip))
+        d.track("stats", *self.stats_display.dirty_region())
+        return d.collect()
 
-        # Dibujar elementos
-        if self.anciana:
-            surf.blit(self.anciana, self.anciana_zone.topleft)
-        
-        if self.placard_img:
-            surf.blit(self.placard_img, self.placard_zone.topleft)
-        
-        if self.door_img:
-            surf.blit(self.door_img, self.door_zone.topleft)
+    def draw(self, screen, game_state):
+        surf = screen
+        # Fondo, cama, anciana, placard y puerta en un solo blit
+        self.layer.draw(surf)
 
         # Dibujar Daniela con volteo
-        current_sprite = self.daniela_states.get(self.daniela_state)
-        if current_sprite:
-            # Solo voltear si no está mirando a la derecha
-            if not self.facing_right:
-                current_sprite = pygame.transform.flip(current_sprite, True, False)
-            surf.blit(current_sprite, current_sprite.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y))))
+        # Variante espejada si no está mirando a la derecha
+        self.daniela.draw(surf, self.daniela_pose(), self.lerp_center("daniela_pos"),
+                          mirrored=not self.facing_right)
 
         # Dibujar diálogo con nombre del hablante
         self.draw_dialogue_with_speaker(surf)
@@ -284,55 +294,4 @@ class HouseScene(Scene):
     
     def draw_dialogue_with_speaker(self, screen):
         """Dibuja el diálogo con el nombre del hablante arriba"""
-        if not self.current_dialogue:
-            return
-            
-        # Dimensiones del cuadro de diálogo
-        box_width = WIDTH - 100
-        box_height = 100
-        box_x = 50
-        box_y = HEIGHT - box_height - 20
-        
-        # Dibujar cuadro de diálogo
-        pygame.draw.rect(screen, (0, 0, 0, 200), (box_x, box_y, box_width, box_height))
-        pygame.draw.rect(screen, (255, 255, 255), (box_x, box_y, box_width, box_height), 2)
-        
-        # Dibujar nombre del hablante arriba del cuadro
-        if self.current_speaker:
-            # Color según el hablante (solo Daniela en esta escena)
-            if self.current_speaker == "Daniela":
-                speaker_color = (0, 200, 255)  # Cyan para Daniela
-            else:
-                speaker_color = (255, 255, 255)  # Blanco por defecto
-            
-            speaker_text = self.speaker_font.render(self.current_speaker, True, speaker_color)
-            screen.blit(speaker_text, (box_x + 10, box_y - 30))
-        
-        # Dividir texto en líneas
-        words = self.current_dialogue.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_width = self.font.size(test_line)[0]
-            
-            if test_width <= box_width - 40:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        # Dibujar líneas de texto (máximo 3 líneas)
-        for i, line in enumerate(lines):
-            if i < 3:
-                text_surf = self.font.render(line, True, (255, 255, 255))
-                screen.blit(text_surf, (box_x + 20, box_y + 15 + i * 30))
-        
-        # Indicador de "clic para continuar" si se puede saltar
-        if self.can_skip:
-            skip_text = self.font.render("Clic para continuar", True, (200, 200, 200))
-            screen.blit(skip_text, (box_x + box_width - skip_text.get_width() - 20, box_y + box_height - 30))
\ No newline at end of file
+        self.dialogue_box.draw(screen, self.current_speaker, self.current_dialogue, self.can_skip)
@@ -1,25 +1,44 @@
 import pygame
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.atlas import atlas_keys
+from engine.fonts import get_font, render_text
 from engine.narrator import Narrator
 from engine.ui import StatsDisplay
+from engine.dialogue import DialogueBox, next_page
+from engine.dirty import DirtyTracker
+from engine.layers import StaticLayer
+from engine.surfaces import get_overlay
+from game.actor import CharacterSprite
 
 class KitchenScene(Scene):
+    successors = ("scenes.escuela.EscuelaScene", "scenes.tarot.TarotScene", "scenes.cuarto2.Cuarto2Scene", "scenes.title.TitleScene")
+    interpolated = ("daniela_pos",)   # se dibuja interpolada entre pasos
+    preload = (
+        image_key("assets/images/cocina_bg.png", (int(WIDTH * 0.9), int(HEIGHT * 0.9)), alpha=False),
+        image_key("assets/images/mesa_icon.png", (320, 240)),
+        image_key("assets/images/fantama_sentado_npc.png", (140, 210)),
+        *atlas_keys((120, 240)),
+        image_key("assets/images/desayuno_icon.png", (80, 80)),
+    )
+
     def __init__(self, manager, game_state, audio):
         super().__init__(manager)
         self.game_state = game_state
         self.audio = audio
-        self.font = pygame.font.SysFont("arial", 28)
-        self.speaker_font = pygame.font.SysFont("arial", 24, bold=True)
+        self.font = get_font("arial", 28)
+        self.speaker_font = get_font("arial", 24, bold=True)
         self.narrator = Narrator(self.font)
         self.stats_display = StatsDisplay(game_state)
+        self.dialogue_box = DialogueBox(self.font, self.speaker_font)
+        self.dirty = DirtyTracker()
 
         # Cargar imágenes
         try:
-            self.bg = pygame.image.load("assets/images/cocina_bg.png").convert()
             scaled_width = int(WIDTH * 0.9)
             scaled_height = int(HEIGHT * 0.9)
-            self.bg = pygame.transform.smoothscale(self.bg, (scaled_width, scaled_height))
+            self.bg = load_image("assets/images/cocina_bg.png", (scaled_width, scaled_height), alpha=False)
             self.bg_x = (WIDTH - scaled_width) // 2
             self.bg_y = (HEIGHT - scaled_height) // 2
         except:
@@ -30,85 +49,24 @@ class KitchenScene(Scene):
 
         # Mesa
         try:
-            self.mesa_img = pygame.image.load("assets/images/mesa_icon.png").convert_alpha()
-            self.mesa_img = pygame.transform.smoothscale(self.mesa_img, (320, 240))
+            self.mesa_img = load_image("assets/images/mesa_icon.png", (320, 240))
         except:
             self.mesa_img = None
 
         # Niño fantasma
         try:
-            self.nino_fantasma = pygame.image.load("assets/images/fantama_sentado_npc.png").convert_alpha()
-            self.nino_fantasma = pygame.transform.smoothscale(self.nino_fantasma, (140, 210))
+            self.nino_fantasma = load_image("assets/images/fantama_sentado_npc.png", (140, 210))
         except:
             self.nino_fantasma = None
 
-        # Estados de Daniela
-        self.daniela_sentada_states = {}
-        try:
-            img = pygame.image.load("assets/images/sentada_pijama_pr.png").convert_alpha()
-            img = pygame.transform.flip(img, True, False)
-            self.daniela_sentada_states["pijama"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            img = pygame.image.load("assets/images/sentada_pr.png").convert_alpha()
-            img = pygame.transform.flip(img, True, False)
-            self.daniela_sentada_states["vestida"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        self.daniela_estados_pie = {}
-        try:
-            img = pygame.image.load("assets/images/parada_pijama_pr.png").convert_alpha()
-            self.daniela_estados_pie["parada_pijama"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            img = pygame.image.load("assets/images/parada_frente_pr.png").convert_alpha()
-            self.daniela_estados_pie["parada_frente"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            img = pygame.image.load("assets/images/parada_costado_pr.png").convert_alpha()
-            img = pygame.transform.flip(img, True, False)
-            self.daniela_estados_pie["parada_costado"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            img = pygame.image.load("assets/images/caminando_pr.png").convert_alpha()
-            img = pygame.transform.flip(img, True, False)
-            self.daniela_estados_pie["caminando"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            img = pygame.image.load("assets/images/corriendo_pr.png").convert_alpha()
-            self.daniela_estados_pie["corriendo"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            img = pygame.image.load("assets/images/corriendo_pijama_pr.png").convert_alpha()
-            self.daniela_estados_pie["corriendo_pijama"] = pygame.transform.smoothscale(img, (120, 240))
-        except:
-            pass
-
-        try:
-            self.daniela_asustada = pygame.image.load("assets/images/asustada_pr.png").convert_alpha()
-            self.daniela_asustada = pygame.transform.smoothscale(self.daniela_asustada, (120, 240))
-        except:
-            self.daniela_asustada = None
+        # Poses de Daniela (todas salen del mismo atlas)
+        self.daniela = CharacterSprite((120, 240), flipped=("parada_costado", "caminando", "sentada", "sentada_pijama"))
 
         # Comida
         self.comida_zone = pygame.Rect(200, HEIGHT - 350, 100, 100)
         self.comida_img = None
         try:
-            self.comida_img = pygame.image.load("assets/images/desayuno_icon.png").convert_alpha()
-            self.comida_img = pygame.transform.smoothscale(self.comida_img, (80, 80))
+            self.comida_img = load_image("assets/images/desayuno_icon.png", (80, 80))
         except:
             pass
         
@@ -125,6 +83,17 @@ class KitchenScene(Scene):
         # Zona derecha para ir a la escuela (INVISIBLE)
         self.school_door_zone = pygame.Rect(WIDTH - 50, HEIGHT // 2 - 150, 50, 300)
 
+        # Fondo, comida, mesa, niño y la zona de salida aplanados en una capa
+        door_overlay = get_overlay(self.left_door_zone.size, (255, 255, 0, 100))
+        self.layer = StaticLayer(fill=(0, 0, 0))
+        self.layer.add("bg", self.bg, (self.bg_x, self.bg_y))
+        self.layer.add("comida", self.comida_img, self.comida_zone.center, center=True)
+        self.layer.add("mesa", self.mesa_img, self.mesa_pos, center=True)
+        self.layer.add("nino", self.nino_fantasma, self.nino_pos, center=True)
+        # Zona izquierda (visible - amarilla)
+        self.layer.add("zona_habitacion", door_overlay, self.left_door_zone.topleft)
+        self.layer.add("texto_habitacion", render_text(self.font, "← Habitación", True, (255, 255, 255)), (10, HEIGHT // 2 - 50))
+
         # Variables de control
         self.vestida = game_state.flags.get("vestida", False)
         self.daniela_state = "parada_frente" if self.vestida else "parada_pijama"
@@ -174,13 +143,15 @@ class KitchenScene(Scene):
 
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dialogue_cooldown <= 0:
             if self.can_skip and self.current_dialogue:
+                if next_page(self):
+                    return
                 self.current_dialogue = None
                 self.current_speaker = None
                 self.dialogue_cooldown = 0.5
                 return
 
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            current_time = pygame.time.get_ticks() / 1000.0
+            current_time = self.manager.time
             is_double_click = (current_time - self.last_click_time) < 0.3
             self.last_click_time = current_time
 
@@ -196,6 +167,7 @@ class KitchenScene(Scene):
                 if self.comida_zone.collidepoint(x, y) and not self.has_comida:
                     if self.comida_proximity_zone.collidepoint(self.daniela_pos):
                         self.has_comida = True
+                        self.layer.set_visible("comida", False)
                         self.show_dialogue("Daniela", "Tengo mi comida. Ahora puedo sentarme a desayunar.")
                     return
                 
@@ -330,7 +302,7 @@ class KitchenScene(Scene):
             self.is_sentada = False
             self.panic_sequence_timer = 3.0
             self.show_dialogue("Daniela", "¿Estará sospechando de mí?")
-            if self.daniela_asustada:
+            if self.daniela.has("asustada"):
                 self.daniela_state = "asustada"
                 
         elif self.panic_sequence_step == 3:
@@ -350,35 +322,29 @@ class KitchenScene(Scene):
             self.daniela_speed = 400
             self.panic_sequence_step = 0
 
+    def dirty_rects(self, game_state):
+        d = self.dirty
+        # Todos los sprites de Daniela miden 120x240 (el círculo de respaldo entra)
+        center = (self.mesa_pos[0] - 80, self.mesa_pos[1] - 50) if self.is_sentada else self.lerp_center("daniela_pos")
+        d.track("daniela", pygame.Rect(0, 0, 120, 240).move(center[0] - 60, center[1] - 120),
+                (self.daniela_state, self.facing_right, self.is_sentada, self.vestida))
+        d.track("comida", self.comida_zone, self.has_comida)
+        d.track("escuela", (WIDTH - 220, HEIGHT // 2 - 50, 220, 40), self.school_door_zone.collidepoint(self.daniela_pos))
+        d.track("estado", (WIDTH - 400, 30, 400, 40), (self.vestida, self.has_desayunado))
+        d.track("dialogo", *self.dialogue_box.dirty_region(self.current_speaker, self.current_dialogue, self.can_skip))
+        d.track("stats", *self.stats_display.dirty_region())
+        return d.collect()
+
     def draw(self, screen, game_state):
         surf = screen
-        
-        surf.fill((0, 0, 0))
-        surf.blit(self.bg, (self.bg_x, self.bg_y))
-
-        if not self.has_comida and self.comida_img:
-            comida_rect = self.comida_img.get_rect(center=(self.comida_zone.x + 50, self.comida_zone.y + 50))
-            surf.blit(self.comida_img, comida_rect)
 
-        if self.mesa_img:
-            mesa_rect = self.mesa_img.get_rect(center=self.mesa_pos)
-            surf.blit(self.mesa_img, mesa_rect)
-
-        if self.nino_fantasma:
-            nino_rect = self.nino_fantasma.get_rect(center=self.nino_pos)
-            surf.blit(self.nino_fantasma, nino_rect)
-
-        # Zona izquierda (visible - amarilla)
-        transition_surface = pygame.Surface((self.left_door_zone.width, self.left_door_zone.height), pygame.SRCALPHA)
-        transition_surface.fill((255, 255, 0, 100))
-        surf.blit(transition_surface, self.left_door_zone.topleft)
-        transition_text = self.font.render("← Habitación", True, (255, 255, 255))
-        surf.blit(transition_text, (10, HEIGHT // 2 - 50))
+        # Fondo, comida, mesa, niño y zona izquierda en un solo blit
+        self.layer.draw(surf)
 
         # Zona derecha para la escuela (INVISIBLE - no se dibuja)
         # Solo se mostrará texto indicativo si Daniela está cerca
         if self.school_door_zone.collidepoint(self.daniela_pos):
-            school_text = self.font.render("Escuela →", True, (255, 255, 255))
+            school_text = render_text(self.font, "Escuela →", True, (255, 255, 255))
             surf.blit(school_text, (WIDTH - school_text.get_width() - 20, HEIGHT // 2 - 50))
 
         # Indicador de estado
@@ -390,80 +356,25 @@ class KitchenScene(Scene):
         else:
             status_text = "Lista para la escuela"
         
-        status = self.font.render(status_text, True, (255, 255, 255))
+        status = render_text(self.font, status_text, True, (255, 255, 255))
         surf.blit(status, (WIDTH - status.get_width() - 20, 30))
 
         if self.is_sentada:
-            current_state = "vestida" if self.vestida else "pijama"
-            current_sprite = self.daniela_sentada_states.get(current_state)
-            if current_sprite:
-                sentada_pos = (self.mesa_pos[0] - 80, self.mesa_pos[1] - 50)
-                surf.blit(current_sprite, current_sprite.get_rect(center=sentada_pos))
-            else:
+            pose = "sentada" if self.vestida else "sentada_pijama"
+            sentada_pos = (self.mesa_pos[0] - 80, self.mesa_pos[1] - 50)
+            if not self.daniela.draw(surf, pose, sentada_pos):
                 color = (0, 0, 255) if self.vestida else (255, 0, 0)
                 pygame.draw.circle(surf, color, (self.mesa_pos[0] - 80, self.mesa_pos[1] - 50), 30)
         else:
-            if self.daniela_state == "asustada" and self.daniela_asustada:
-                current_sprite = self.daniela_asustada
-                if not self.facing_right:
-                    current_sprite = pygame.transform.flip(current_sprite, True, False)
-                surf.blit(current_sprite, current_sprite.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y))))
-            else:
-                current_sprite = self.daniela_estados_pie.get(self.daniela_state)
-                if current_sprite:
-                    if not self.facing_right:
-                        current_sprite = pygame.transform.flip(current_sprite, True, False)
-                    surf.blit(current_sprite, current_sprite.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y))))
-                else:
-                    color = (0, 0, 255) if self.vestida else (255, 0, 0)
-                    pygame.draw.circle(surf, color, (int(self.daniela_pos.x), int(self.daniela_pos.y)), 30)
+            # Espejada = mira a la izquierda
+            center = self.lerp_center("daniela_pos")
+            if not self.daniela.draw(surf, self.daniela_state, center, mirrored=not self.facing_right):
+                color = (0, 0, 255) if self.vestida else (255, 0, 0)
+                pygame.draw.circle(surf, color, center, 30)
 
         self.draw_dialogue_with_speaker(surf)
         self.stats_display.draw(surf)
     
     def draw_dialogue_with_speaker(self, screen):
-        if not self.current_dialogue:
-            return
-            
-        box_width = WIDTH - 100
-        box_height = 100
-        box_x = 50
-        box_y = HEIGHT - box_height - 20
-        
-        pygame.draw.rect(screen, (0, 0, 0, 200), (box_x, box_y, box_width, box_height))
-        pygame.draw.rect(screen, (255, 255, 255), (box_x, box_y, box_width, box_height), 2)
-        
-        if self.current_speaker:
-            if self.current_speaker == "Daniela":
-                speaker_color = (0, 200, 255)
-            else:
-                speaker_color = (255, 255, 255)
-            
-            speaker_text = self.speaker_font.render(self.current_speaker, True, speaker_color)
-            screen.blit(speaker_text, (box_x + 10, box_y - 30))
-        
-        words = self.current_dialogue.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_width = self.font.size(test_line)[0]
-            
-            if test_width <= box_width - 40:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        for i, line in enumerate(lines):
-            if i < 3:
-                text_surf = self.font.render(line, True, (255, 255, 255))
-                screen.blit(text_surf, (box_x + 20, box_y + 15 + i * 30))
-        
-        if self.can_skip:
-            skip_text = self.font.render("Clic para continuar", True, (200, 200, 200))
-            screen.blit(skip_text, (box_x + box_width - skip_text.get_width() - 20, box_y + box_height - 30))
\ No newline at end of file
+        """Dibuja el diálogo con el nombre del hablante arriba"""
+        self.dialogue_box.draw(screen, self.current_speaker, self.current_dialogue, self.can_skip)
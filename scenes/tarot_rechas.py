@@ -1,18 +1,37 @@
 import pygame
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.atlas import atlas_keys
+from engine.fonts import get_font, render_text
 from engine.narrator import Narrator
 from engine.ui import StatsDisplay
+from engine.dialogue import DialogueBox, next_page
+from engine.surfaces import get_overlay
+from engine.dirty import DirtyTracker
+from game.actor import CharacterSprite
 
 class TarotRechasScene(Scene):
+    successors = ("scenes.title.TitleScene",)
+    interpolated = ("daniela_pos",)   # se dibuja interpolada entre pasos
+    OPTIONS_TITLE = "¿Confirmas tu decisión?"
+    preload = (
+        image_key("assets/images/casa_tarot_bg.png", (WIDTH, HEIGHT), alpha=False),
+        *atlas_keys((120, 240)),
+        image_key("assets/images/tarota_npc.png", (150, 260)),
+        image_key("assets/images/tarota_habla_npc.png", (150, 260)),
+    )
+
     def __init__(self, manager, game_state, audio):
         super().__init__(manager)
         self.game_state = game_state
         self.audio = audio
-        self.font = pygame.font.SysFont("arial", 28)
-        self.speaker_font = pygame.font.SysFont("arial", 24, bold=True)
+        self.font = get_font("arial", 28)
+        self.speaker_font = get_font("arial", 24, bold=True)
         self.narrator = Narrator(self.font)
         self.stats_display = StatsDisplay(game_state)
+        self.dirty = DirtyTracker()
+        self.dialogue_box = DialogueBox(self.font, self.speaker_font, {"Elena": (255, 215, 0)})
 
         # Estados de la escena
         self.state = "INTRO"
@@ -20,39 +39,26 @@ class TarotRechasScene(Scene):
         
         # Cargar imágenes - MISMO FONDO Y PERSONAJES QUE ESCENA 2
         try:
-            self.bg = pygame.image.load("assets/images/casa_tarot_bg.png").convert()
-            self.bg = pygame.transform.smoothscale(self.bg, (WIDTH, HEIGHT))
+            self.bg = load_image("assets/images/casa_tarot_bg.png", (WIDTH, HEIGHT), alpha=False)
         except:
             self.bg = pygame.Surface((WIDTH, HEIGHT))
             self.bg.fill((80, 60, 100))
 
+        self.daniela = CharacterSprite((120, 240))
         # Daniela asustada - SIN VOLTEAR (mira a la izquierda)
-        try:
-            self.daniela_asustada = pygame.image.load("assets/images/asustada_pr.png").convert_alpha()
-            self.daniela_asustada = pygame.transform.smoothscale(self.daniela_asustada, (120, 240))
-        except:
-            self.daniela_asustada = None
-
-        # Daniela caminando - para la entrada
-        try:
-            self.daniela_caminando = pygame.image.load("assets/images/caminando_pr.png").convert_alpha()
-            self.daniela_caminando = pygame.transform.smoothscale(self.daniela_caminando, (120, 240))
-            # Voltear para que mire a la derecha mientras camina
-            self.daniela_caminando = pygame.transform.flip(self.daniela_caminando, True, False)
-        except:
-            self.daniela_caminando = None
+        self.daniela_asustada = self.daniela.frame("asustada")
+        # Daniela caminando - para la entrada, espejada para que mire a la derecha
+        self.daniela_caminando = self.daniela.frame("caminando", mirrored=True)
 
         # Tarotista de frente
         try:
-            self.tarotista_frente = pygame.image.load("assets/images/tarota_npc.png").convert_alpha()
-            self.tarotista_frente = pygame.transform.smoothscale(self.tarotista_frente, (150, 260))
+            self.tarotista_frente = load_image("assets/images/tarota_npc.png", (150, 260))
         except:
             self.tarotista_frente = None
 
         # Tarotista hablando (mirando a la izquierda)
         try:
-            self.tarotista_habla = pygame.image.load("assets/images/tarota_habla_npc.png").convert_alpha()
-            self.tarotista_habla = pygame.transform.smoothscale(self.tarotista_habla, (150, 260))
+            self.tarotista_habla = load_image("assets/images/tarota_habla_npc.png", (150, 260))
         except:
             self.tarotista_habla = None
 
@@ -149,7 +155,7 @@ class TarotRechasScene(Scene):
         
         elif self.state == "DIALOGO":
             if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.dialogue_cooldown <= 0:
-                if self.can_skip:
+                if self.can_skip and not next_page(self):
                     self.current_dialogue += 1
                     self.dialogue_cooldown = 0.5
                     
@@ -253,6 +259,54 @@ class TarotRechasScene(Scene):
 
         self.narrator.update(dt)
 
+    def daniela_image(self):
+        """Daniela caminando durante la entrada, asustada después"""
+        if self.state == "ENTRANDO" and self.daniela_caminando:
+            return self.daniela_caminando
+        return self.daniela_asustada
+
+    def tarotista_image(self):
+        """Tarotista hablando si el diálogo es de Elena, si no de frente"""
+        if self.state == "DIALOGO" and self.current_dialogue < len(self.dialogues):
+            if self.dialogues[self.current_dialogue]["speaker"] == "Elena" and self.tarotista_habla:
+                return self.tarotista_habla
+        return self.tarotista_frente
+
+    def dialogue_visible(self):
+        """Solo hay diálogo en el estado DIALOGO, en la transición o tras elegir"""
+        return (self.state == "DIALOGO" or
+                (hasattr(self, 'transition_timer') and self.transition_timer > 0) or
+                (self.state == "EXPLORAR" and self.option_selected))
+
+    def option_rects(self):
+        option_start_y = HEIGHT // 2 - 30
+        return [pygame.Rect(WIDTH // 2 - 200, option_start_y + i * 60, 400, 50) for i in range(len(self.options))]
+
+    def dirty_rects(self, game_state):
+        d = self.dirty
+        # La intro y la pantalla final (texto sobre negro) tapan todo
+        final = getattr(self, "show_final_screen", False)
+        d.track("pantalla", (0, 0, WIDTH, HEIGHT), (self.state == "INTRO", final))
+        if final:
+            return d.collect()
+        if self.state != "INTRO":
+            for name, img, center in (("daniela", self.daniela_image(), self.lerp_center("daniela_pos")),
+                                      ("tarotista", self.tarotista_image(), self.tarotista_pos)):
+                d.track(name, img.get_rect(center=center) if img else None, id(img))
+            showing = self.state == "EXPLORAR" and self.show_options and not self.option_selected
+            rects = self.option_rects()
+            title_font = get_font("arial", 32, bold=True)
+            w, h = title_font.size(self.OPTIONS_TITLE)
+            area = pygame.Rect(WIDTH // 2 - w // 2, HEIGHT // 2 - 100, w, h).unionall(rects)
+            mouse = pygame.mouse.get_pos()
+            hovered = next((i for i, r in enumerate(rects) if r.collidepoint(mouse)), None)
+            d.track("opciones", area, (showing, hovered) if showing else None)
+        text = self.current_dialogue_text if self.dialogue_visible() else None
+        d.track("dialogo", *self.dialogue_box.dirty_region(self.current_speaker, text,
+                                                           self.can_skip and self.state == "DIALOGO"))
+        d.track("stats", *self.stats_display.dirty_region())
+        return d.collect()
+
     def draw(self, screen, game_state):
         if hasattr(self, 'show_final_screen') and self.show_final_screen:
             self.draw_final_screen(screen)
@@ -260,13 +314,13 @@ class TarotRechasScene(Scene):
             
         if self.state == "INTRO":
             screen.fill((0, 0, 0))
-            font_large = pygame.font.SysFont("arial", 36)
-            font_small = pygame.font.SysFont("arial", 24)
+            font_large = get_font("arial", 36)
+            font_small = get_font("arial", 24)
             
             # CORRECCIÓN: Dos líneas como en TarotAcepScene
-            text1 = font_large.render("Daniela regresa a la tienda,", True, (255, 255, 255))
-            text2 = font_large.render("agotada pero determinada.", True, (255, 255, 255))
-            hint = font_small.render("(Haz clic para continuar)", True, (150, 150, 150))
+            text1 = render_text(font_large, "Daniela regresa a la tienda,", True, (255, 255, 255))
+            text2 = render_text(font_large, "agotada pero determinada.", True, (255, 255, 255))
+            hint = render_text(font_small, "(Haz clic para continuar)", True, (150, 150, 150))
             
             text1_rect = text1.get_rect(center=(WIDTH//2, HEIGHT//2 - 30))
             text2_rect = text2.get_rect(center=(WIDTH//2, HEIGHT//2 + 10))
@@ -279,19 +333,11 @@ class TarotRechasScene(Scene):
         else:
             screen.blit(self.bg, (0, 0))
 
-            if self.state == "ENTRANDO" and self.daniela_caminando:
-                screen.blit(self.daniela_caminando, self.daniela_caminando.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y))))
-            elif self.daniela_asustada:
-                screen.blit(self.daniela_asustada, self.daniela_asustada.get_rect(center=(int(self.daniela_pos.x), int(self.daniela_pos.y))))
-
-            if self.state == "DIALOGO" and self.current_dialogue < len(self.dialogues):
-                if self.dialogues[self.current_dialogue]["speaker"] == "Elena" and self.tarotista_habla:
-                    screen.blit(self.tarotista_habla, self.tarotista_habla.get_rect(center=self.tarotista_pos))
-                elif self.tarotista_frente:
-                    screen.blit(self.tarotista_frente, self.tarotista_frente.get_rect(center=self.tarotista_pos))
-            else:
-                if self.tarotista_frente:
-                    screen.blit(self.tarotista_frente, self.tarotista_frente.get_rect(center=self.tarotista_pos))
+            # Daniela (caminando al entrar, después asustada) y la tarotista
+            for img, center in ((self.daniela_image(), self.lerp_center("daniela_pos")),
+                                (self.tarotista_image(), self.tarotista_pos)):
+                if img:
+                    screen.blit(img, img.get_rect(center=center))
 
             if self.state == "EXPLORAR" and self.show_options and not self.option_selected:
                 self.draw_options_ui(screen)
@@ -300,64 +346,17 @@ class TarotRechasScene(Scene):
         self.stats_display.draw(screen)
     
     def draw_dialogue_with_speaker(self, screen):
-        if (self.state == "DIALOGO" or 
-            (hasattr(self, 'transition_timer') and self.transition_timer > 0) or
-            (self.state == "EXPLORAR" and self.option_selected)):
-            
-            if not self.current_dialogue_text:
-                return
-                
-            box_width = WIDTH - 100
-            box_height = 100
-            box_x = 50
-            box_y = HEIGHT - box_height - 20
-            
-            pygame.draw.rect(screen, (0, 0, 0, 200), (box_x, box_y, box_width, box_height))
-            pygame.draw.rect(screen, (255, 255, 255), (box_x, box_y, box_width, box_height), 2)
-            
-            if self.current_speaker:
-                if self.current_speaker == "Elena":
-                    speaker_color = (255, 215, 0)
-                elif self.current_speaker == "Daniela":
-                    speaker_color = (0, 200, 255)
-                else:
-                    speaker_color = (255, 255, 255)
-                
-                speaker_text = self.speaker_font.render(self.current_speaker, True, speaker_color)
-                screen.blit(speaker_text, (box_x + 10, box_y - 30))
-            
-            words = self.current_dialogue_text.split(' ')
-            lines = []
-            current_line = []
-            
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                test_width = self.font.size(test_line)[0]
-                
-                if test_width <= box_width - 40:
-                    current_line.append(word)
-                else:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-            
-            for i, line in enumerate(lines):
-                if i < 3:
-                    text_surf = self.font.render(line, True, (255, 255, 255))
-                    screen.blit(text_surf, (box_x + 20, box_y + 15 + i * 30))
-            
-            if self.can_skip and self.state == "DIALOGO":
-                skip_text = self.font.render("Clic para continuar", True, (200, 200, 200))
-                screen.blit(skip_text, (box_x + box_width - skip_text.get_width() - 20, box_y + box_height - 30))
-    
+        """Dibuja el diálogo con el nombre del hablante arriba"""
+        if self.dialogue_visible():
+            self.dialogue_box.draw(screen, self.current_speaker, self.current_dialogue_text,
+                                   self.can_skip and self.state == "DIALOGO")
+
     def draw_options_ui(self, screen):
         option_height = 60
         option_start_y = HEIGHT // 2 - 30
         
-        title_font = pygame.font.SysFont("arial", 32, bold=True)
-        title = title_font.render("¿Confirmas tu decisión?", True, (255, 255, 255))
+        title_font = get_font("arial", 32, bold=True)
+        title = render_text(title_font, self.OPTIONS_TITLE, True, (255, 255, 255))
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 100))
         
         for i, option in enumerate(self.options):
@@ -385,35 +384,33 @@ class TarotRechasScene(Scene):
                 bg_color = (70, 30, 50, 150)
                 border_color = (180, 120, 150)
             
-            s = pygame.Surface((option_rect.width, option_rect.height), pygame.SRCALPHA)
-            s.fill(bg_color)
-            screen.blit(s, option_rect)
+            screen.blit(get_overlay(option_rect.size, bg_color), option_rect)
             
             pygame.draw.rect(screen, border_color, option_rect, 3, border_radius=8)
             
-            option_surf = self.font.render(option, True, text_color)
+            option_surf = render_text(self.font, option, True, text_color)
             option_text_rect = option_surf.get_rect(center=option_rect.center)
             screen.blit(option_surf, option_text_rect)
             
             if i == self.selected_option and self.option_selected:
-                check_surf = self.font.render("✓", True, (255, 150, 150))
+                check_surf = render_text(self.font, "✓", True, (255, 150, 150))
                 screen.blit(check_surf, (option_rect.right - 40, option_rect.centery - 15))
             elif is_hovered:
-                arrow_surf = self.font.render("→", True, (255, 255, 255))
+                arrow_surf = render_text(self.font, "→", True, (255, 255, 255))
                 screen.blit(arrow_surf, (option_rect.left + 20, option_rect.centery - 15))
     
     def draw_final_screen(self, screen):
         screen.fill((0, 0, 0))
         
-        title_font = pygame.font.SysFont("arial", 36, bold=True)
-        text_font = pygame.font.SysFont("arial", 24)
-        stats_font = pygame.font.SysFont("arial", 20)
+        title_font = get_font("arial", 36, bold=True)
+        text_font = get_font("arial", 24)
+        stats_font = get_font("arial", 20)
         
-        title = title_font.render(self.final_text[0], True, (255, 150, 150))
+        title = render_text(title_font, self.final_text[0], True, (255, 150, 150))
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 4))
         
         for i, line in enumerate(self.final_text[1:], 1):
-            text = text_font.render(line, True, (255, 200, 200))
+            text = render_text(text_font, line, True, (255, 200, 200))
             screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 3 + i * 40))
         
         stats_y = HEIGHT // 2 + 150
@@ -423,8 +420,8 @@ class TarotRechasScene(Scene):
         ]
         
         for i, stat in enumerate(stats):
-            stat_text = stats_font.render(stat, True, (255, 200, 200))
+            stat_text = render_text(stats_font, stat, True, (255, 200, 200))
             screen.blit(stat_text, (WIDTH // 2 - stat_text.get_width() // 2, stats_y + i * 35))
         
-        continue_text = text_font.render("Clic para volver al menú principal", True, (255, 200, 200))
+        continue_text = render_text(text_font, "Clic para volver al menú principal", True, (255, 200, 200))
         screen.blit(continue_text, (WIDTH // 2 - continue_text.get_width() // 2, HEIGHT - 100))
\ No newline at end of file
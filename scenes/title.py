@@ -1,28 +1,43 @@
-import pygame
 from settings import WIDTH, HEIGHT, PALETTE
 from engine.scene_manager import Scene
+from engine.assets import load_image, image_key
+from engine.fonts import get_font, render_text
 from engine.narrator import Narrator
 from engine.audio import Audio
 from engine.ui import Button
+from engine.dirty import DirtyTracker
+from engine.layers import StaticLayer
 from scenes.house import HouseScene  # Cambiamos ForestScene por HouseScene
 
 class TitleScene(Scene):
+    successors = ("scenes.house.HouseScene",)
+    preload = (
+        image_key("assets/images/title_bg.png", (WIDTH, HEIGHT), alpha=False),
+    )
+    preload_sounds = ("assets/audio/ui_click.wav", "assets/audio/narrator_beep.wav")
+
     def __init__(self, manager):
         super().__init__(manager)
-        self.font_big = pygame.font.SysFont("arial", 42)
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font_big = get_font("arial", 42)
+        self.font = get_font("arial", 24)
         self.narrator = Narrator(self.font)
         self.audio = Audio()
         self.buttons = []
+        self.dirty = DirtyTracker()
 
         # Fondo
         self.bg = None
         try:
-            img = pygame.image.load("assets/images/title_bg.png").convert()
-            self.bg = pygame.transform.smoothscale(img, (WIDTH, HEIGHT))
+            self.bg = load_image("assets/images/title_bg.png", (WIDTH, HEIGHT), alpha=False)
         except Exception:
             self.bg = None
 
+        # Fondo y título fijos en una capa
+        self.layer = StaticLayer(fill=PALETTE["bg"])
+        self.layer.add("bg", self.bg)
+        title = render_text(self.font_big, "EL JARDÍN DE LOS SUSURROS", True, PALETTE["ink"])
+        self.layer.add("titulo", title, (WIDTH // 2, HEIGHT // 2 - 80), center=True)
+
     def on_enter(self):
         self.audio.play_ambience()
         self.narrator.say("EL JARDÍN DE LOS SUSURROS")
@@ -44,16 +59,15 @@ class TitleScene(Scene):
     def update(self, dt, game_state):
         self.narrator.update(dt)
 
+    def dirty_rects(self, game_state):
+        for i, b in enumerate(self.buttons):
+            self.dirty.track(("boton", i), *b.dirty_region())
+        self.dirty.track("narrador", *self.narrator.dirty_region((WIDTH, HEIGHT)))
+        return self.dirty.collect()
+
     def draw(self, screen, game_state):
         surf = screen
-        if self.bg:
-            surf.blit(self.bg, (0, 0))
-        else:
-            surf.fill(PALETTE["bg"])
-
-        title = self.font_big.render("EL JARDÍN DE LOS SUSURROS", True, PALETTE["ink"])
-        tr = title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 80))
-        surf.blit(title, tr)
+        self.layer.draw(surf)
 
         for b in self.buttons:
             b.draw(surf)
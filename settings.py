@@ -10,4 +10,35 @@ PALETTE = {
     "shadow": (200, 208, 210),
     "white": (255, 255, 255),
     "text": (55, 65, 81),
-}
\ No newline at end of file
+}
+# Límite de memoria (en MB) para la caché de imágenes compartida
+ASSET_CACHE_MB = 96
+
+# Cantidad máxima de textos renderizados que se guardan en caché
+TEXT_CACHE_SIZE = 512
+
+# Redibujar solo las regiones que cambiaron (escenas con dirty_rects)
+DIRTY_RECTS = False
+
+# Pasos de simulación por segundo (la lógica corre a paso fijo, engine/loop.py)
+SIM_HZ = 60
+# Máximo de pasos que se simulan en un cuadro para ponerse al día tras un tirón
+MAX_CATCHUP_STEPS = 5
+
+# Un cuadro que tarda más que esto (en ms) se registra como tirón, con
+# muestras de la pila del hilo principal (engine/hitch.py)
+HITCH_BUDGET_MS = 25
+HITCH_LOG = "logs/hitches.log"
+
+# Imprimir la memoria de Surfaces y Sounds en cada cambio de escena
+# (engine/memory.py); las fugas se avisan igual, activado o no
+MEMORY_REPORT = False
+# Vueltas seguidas al título con memoria en aumento que cuentan como fuga
+MEMORY_LEAK_LOOPS = 3
+
+# Canales del mezclador reservados por categoría (engine/audio.py); el
+# ambiente no usa canales, va por pygame.mixer.music
+AUDIO_CHANNELS = {"ui": 2, "voice": 2, "sfx": 3}
+# Duración (en ms) del fundido de salida del ambiente que suena y del de
+# entrada del siguiente
+AMBIENCE_FADE_MS = 600
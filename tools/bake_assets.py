@@ -0,0 +1,154 @@
+"""Hornea las imágenes a los tamaños que piden las escenas.
+
+Uso (desde la raíz del proyecto):
+    python -m tools.bake_assets [--clean]
+
+Construye cada escena sin ventana, registra qué (ruta, tamaño, alpha,
+volteo) pide al AssetCache y guarda esas variantes ya escaladas en
+assets/baked/, nombradas por el hash del archivo original. El juego
+las usa automáticamente mientras el original no cambie.
+
+Los atlas de poses que armaron las escenas (engine/atlas.py) se guardan
+enteros como atlas_<nombre>_<ancho>x<alto>.png.
+"""
+import os
+import sys
+import json
+import hashlib
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import WIDTH, HEIGHT
+from engine.assets import cache, load_source, manifest_key, BAKED_DIR, BAKED_MANIFEST
+from engine.atlas import atlases
+from engine.scene_manager import SceneManager
+from game.state import GameState
+
+# (módulo, clase, recibe estado y audio)
+SCENES = [
+    ("scenes.title", "TitleScene", False),
+    ("scenes.house", "HouseScene", True),
+    ("scenes.kitchen", "KitchenScene", True),
+    ("scenes.cuarto2", "Cuarto2Scene", True),
+    ("scenes.escuela", "EscuelaScene", True),
+    ("scenes.tarot", "TarotScene", True),
+    ("scenes.garden", "GardenScene", True),
+    ("scenes.tarot_acep", "TarotAcepScene", True),
+    ("scenes.tarot_rechas", "TarotRechasScene", True),
+    ("scenes.ending", "EndingScene", True),
+    ("scenes.forest", "ForestScene", True),
+]
+
+
+def scan_requests():
+    """Construye todas las escenas y devuelve las claves pedidas."""
+    from importlib import import_module
+    from engine.audio import Audio
+
+    cache.use_baked = False
+    audio = Audio()
+    for module, name, with_state in SCENES:
+        state = GameState()
+        manager = SceneManager(pygame.display.get_surface(), state)
+        cls = getattr(import_module(module), name)
+        scene = cls(manager, state, audio) if with_state else cls(manager)
+        scene.on_enter()
+    return sorted(cache.requested, key=manifest_key)
+
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def bake(keys):
+    os.makedirs(BAKED_DIR, exist_ok=True)
+    entries = {}
+    hashes = {}
+    for key in keys:
+        path, size, alpha, flip_x = key
+        if not os.path.exists(path):
+            continue
+        if path not in hashes:
+            hashes[path] = file_hash(path)
+        st = os.stat(path)
+        variant = f"{size[0]}x{size[1]}" if size else "orig"
+        name = f"{hashes[path][:16]}_{variant}{'_a' if alpha else ''}{'_f' if flip_x else ''}.png"
+        out = os.path.join(BAKED_DIR, name)
+        if not os.path.exists(out):
+            pygame.image.save(load_source(*key), out)
+        entries[manifest_key(key)] = {
+            "file": name,
+            "source_size": st.st_size,
+            "source_mtime": int(st.st_mtime),
+        }
+        print(f"  {manifest_key(key)} -> {name}")
+    return entries
+
+
+def bake_atlases():
+    """Guarda cada atlas armado durante scan_requests()."""
+    baked = {}
+    for atlas in atlases.values():
+        if len(atlas.frames) != len(atlas.rects):
+            print(f"  {atlas.label}: faltan poses, no se hornea")
+            continue
+        name = f"atlas_{atlas.name}_{atlas.size[0]}x{atlas.size[1]}.png"
+        pygame.image.save(atlas.surface, os.path.join(BAKED_DIR, name))
+        sources = {}
+        for path in atlas.poses.values():
+            st = os.stat(path)
+            sources[path] = [st.st_size, int(st.st_mtime)]
+        baked[atlas.label] = {"file": name, "poses": list(atlas.poses), "sources": sources}
+        print(f"  {atlas.label} ({len(atlas.poses)} poses) -> {name}")
+    return baked
+
+
+def write_manifest(entries, baked_atlases):
+    with open(BAKED_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "entries": entries, "atlases": baked_atlases}, f, indent=1, sort_keys=True)
+
+
+def remove_stale(entries, baked_atlases):
+    keep = {e["file"] for e in entries.values()} | {os.path.basename(BAKED_MANIFEST)}
+    keep |= {a["file"] for a in baked_atlases.values()}
+    for name in os.listdir(BAKED_DIR):
+        if name not in keep:
+            os.remove(os.path.join(BAKED_DIR, name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hornea imágenes pre-escaladas")
+    parser.add_argument("--clean", action="store_true", help="borrar variantes que ya no se usan")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    keys = scan_requests()
+    print(f"Horneando {len(keys)} variantes en {BAKED_DIR}/")
+    entries = bake(keys)
+    print(f"Horneando {len(atlases)} atlas de poses")
+    baked_atlases = bake_atlases()
+    write_manifest(entries, baked_atlases)
+    if args.clean:
+        remove_stale(entries, baked_atlases)
+
+    src = sum(os.path.getsize(p) for p in {k[0] for k in keys} if os.path.exists(p))
+    files = [e["file"] for e in entries.values()] + [a["file"] for a in baked_atlases.values()]
+    out = sum(os.path.getsize(os.path.join(BAKED_DIR, name)) for name in files)
+    print(f"Originales: {src / 1e6:.1f} MB  ->  horneadas: {out / 1e6:.1f} MB")
+    cache.clear()
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Compara voltear a Daniela en cada cuadro contra usar la pose espejada del atlas.
+
+Uso (desde la raíz del proyecto):
+    python -m tools.bench_flip [--frames N]
+
+Primero mide el camino viejo (pygame.transform.flip en cada cuadro)
+contra el nuevo (la subsurface espejada del atlas, engine/atlas.py).
+Después corre las escenas con Daniela mirando hacia el lado espejado y
+cuenta las Surfaces creadas por cuadro: volteos más lo que registra
+engine/surfaces.py.
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import WIDTH, HEIGHT
+from engine.assets import load_image
+from engine.surfaces import surfaces
+from engine.scene_manager import SceneManager
+from game.state import GameState
+from game.actor import CharacterSprite
+
+# (módulo, clase, facing_right que usa la variante espejada)
+SCENES = [
+    ("scenes.house", "HouseScene", False),
+    ("scenes.kitchen", "KitchenScene", False),
+    ("scenes.cuarto2", "Cuarto2Scene", False),
+    ("scenes.escuela", "EscuelaScene", True),
+    ("scenes.garden", "GardenScene", True),
+]
+
+SPRITE = ("assets/images/caminando_pr.png", (120, 240))
+POSE = "caminando"
+
+flips = 0
+_flip = pygame.transform.flip
+
+def counting_flip(surf, flip_x, flip_y):
+    global flips
+    flips += 1
+    return _flip(surf, flip_x, flip_y)
+
+
+def measure(frames, draw_frame):
+    """Devuelve (Surfaces creadas por cuadro, microsegundos por cuadro)."""
+    global flips
+    flips = 0
+    surfaces.end_frame()
+    start_total = surfaces.total
+    t = time.perf_counter()
+    for _ in range(frames):
+        draw_frame()
+        surfaces.end_frame()
+    elapsed = time.perf_counter() - t
+    allocs = flips + surfaces.total - start_total
+    return allocs / frames, elapsed / frames * 1e6
+
+
+def bench_sprite(screen, frames):
+    sprite = load_image(*SPRITE)
+    atlas = CharacterSprite(SPRITE[1])
+    pos = (WIDTH // 2, HEIGHT // 2)
+
+    def before():
+        img = pygame.transform.flip(sprite, True, False)
+        screen.blit(img, img.get_rect(center=pos))
+
+    def after():
+        img = atlas.frame(POSE, mirrored=True)
+        screen.blit(img, img.get_rect(center=pos))
+
+    print(f"Sprite {SPRITE[1][0]}x{SPRITE[1][1]}, {frames} cuadros")
+    for name, fn in (("antes (flip por cuadro)", before), ("después (atlas)", after)):
+        allocs, us = measure(frames, fn)
+        print(f"  {name:26s} {allocs:5.2f} Surfaces/cuadro  {us:8.1f} µs/cuadro")
+
+
+def bench_scenes(screen, frames):
+    from importlib import import_module
+    from engine.audio import Audio
+
+    audio = Audio()
+    print(f"Escenas con Daniela espejada, {frames} cuadros")
+    for module, name, facing_right in SCENES:
+        state = GameState()
+        manager = SceneManager(screen, state)
+        scene = getattr(import_module(module), name)(manager, state, audio)
+        manager.push(scene)
+        # Que ya esté de pie (la habitación empieza con Daniela en la cama)
+        if scene.daniela_state == "en_cama":
+            scene.daniela_state = "parada_pijama"
+        for _ in range(5):
+            manager.update(1 / 60)
+            manager.draw()
+
+        def frame():
+            manager.update(1 / 60)
+            scene.facing_right = facing_right
+            manager.draw()
+
+        allocs, us = measure(frames, frame)
+        print(f"  {name:14s} {allocs:5.2f} Surfaces/cuadro  {us:8.1f} µs/cuadro")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide volteos y Surfaces por cuadro")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.transform.flip = counting_flip
+    try:
+        bench_sprite(screen, args.frames)
+        bench_scenes(screen, args.frames)
+    finally:
+        pygame.transform.flip = _flip
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
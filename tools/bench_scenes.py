@@ -0,0 +1,309 @@
+"""Mide update() y draw() de cada escena en estados representativos.
+
+Uso (desde la raíz del proyecto):
+    python -m tools.bench_scenes [--frames N] [--warmup N] [--scene NOMBRE]
+                                 [--out bench_scenes.json]
+
+Cada caso construye la escena sin ventana y la sostiene en un estado
+(diálogo en pantalla, Daniela caminando, menú de opciones, transición
+final...): antes de cada cuadro, fuera de la medición, se vuelven a
+poner los atributos que definen ese estado. update() y draw() se miden
+por separado y el resultado (p50, p99 y máximo en milisegundos por
+escena y estado) se guarda como JSON en --out, para comparar el costo
+por cuadro entre versiones. Con --out - el JSON sale por la consola.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import WIDTH, HEIGHT, SIM_HZ
+from engine.scene_manager import SceneManager
+from engine.audio import Audio
+from game.state import GameState
+from headless import make_scene, frame_time_stats
+
+BENCH_VERSION = 1
+LINE = "No está ahí. No ella está ahí."
+
+
+def say(scene, speaker="Daniela", text=LINE):
+    """Diálogo en pantalla, ya salteable y lejos de cerrarse solo."""
+    scene.current_dialogue = text
+    scene.current_speaker = speaker
+    scene.dialogue_timer = 1.5
+
+
+def walk(scene, a, b):
+    """Daniela va y viene entre a y b. Se da la vuelta antes de llegar,
+    porque al llegar las escenas disparan zonas (puertas, anciana...)."""
+    a, b = pygame.Vector2(a), pygame.Vector2(b)
+    if scene.daniela_pos.distance_to(scene.daniela_target) < 20:
+        scene.daniela_target = a if scene.daniela_target == b else b
+        scene.facing_right = scene.daniela_target.x > scene.daniela_pos.x
+    scene.is_moving = True
+
+
+def dressed(scene):
+    scene.vestida = True
+    scene.manager.game_state.set_flag("vestida", True)
+
+
+# --- Estados por escena -------------------------------------------------
+
+def house_dialogue(scene):
+    scene.daniela_state = "parada_pijama"
+    scene.has_clicked_bed = True
+    say(scene)
+
+
+def house_walking(scene):
+    scene.daniela_state = "caminando"
+    scene.has_clicked_bed = True
+    dressed(scene)
+    walk(scene, (250, HEIGHT - 140), (650, HEIGHT - 140))
+
+
+def house_transition(scene):
+    scene.daniela_state = "parada_frente"
+    scene.has_exited = True
+    scene.transition_timer = 1.0
+    say(scene, text="Saliendo de la habitación...")
+
+
+def kitchen_dialogue(scene):
+    say(scene, text="Voy a desayunar un poco...")
+
+
+def kitchen_walking(scene):
+    dressed(scene)
+    walk(scene, (300, HEIGHT - 150), (650, HEIGHT - 150))
+
+
+def kitchen_transition(scene):
+    scene.transition_target = "escuela"
+    scene.transition_timer = 1.0
+    say(scene, text="Es hora de ir a la escuela...")
+
+
+def cuarto2_walking(scene):
+    dressed(scene)
+    walk(scene, (300, HEIGHT - 140), (650, HEIGHT - 140))
+
+
+def cuarto2_final(scene):
+    scene.show_final_screen = True
+    scene.final_text = ["FINAL: DORMIR", LINE]
+    scene.final_timer = 1.0
+
+
+def escuela_black(scene):
+    scene.black_screen_timer = 1.0
+
+
+def escuela_walking(scene):
+    scene.show_black_screen = False
+    scene.can_move = True
+    walk(scene, (250, HEIGHT - 150), (480, HEIGHT - 150))
+
+
+def escuela_spirit(scene):
+    scene.show_black_screen = False
+    scene.has_sentado = True
+    scene.can_move = False
+    scene.sequence_step = 5
+    scene.sequence_timer = 0
+    scene.espiritu_visible = True
+    say(scene, "Espíritu", scene.espiritu_dialogues[0])
+
+
+def escuela_transition(scene):
+    scene.show_black_screen = False
+    scene.transition_timer = 1.0
+
+
+def tarot_intro(scene):
+    scene.state = "INTRO"
+    scene.waiting_for_click = True
+
+
+def tarot_walking(scene):
+    scene.state = "ENTRANDO"
+    scene.waiting_for_click = False
+    scene.daniela_moving = True
+    if scene.daniela_pos.distance_to(scene.daniela_target_pos) < 20:
+        scene.daniela_pos = scene.daniela_start_pos.copy()
+
+
+def tarot_dialogue(scene):
+    scene.state = "DIALOGO"
+    scene.waiting_for_click = False
+    scene.daniela_pos = scene.daniela_target_pos.copy()
+    scene.current_dialogue = 0
+    scene.show_dialogue()
+    scene.dialogue_timer = 1.5
+
+
+def tarot_options(scene):
+    scene.state = "EXPLORAR"
+    scene.waiting_for_click = False
+    scene.daniela_pos = scene.daniela_target_pos.copy()
+    scene.show_options = True
+    scene.option_selected = False
+
+
+def tarot_transition(scene):
+    tarot_options(scene)
+    scene.option_selected = True
+    scene.current_speaker = "Daniela"
+    scene.current_dialogue_text = LINE
+    scene.transition_target = "title"
+    scene.transition_timer = 1.0
+
+
+def garden_playing(scene):
+    scene.state = "JUGANDO"
+
+
+def garden_walking(scene):
+    scene.state = "JUGANDO"
+    scene.daniela_state = "caminando"
+    walk(scene, (200, HEIGHT - 150), (800, HEIGHT - 150))
+
+
+def garden_dialogue(scene):
+    scene.state = "JUGANDO"
+    say(scene, "Espíritu", scene.spirit_dialogues[0])
+
+
+def garden_final(scene):
+    scene.state = "FINAL"
+    scene.transition_timer = 1.0
+    say(scene, text="La oscuridad se disipa... el espíritu recupera su forma.")
+
+
+TAROT = [("intro", tarot_intro), ("caminando", tarot_walking), ("dialogo", tarot_dialogue),
+         ("opciones", tarot_options), ("transicion", tarot_transition)]
+
+# (escena, [(estado, función que lo sostiene o None)])
+CASES = [
+    ("scenes.title.TitleScene", [("menu", None)]),
+    ("scenes.house.HouseScene", [("dialogo", house_dialogue), ("caminando", house_walking),
+                                 ("transicion", house_transition)]),
+    ("scenes.kitchen.KitchenScene", [("dialogo", kitchen_dialogue), ("caminando", kitchen_walking),
+                                     ("transicion", kitchen_transition)]),
+    ("scenes.cuarto2.Cuarto2Scene", [("dialogo", say), ("caminando", cuarto2_walking),
+                                     ("pantalla_final", cuarto2_final)]),
+    ("scenes.escuela.EscuelaScene", [("pantalla_negra", escuela_black), ("caminando", escuela_walking),
+                                     ("espiritu", escuela_spirit), ("transicion", escuela_transition)]),
+    ("scenes.tarot.TarotScene", TAROT),
+    ("scenes.tarot_acep.TarotAcepScene", TAROT),
+    ("scenes.tarot_rechas.TarotRechasScene", TAROT),
+    ("scenes.garden.GardenScene", [("jugando", garden_playing), ("caminando", garden_walking),
+                                   ("dialogo", garden_dialogue), ("final", garden_final)]),
+    ("scenes.ending.EndingScene", [("botones", None)]),
+]
+
+
+def bench_case(screen, audio, path, hold, frames, warmup, dt):
+    """Tiempos de update() y draw() (segundos) de una escena sostenida
+    en un estado; None si la escena se fue igual (el estado no la sostiene)."""
+    random.seed(0)
+    state = GameState()
+    manager = SceneManager(screen, state)
+    scene = make_scene(path, manager, state, audio)
+    manager.push(scene)
+
+    updates, draws = [], []
+    for i in range(warmup + frames):
+        if hold:
+            hold(scene)
+        t0 = time.perf_counter()
+        manager.update(dt)
+        t1 = time.perf_counter()
+        manager.draw()
+        t2 = time.perf_counter()
+        if manager.current() is not scene:
+            return None
+        if i >= warmup:
+            updates.append(t1 - t0)
+            draws.append(t2 - t1)
+    return updates, draws
+
+
+def run(frames, warmup, dt, only=None):
+    audio = Audio()
+    screen = pygame.display.get_surface()
+    results = []
+    for path, states in CASES:
+        name = path.rsplit(".", 1)[1]
+        if only and only.lower() not in path.lower():
+            continue
+        for state_name, hold in states:
+            timings = bench_case(screen, audio, path, hold, frames, warmup, dt)
+            if timings is None:
+                print(f"{name}/{state_name}: la escena cambió durante la medición", file=sys.stderr)
+                continue
+            updates, draws = timings
+            results.append({
+                "scene": name,
+                "state": state_name,
+                "update": frame_time_stats(updates),
+                "draw": frame_time_stats(draws),
+                "frame": frame_time_stats([u + d for u, d in zip(updates, draws)]),
+            })
+    return results
+
+
+def print_table(results):
+    print(f"{'escena/estado':34s} {'update p50':>10s} {'p99':>8s} {'draw p50':>10s} {'p99':>8s}  (ms)")
+    for r in results:
+        label = f"{r['scene']}/{r['state']}"
+        print(f"{label:34s} {r['update']['p50_ms']:10.3f} {r['update']['p99_ms']:8.3f} "
+              f"{r['draw']['p50_ms']:10.3f} {r['draw']['p99_ms']:8.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide update() y draw() por escena y estado")
+    parser.add_argument("--frames", type=int, default=300, help="cuadros medidos por caso")
+    parser.add_argument("--warmup", type=int, default=30, help="cuadros previos sin medir")
+    parser.add_argument("--scene", help="solo las escenas cuyo nombre contenga este texto")
+    parser.add_argument("--out", default="bench_scenes.json", help="archivo JSON de salida (- = consola)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    dt = 1.0 / SIM_HZ
+    results = run(args.frames, args.warmup, dt, args.scene)
+    report = {
+        "version": BENCH_VERSION,
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "dt": dt,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "results": results,
+    }
+    pygame.quit()
+
+    if args.out == "-":
+        print(json.dumps(report, ensure_ascii=False, indent=1))
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print_table(results)
+        print(f"Resultados guardados en {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Recorre muchas veces todas las escenas y avisa si la memoria crece.
+
+Uso (desde la raíz del proyecto):
+    python -m tools.memory_soak [--loops 10] [--frames 30] [--report]
+
+Sin ventana: construye las escenas en el orden de una partida
+(título, habitación, cocina, cuarto, cocina, escuela, tarot, jardín,
+los dos tarot de después y el final) y vuelve al título, loops veces.
+Cada escena corre frames cuadros de update() y draw(). engine/memory.py
+hace el resto: en cada vuelta al título corre gc, compara y avisa si
+quedan escenas vivas fuera de la pila o si los bytes de Surfaces y
+Sounds crecen vuelta tras vuelta. Termina con código 1 si hubo avisos.
+"""
+import os
+import sys
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import WIDTH, HEIGHT, SIM_HZ
+from engine.scene_manager import SceneManager
+from engine.memory import memory, describe, mb
+from engine.audio import Audio
+from game.state import GameState
+from headless import make_scene
+
+LOOP = [
+    "scenes.house.HouseScene",
+    "scenes.kitchen.KitchenScene",
+    "scenes.cuarto2.Cuarto2Scene",
+    "scenes.kitchen.KitchenScene",
+    "scenes.escuela.EscuelaScene",
+    "scenes.tarot.TarotScene",
+    "scenes.garden.GardenScene",
+    "scenes.tarot_acep.TarotAcepScene",
+    "scenes.tarot_rechas.TarotRechasScene",
+    "scenes.ending.EndingScene",
+    "scenes.title.TitleScene",
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Busca fugas de memoria entre escenas")
+    parser.add_argument("--loops", type=int, default=10, help="vueltas completas al título")
+    parser.add_argument("--frames", type=int, default=30, help="cuadros por escena")
+    parser.add_argument("--report", action="store_true", help="imprimir la memoria en cada cambio de escena")
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    memory.report = args.report
+
+    state = GameState()
+    audio = Audio()
+    manager = SceneManager(screen, state)
+    manager.push(make_scene("scenes.title.TitleScene", manager, state, audio))
+
+    dt = 1.0 / SIM_HZ
+    for _ in range(args.loops):
+        for name in LOOP:
+            for _ in range(args.frames):
+                manager.update(dt)
+                manager.draw()
+            manager.replace(make_scene(name, manager, state, audio))
+        print(f"Vuelta {len(memory.loops)}: {describe(memory.loops[-1])}")
+
+    first, last = memory.loops[0], memory.loops[-1]
+    print(f"Primera vuelta {mb(first['bytes'])}, última {mb(last['bytes'])}; "
+          f"{len(memory.warnings)} avisos")
+    pygame.quit()
+    return 1 if memory.warnings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())